@@ -6,6 +6,7 @@ from models.base_model import BaseModel
 from models import storage
 import re
 import json
+import sys
 
 class CustomCommandInterpreter(cmd.Cmd):
     """Class for the custom command interpreter."""
@@ -35,7 +36,9 @@ class CustomCommandInterpreter(cmd.Cmd):
             attr_or_dict = False
 
         attr_and_value = ""
-        if method == "update" and attr_or_dict:
+        if method == "update":
+            method = "update_instance"
+        if method == "update_instance" and attr_or_dict:
             match_dict = re.search('^({.*})$', attr_or_dict)
             if match_dict:
                 self.update_dict(class_name, uid, match_dict.group(1))
@@ -55,21 +58,33 @@ class CustomCommandInterpreter(cmd.Cmd):
         d = json.loads(s)
         if not class_name:
             print("** class name missing **")
-        elif class_name not in storage.classes():
+        elif class_name not in storage.get_valid_classes():
             print("** class doesn't exist **")
         elif uid is None:
             print("** instance id missing **")
         else:
             key = "{}.{}".format(class_name, uid)
-            if key not in storage.all():
+            relations = [attribute for attribute in d if attribute in
+                         storage.get_valid_relations().get(class_name, {})]
+            if key not in storage.get_all_objects():
                 print("** no instance found **")
+            elif relations:
+                print("** {} is a relation **".format(relations[0]))
             else:
-                attributes = storage.attributes()[class_name]
+                attributes = storage.get_valid_attributes()[class_name]
                 for attribute, value in d.items():
                     if attribute in attributes:
                         value = attributes[attribute](value)
-                    setattr(storage.all()[key], attribute, value)
-                storage.all()[key].save()
+                    try:
+                        setattr(storage.get_all_objects()[key], attribute,
+                                value)
+                    except ValueError as error:
+                        print("** {} **".format(error))
+                        return
+                try:
+                    storage.get_all_objects()[key].save()
+                except ValueError as error:
+                    print("** {} **".format(error))
 
     def do_EOF(self, line):
         """Handles End Of File character."""
@@ -88,11 +103,15 @@ class CustomCommandInterpreter(cmd.Cmd):
         """Creates an instance."""
         if line == "" or line is None:
             print("** class name missing **")
-        elif line not in storage.classes():
+        elif line not in storage.get_valid_classes():
             print("** class doesn't exist **")
         else:
-            new_instance = storage.classes()[line]()
-            new_instance.save()
+            new_instance = storage.get_valid_classes()[line]()
+            try:
+                new_instance.save()
+            except ValueError as error:
+                print("** {} **".format(error))
+                return
             print(new_instance.id)
 
     def do_show_instance(self, line):
@@ -101,47 +120,51 @@ class CustomCommandInterpreter(cmd.Cmd):
             print("** class name missing **")
         else:
             words = line.split(' ')
-            if words[0] not in storage.classes():
+            if words[0] not in storage.get_valid_classes():
                 print("** class doesn't exist **")
             elif len(words) < 2:
                 print("** instance id missing **")
             else:
                 key = "{}.{}".format(words[0], words[1])
-                if key not in storage.all():
+                if key not in storage.get_all_objects():
                     print("** no instance found **")
                 else:
-                    print(storage.all()[key])
+                    print(storage.get_all_objects()[key])
 
     def do_destroy_instance(self, line):
-        """Deletes an instance based on the class name and id."""
+        """Deletes an instance, and its dependents, by class name and id."""
         if line == "" or line is None:
             print("** class name missing **")
         else:
             words = line.split(' ')
-            if words[0] not in storage.classes():
+            if words[0] not in storage.get_valid_classes():
                 print("** class doesn't exist **")
             elif len(words) < 2:
                 print("** instance id missing **")
             else:
                 key = "{}.{}".format(words[0], words[1])
-                if key not in storage.all():
+                if key not in storage.get_all_objects():
                     print("** no instance found **")
                 else:
-                    del storage.all()[key]
-                    storage.save()
+                    try:
+                        storage.destroy_object(
+                            storage.get_all_objects()[key])
+                    except ValueError as error:
+                        print("** {} **".format(error))
 
     def do_list_all_instances(self, line):
         """Prints all string representations of all instances."""
         if line != "":
             words = line.split(' ')
-            if words[0] not in storage.classes():
+            if words[0] not in storage.get_valid_classes():
                 print("** class doesn't exist **")
             else:
-                instance_list = [str(obj) for key, obj in storage.all().items()
-                                 if type(obj).__name__ == words[0]]
+                instance_list = [str(obj) for obj in
+                                 storage.get_objects_by_class(words[0])]
                 print(instance_list)
         else:
-            all_instances_list = [str(obj) for key, obj in storage.all().items()]
+            all_instances_list = [str(obj) for key, obj in
+                                  storage.get_all_objects().items()]
             print(all_instances_list)
 
     def do_count_instances(self, line):
@@ -149,13 +172,79 @@ class CustomCommandInterpreter(cmd.Cmd):
         words = line.split(' ')
         if not words[0]:
             print("** class name missing **")
-        elif words[0] not in storage.classes():
+        elif words[0] not in storage.get_valid_classes():
+            print("** class doesn't exist **")
+        else:
+            print(storage.count_objects(words[0]))
+
+    def _geo_args(self, line, names):
+        """Returns the class name and numbers of a geo command, or None"""
+        words = line.split()
+        if not words:
+            print("** class name missing **")
+        elif words[0] not in storage.get_valid_classes():
+            print("** class doesn't exist **")
+        elif len(words) < len(names) + 1:
+            print("** {} missing **".format(names[len(words) - 1]))
+        else:
+            try:
+                return words[0], [float(word) for word in
+                                  words[1:len(names) + 1]]
+            except ValueError:
+                print("** coordinates must be numbers **")
+        return None
+
+    def do_near_instances(self, line):
+        """Prints the instances within a radius (km) of a point.
+        Usage: near_instances <class> <latitude> <longitude> <radius>"""
+        args = self._geo_args(line, ("latitude", "longitude", "radius"))
+        if args:
+            print([str(obj) for obj in storage.get_objects_near(
+                args[0], *args[1])])
+
+    def do_nearest_instances(self, line):
+        """Prints the instances nearest to a point.
+        Usage: nearest_instances <class> <latitude> <longitude> <count>"""
+        args = self._geo_args(line, ("latitude", "longitude", "count"))
+        if args:
+            latitude, longitude, count = args[1]
+            print([str(obj) for obj in storage.get_nearest_objects(
+                args[0], latitude, longitude, int(count))])
+
+    def do_box_instances(self, line):
+        """Prints the instances inside a bounding box.
+        Usage: box_instances <class> <south> <west> <north> <east>"""
+        args = self._geo_args(line, ("south", "west", "north", "east"))
+        if args:
+            print([str(obj) for obj in storage.get_objects_in_box(
+                args[0], *args[1])])
+
+    def do_search_instances(self, line):
+        """Prints the instances matching words, best match first.
+        Usage: search_instances <class> <words...>"""
+        words = line.split(maxsplit=1)
+        if not words:
+            print("** class name missing **")
+        elif words[0] not in storage.get_valid_classes():
             print("** class doesn't exist **")
+        elif len(words) < 2:
+            print("** words missing **")
         else:
-            matches = [
-                k for k in storage.all() if k.startswith(
-                    words[0] + '.')]
-            print(len(matches))
+            print([str(obj) for obj in storage.search_objects(words[0],
+                                                              words[1])])
+
+    def do_sync(self, line):
+        """Writes the pending changes to disk."""
+        storage.flush()
+
+    def do_convert(self, line):
+        """Rewrites the stored objects in a format: json or binary."""
+        if line == "" or line is None:
+            print("** format missing **")
+        elif line.strip() not in ("json", "binary"):
+            print("** format doesn't exist **")
+        else:
+            storage.convert(line.strip())
 
     def do_update_instance(self, line):
         """Updates an instance by adding or updating attribute."""
@@ -171,16 +260,19 @@ class CustomCommandInterpreter(cmd.Cmd):
         value = match.group(4)
         if not match:
             print("** class name missing **")
-        elif class_name not in storage.classes():
+        elif class_name not in storage.get_valid_classes():
             print("** class doesn't exist **")
         elif uid is None:
             print("** instance id missing **")
         else:
             key = "{}.{}".format(class_name, uid)
-            if key not in storage.all():
+            if key not in storage.get_all_objects():
                 print("** no instance found **")
             elif not attribute:
                 print("** attribute name missing **")
+            elif attribute in storage.get_valid_relations().get(class_name,
+                                                                {}):
+                print("** {} is a relation **".format(attribute))
             elif not value:
                 print("** value missing **")
             else:
@@ -192,10 +284,30 @@ class CustomCommandInterpreter(cmd.Cmd):
                         cast = int
                 else:
                     value = value.replace('"', '')
-                attributes = storage.attributes()[class_name]
+                attributes = storage.get_valid_attributes()[class_name]
                 if attribute in attributes:
                     value = attributes[attribute](value)
                 elif cast:
                     try:
-                        value =
+                        value = cast(value)
+                    except ValueError:
+                        pass  # fine, stay a string then
+                try:
+                    setattr(storage.get_all_objects()[key], attribute, value)
+                except ValueError as error:
+                    print("** {} **".format(error))
+                    return
+                try:
+                    storage.get_all_objects()[key].save()
+                except ValueError as error:
+                    print("** {} **".format(error))
+
 
+if __name__ == '__main__':
+    if "--batch" in sys.argv[1:]:
+        # the whole session is saved once, when it ends
+        with storage.batch():
+            CustomCommandInterpreter().cmdloop()
+    else:
+        CustomCommandInterpreter().cmdloop()
+    storage.close()
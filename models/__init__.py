@@ -1,4 +1,21 @@
 #!/usr/bin/python3
 """Initializes the package"""
-from models.engine.file_storage import FileStorage
-storage = FileStorage()
+from os import getenv
+from models.engine.file_storage import CustomFileStorage
+if getenv("CUSTOM_TYPE_STORAGE") == "db":
+    from models.engine.db_storage import CustomDBStorage
+    storage = CustomDBStorage()
+else:
+    storage = CustomFileStorage(
+        journaled=getenv("CUSTOM_STORAGE_JOURNALED") == "1",
+        lazy=getenv("CUSTOM_STORAGE_LAZY") == "1",
+        shards=int(getenv("CUSTOM_STORAGE_SHARDS", "0")),
+        commit_window=int(getenv("CUSTOM_STORAGE_COMMIT_WINDOW", "0")),
+        flush_interval=int(getenv("CUSTOM_STORAGE_FLUSH_INTERVAL", "0")),
+        flush_threshold=int(getenv("CUSTOM_STORAGE_FLUSH_THRESHOLD", "0")),
+        checkpoint_interval=int(
+            getenv("CUSTOM_STORAGE_CHECKPOINT_INTERVAL", "0")),
+        checkpoint_size=int(getenv("CUSTOM_STORAGE_CHECKPOINT_SIZE", "0")),
+        checkpoint_rate=int(getenv("CUSTOM_STORAGE_CHECKPOINT_RATE", "0")),
+        file_format=getenv("CUSTOM_STORAGE_FORMAT", "json"))
+storage.reload_data()
@@ -6,7 +6,7 @@ from datetime import datetime
 from models import storage
 
 
-class CustomBaseModel:
+class BaseModel:
 
     """Class from which all other classes will inherit"""
 
@@ -15,42 +15,69 @@ class CustomBaseModel:
 
         Args:
             - *args: List of arguments
-            - **kwargs: Dictionary of key-value arguments
+            - **kwargs: Dictionary of key-value arguments, where
+              created_at and updated_at are ISO strings or datetimes
         """
 
         if kwargs is not None and kwargs != {}:
             for key in kwargs:
-                if key == "created_at":
-                    self.__dict__["created_at"] = datetime.strptime(
-                        kwargs["created_at"], "%Y-%m-%dT%H:%M:%S.%f")
-                elif key == "updated_at":
-                    self.__dict__["updated_at"] = datetime.strptime(
-                        kwargs["updated_at"], "%Y-%m-%dT%H:%M:%S.%f")
-                else:
+                if key in ("created_at", "updated_at") and \
+                        type(kwargs[key]) is str:
+                    self.__dict__[key] = datetime.strptime(
+                        kwargs[key], "%Y-%m-%dT%H:%M:%S.%f")
+                elif key != "__class__":
                     self.__dict__[key] = kwargs[key]
         else:
-            self.unique_id = str(uuid.uuid4())
-            self.creation_time = datetime.now()
-            self.update_time = datetime.now()
+            self.id = str(uuid.uuid4())
+            self.created_at = datetime.now()
+            self.updated_at = datetime.now()
             storage.add_new_object(self)
 
+    def __setattr__(self, name, value):
+        """Sets an attribute and marks the instance as changed
+
+        The previous value is restored if the storage refuses the new one.
+        """
+
+        had_value = name in self.__dict__
+        previous = self.__dict__.get(name)
+        storage.will_change(self)
+        super().__setattr__(name, value)
+        try:
+            storage.mark_dirty(self)
+        except ValueError:
+            if had_value:
+                self.__dict__[name] = previous
+            else:
+                del self.__dict__[name]
+            raise
+
     def __str__(self):
         """Returns official string representation"""
 
         return "[{}] ({}) {}".\
-            format(type(self).__name__, self.unique_id, self.__dict__)
+            format(type(self).__name__, self.id, self.__dict__)
+
+    @classmethod
+    def bulk_create(cls, rows):
+        """Creates and saves an instance for each dictionary of rows
+
+        Returns the list of instances.
+        """
+
+        return storage.bulk_create(cls, rows)
 
-    def save_data(self):
-        """Updates the public instance attribute update_time"""
+    def save(self):
+        """Updates the public instance attribute updated_at"""
 
-        self.update_time = datetime.now()
+        self.updated_at = datetime.now()
         storage.save_data()
 
-    def to_dict_representation(self):
+    def to_dict(self):
         """Returns a dictionary containing all keys/values of __dict__"""
 
         my_dict = self.__dict__.copy()
         my_dict["__class__"] = type(self).__name__
-        my_dict["creation_time"] = my_dict["creation_time"].isoformat()
-        my_dict["update_time"] = my_dict["update_time"].isoformat()
+        my_dict["created_at"] = my_dict["created_at"].isoformat()
+        my_dict["updated_at"] = my_dict["updated_at"].isoformat()
         return my_dict
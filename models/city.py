@@ -1,6 +1,7 @@
 #!/usr/bin/python3
 """This module creates a User class"""
 
+from models import storage
 from models.base_model import BaseModel
 
 
@@ -9,3 +10,13 @@ class City(BaseModel):
 
     state_id = ""
     name = ""
+
+    @property
+    def state(self):
+        """Returns the state of the city, or None"""
+        return storage.get_related(self, "state")
+
+    @property
+    def places(self):
+        """Returns the lazy view of the places of the city"""
+        return storage.get_related(self, "places")
@@ -0,0 +1,204 @@
+#!/usr/bin/python3
+"""Module for CustomBinarySerializer class."""
+import datetime
+import marshal
+import struct
+
+
+class CustomBinarySerializer:
+
+    """Class for encoding storage files in a compact binary format
+
+    The file starts with a magic line, whose sixth byte is the marshal
+    format version of the writer, followed by one frame per object.
+    A frame starts with a header of little-endian integers: the size of
+    the rest of the frame (4 bytes), the version of the object (4 bytes)
+    and the size of its key (2 bytes). Then come the key, in UTF-8, and
+    the marshal encoding of the tuple (class name, values, extras).
+    values holds the attributes listed for the class in
+    get_valid_attributes, in that order, with Ellipsis for the missing
+    ones, so attribute names are not repeated for every object; extras
+    is a dictionary of the other attributes, or None. Attributes typed
+    datetime are stored as integer microseconds since 1970-01-01 and
+    decoded as datetimes. The header lets
+    scan list the keys and versions without decoding the frames. Files
+    of the previous format, whose frames held the key in the marshal
+    tuple, are still read.
+    marshal is not safe against crafted data: only read files written
+    by the storage itself. Its format may change between Python
+    versions; marshal reads the versions before its own, so a file
+    written with a newer one is refused instead of misread.
+    """
+
+    extension = ".bin"
+    __magic = b"CFSB3" + bytes((marshal.version,)) + b"\n"
+    __header = struct.Struct("<IIH")
+    __length = struct.Struct("<I")
+    __epoch = datetime.datetime(1970, 1, 1)
+    __microsecond = datetime.timedelta(microseconds=1)
+
+    def __init__(self, attributes):
+        """Initializes the serializer
+
+        Args:
+            - attributes: dictionary of class name to the dictionary of
+              its attributes and types, as in get_valid_attributes
+        """
+        base = list(attributes.get("BaseModel", {}))
+        self.__fields = {}
+        for class_name, class_attributes in attributes.items():
+            self.__fields[class_name] = tuple(
+                base + [name for name in class_attributes if name not in base])
+        self.__field_sets = {
+            class_name: frozenset(names) | {"__class__", "__version__"}
+            for class_name, names in self.__fields.items()}
+        self.__dates = {
+            class_name: tuple(
+                position for position, name in enumerate(names)
+                if attributes.get(class_name, {}).get(
+                    name, attributes.get("BaseModel", {}).get(name))
+                is datetime.datetime)
+            for class_name, names in self.__fields.items()}
+
+    def encode(self, key, record):
+        """Returns the bytes of the frame holding record"""
+        class_name = record.get("__class__")
+        names = self.__fields.get(class_name, ())
+        known = self.__field_sets.get(class_name, {"__class__", "__version__"})
+        values = tuple(record.get(name, ...) for name in names)
+        dates = self.__dates.get(class_name)
+        if dates:
+            values = list(values)
+            for position in dates:
+                values[position] = self.__microseconds(values[position])
+            values = tuple(values)
+        extras = {name: value for name, value in record.items()
+                  if name not in known} or None
+        data = marshal.dumps((class_name, values, extras))
+        key = key.encode("utf-8")
+        return self.__header.pack(
+            self.__header.size - self.__length.size + len(key) + len(data),
+            record.get("__version__", 0), len(key)) + key + data
+
+    def decode(self, fragment):
+        """Returns the record of a frame, without its version"""
+        start = self.__header.size + self.__header.unpack_from(fragment)[2]
+        return self.__record(*marshal.loads(memoryview(fragment)[start:]))
+
+    def dump(self, fragments):
+        """Returns the bytes of the file made of encoded frames"""
+        return self.__magic + b"".join(fragments)
+
+    def read(self, file, chunk_size=1 << 20, fragments=None):
+        """Yields the (key, record) pairs stored in a binary file object
+
+        If fragments is a dictionary, the bytes of each frame are stored
+        in it under its key.
+        """
+        previous = self.__read_magic(file) < 3
+        length = self.__length
+        header = self.__header
+        buffer = b""
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                if buffer:
+                    raise ValueError("Truncated binary storage file")
+                return
+            buffer += chunk
+            pos = 0
+            while pos + length.size <= len(buffer):
+                end = pos + length.size + length.unpack_from(buffer, pos)[0]
+                if end > len(buffer):
+                    break
+                frame = buffer[pos:end]
+                if previous:
+                    key, class_name, values, extras = marshal.loads(
+                        memoryview(frame)[length.size:])
+                    record = self.__record(class_name, values, extras)
+                else:
+                    _, version, key_size = header.unpack_from(frame)
+                    start = header.size + key_size
+                    key = frame[header.size:start].decode("utf-8")
+                    record = self.__record(*marshal.loads(
+                        memoryview(frame)[start:]))
+                    if version:
+                        record["__version__"] = version
+                    if fragments is not None:
+                        fragments[key] = frame
+                yield key, record
+                pos = end
+            buffer = buffer[pos:]
+
+    def scan(self, file):
+        """Returns the list of (key, version, bytes) of the frames of a file
+
+        The frames are not decoded. Returns None for a file of the
+        previous format.
+        """
+        if self.__read_magic(file) < 3:
+            return None
+        data = file.read()
+        header = self.__header
+        unpack = header.unpack_from
+        members = []
+        pos = 0
+        while pos < len(data):
+            if pos + header.size > len(data):
+                raise ValueError("Truncated binary storage file")
+            size, version, key_size = unpack(data, pos)
+            end = pos + self.__length.size + size
+            if end > len(data):
+                raise ValueError("Truncated binary storage file")
+            start = pos + header.size
+            members.append((data[start:start + key_size].decode("utf-8"),
+                            version, data[pos:end]))
+            pos = end
+        return members
+
+    def __read_magic(self, file):
+        """Reads the magic line of file and returns its format number"""
+        magic = file.read(len(self.__magic))
+        if len(magic) != len(self.__magic) or magic[:4] != b"CFSB" or \
+                magic[4:5] not in (b"2", b"3") or magic[6:] != b"\n":
+            raise ValueError("Not a binary storage file")
+        if magic[5] > marshal.version:
+            raise ValueError("Binary storage file written with marshal "
+                             "version {}, this Python reads up to {}: "
+                             "convert it to json with the newer Python"
+                             .format(magic[5], marshal.version))
+        return magic[4] - ord("0")
+
+    def __microseconds(self, value):
+        """Returns the microseconds since the epoch of a datetime value
+
+        value is a naive datetime or its ISO string; other values are
+        returned unchanged.
+        """
+        date = value
+        if type(value) is str:
+            try:
+                date = datetime.datetime.fromisoformat(value)
+            except ValueError:
+                return value
+        if type(date) is datetime.datetime and date.tzinfo is None:
+            return (date - self.__epoch) // self.__microsecond
+        return value
+
+    def __record(self, class_name, values, extras):
+        """Returns the record made of the decoded parts of a frame"""
+        fields = self.__fields.get(class_name, ())
+        record = dict(zip(fields, values))
+        for position in self.__dates.get(class_name, ()):
+            value = values[position]
+            if type(value) is int:
+                record[fields[position]] = self.__epoch + datetime.timedelta(
+                    microseconds=value)
+        if ... in values:
+            for name, value in zip(fields, values):
+                if value is ...:
+                    del record[name]
+        if extras:
+            record.update(extras)
+        record["__class__"] = class_name
+        return record
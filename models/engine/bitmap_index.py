@@ -0,0 +1,167 @@
+#!/usr/bin/python3
+"""Module for CustomBitmapIndex class."""
+from models.engine.hash_index import _hashable
+
+
+class CustomBitmapIndex:
+
+    """Class for looking up the keys of objects by the members of a list
+
+    Every key gets a dense position and every member (an amenity id of
+    Place.amenity_ids, say) a dense slot holding the bitmap, a Python
+    int, of the positions of the keys listing it. Filtering on several
+    members is then a few bitwise operations over whole bitmaps. The
+    positions of discarded keys are reused.
+    """
+
+    def __init__(self):
+        """Initializes an empty index"""
+        self.__slots = {}
+        self.__bitmaps = []
+        self.__positions = {}
+        self.__keys = []
+        self.__free = []
+        self.__members = {}
+        self.__used = 0
+
+    def accepts(self, value):
+        """Returns True if value is a list (or tuple or set) of members"""
+        return isinstance(value, (list, tuple, set, frozenset))
+
+    def check(self, key, value):
+        """Does nothing: a bitmap index accepts any value"""
+        pass
+
+    def slot(self, member):
+        """Returns the slot of member, giving it the next one if new"""
+        slot = self.__slots.get(member)
+        if slot is None:
+            slot = self.__slots[member] = len(self.__bitmaps)
+            self.__bitmaps.append(0)
+        return slot
+
+    def add(self, key, value):
+        """Records that the object of key lists the members of value"""
+        if not self.accepts(value):
+            self.discard(key)
+            return
+        members = _members(value)
+        if self.__members.get(key) == members:
+            return
+        self.discard(key)
+        if self.__free:
+            position = self.__free.pop()
+            self.__keys[position] = key
+        else:
+            position = len(self.__keys)
+            self.__keys.append(key)
+        bit = 1 << position
+        for member in members:
+            self.__bitmaps[self.slot(member)] |= bit
+        self.__positions[key] = position
+        self.__members[key] = members
+        self.__used |= bit
+
+    def update(self, pairs):
+        """Adds the (key, value) pairs, setting the bits of new keys at once"""
+        positions = {}
+        slots = self.__slots
+        # a key given twice keeps its last value, as with add
+        for key, value in dict(pairs).items():
+            if key in self.__positions or not self.accepts(value):
+                self.add(key, value)
+                continue
+            members = _members(value)
+            if self.__free:
+                position = self.__free.pop()
+                self.__keys[position] = key
+            else:
+                position = len(self.__keys)
+                self.__keys.append(key)
+            self.__positions[key] = position
+            self.__members[key] = members
+            positions.setdefault(None, []).append(position)
+            for member in members:
+                slot = slots.get(member)
+                if slot is None:
+                    slot = self.slot(member)
+                positions.setdefault(slot, []).append(position)
+        size = len(self.__keys) // 8 + 1
+        for slot, slot_positions in positions.items():
+            bits = bytearray(size)
+            for position in slot_positions:
+                bits[position >> 3] |= 1 << (position & 7)
+            bits = int.from_bytes(bits, "little")
+            if slot is None:
+                self.__used |= bits
+            else:
+                self.__bitmaps[slot] |= bits
+
+    def discard(self, key):
+        """Forgets the members of key, if any"""
+        position = self.__positions.pop(key, None)
+        if position is None:
+            return
+        mask = ~(1 << position)
+        for member in self.__members.pop(key):
+            self.__bitmaps[self.__slots[member]] &= mask
+        self.__used &= mask
+        self.__keys[position] = None
+        self.__free.append(position)
+
+    def bitmap(self, member):
+        """Returns the bitmap of the keys listing member"""
+        slot = self.__slots.get(member) if _hashable(member) else None
+        return 0 if slot is None else self.__bitmaps[slot]
+
+    def match(self, all_of=(), any_of=(), none_of=()):
+        """Returns the bitmap of the keys meeting every given rule
+
+        Args:
+            - all_of: members that must all be listed
+            - any_of: members of which one at least must be listed,
+              ignored if empty
+            - none_of: members that must not be listed
+        """
+        bits = self.__used
+        for member in all_of:
+            bits &= self.bitmap(member)
+        if any_of:
+            either = 0
+            for member in any_of:
+                either |= self.bitmap(member)
+            bits &= either
+        for member in none_of:
+            bits &= ~self.bitmap(member)
+        return bits
+
+    def keys(self, bits):
+        """Returns the list of keys of a bitmap, in position order"""
+        keys = self.__keys
+        digits = bin(bits)[:1:-1]
+        found = []
+        position = digits.find("1")
+        while position != -1:
+            found.append(keys[position])
+            position = digits.find("1", position + 1)
+        return found
+
+    def lookup(self, value):
+        """Returns the list of keys listing exactly the members of value"""
+        if not self.accepts(value):
+            return []
+        members = _members(value)
+        return [key for key in self.keys(self.match(all_of=members))
+                if self.__members[key] == members]
+
+    def __len__(self):
+        """Returns the number of indexed keys"""
+        return len(self.__positions)
+
+
+def _members(value):
+    """Returns the frozenset of the hashable members of value"""
+    try:
+        return frozenset(value)
+    except TypeError:
+        return frozenset(member for member in value if _hashable(member))
@@ -0,0 +1,193 @@
+#!/usr/bin/python3
+"""Module for CustomColumnSegment class."""
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+
+class CustomColumnSegment:
+
+    """Class for reading one column of a class from its own file
+
+    A segment file holds a JSON header, then the presence mask (one byte
+    per row, left out when every row has a value), then the values packed
+    at a fixed width: the narrowest integer type holding every int, 8
+    bytes per float, and for str columns the codes into a dictionary of
+    the distinct values, stored last as offsets into a UTF-8 blob. The
+    file is memory mapped and the sections are read as typed memoryviews,
+    so scanning a column only touches its own bytes.
+    """
+
+    magic = b"CSEG1\n"
+    alignment = 8
+    widths = {"int": "bhiq", "code": "BHIQ"}
+
+    def __init__(self, path):
+        """Maps the segment at path
+
+        Raises ValueError if the file is not a segment.
+        """
+        self.__view = None
+        self.__file = open(path, "rb")
+        try:
+            self.__map = mmap.mmap(self.__file.fileno(), 0,
+                                   access=mmap.ACCESS_READ)
+        except ValueError:
+            self.__file.close()
+            raise ValueError("{} is not a column segment".format(path))
+        if self.__map[:len(self.magic)] != self.magic:
+            self.close()
+            raise ValueError("{} is not a column segment".format(path))
+        start = len(self.magic) + 4
+        size, = struct.unpack("<I", self.__map[len(self.magic):start])
+        self.__header = json.loads(self.__map[start:start + size])
+        self.__view = memoryview(self.__map)
+
+    @classmethod
+    def write(cls, path, kind, column, present=None, dictionary=None):
+        """Writes a segment to path, atomically
+
+        Args:
+            - path: file to write
+            - kind: "int", "float" or "str"
+            - column: the values, or the codes into dictionary for str
+            - present: bytes with a 1 for each row holding a value, None
+              if all do
+            - dictionary: list of the str values, by code
+        """
+        if present is not None and all(present):
+            present = None
+        if kind == "float":
+            typecode = "d"
+        else:
+            largest = max(column, default=0)
+            smallest = min(column, default=0)
+            widths = cls.widths["code" if kind == "str" else "int"]
+            typecode = next(
+                code for code in widths
+                if cls.__fits(code, smallest, largest))
+        sections = []
+        if present is not None:
+            sections.append(("present", bytes(present)))
+        sections.append(("values", array(typecode, column).tobytes()))
+        if kind == "str":
+            blobs = [value.encode("utf-8") for value in dictionary]
+            offsets = array("Q", [0])
+            for blob in blobs:
+                offsets.append(offsets[-1] + len(blob))
+            sections.append(("offsets", offsets.tobytes()))
+            sections.append(("dictionary", b"".join(blobs)))
+        header = {"kind": kind, "typecode": typecode, "rows": len(column),
+                  "byteorder": sys.byteorder,
+                  "dictionary": len(dictionary or ())}
+        # sections start after the header, each at an aligned offset
+        prefix = len(cls.magic) + 4
+        layout = {}
+        while True:
+            text = json.dumps(dict(header, sections=layout)).encode("utf-8")
+            offset = cls.__align(prefix + len(text))
+            planned = {}
+            for name, data in sections:
+                planned[name] = [offset, len(data)]
+                offset = cls.__align(offset + len(data))
+            if planned == layout:
+                break
+            layout = planned
+        temp = path + ".tmp"
+        with open(temp, "wb") as file:
+            file.write(cls.magic + struct.pack("<I", len(text)) + text)
+            for name, data in sections:
+                file.write(b"\0" * (layout[name][0] - file.tell()))
+                file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp, path)
+
+    @staticmethod
+    def __fits(typecode, smallest, largest):
+        """Returns True if an array of typecode holds smallest and largest"""
+        bits = 8 * array(typecode).itemsize
+        if typecode.isupper():
+            return smallest >= 0 and largest < 2 ** bits
+        return -2 ** (bits - 1) <= smallest and largest < 2 ** (bits - 1)
+
+    @classmethod
+    def __align(cls, offset):
+        """Returns offset rounded up to the alignment"""
+        return -(-offset // cls.alignment) * cls.alignment
+
+    @property
+    def kind(self):
+        """Returns the kind of the column: int, float or str"""
+        return self.__header["kind"]
+
+    def __section(self, name):
+        """Returns the memoryview of a section, None if absent"""
+        if name not in self.__header["sections"]:
+            return None
+        start, size = self.__header["sections"][name]
+        return self.__view[start:start + size]
+
+    def __typed(self, name, typecode):
+        """Returns a section as a sequence of typecode items"""
+        section = self.__section(name)
+        if self.__header["byteorder"] == sys.byteorder:
+            return section.cast(typecode)
+        items = array(typecode, section.tobytes())
+        items.byteswap()
+        return items
+
+    def present(self):
+        """Returns the presence mask, None if every row has a value"""
+        return self.__section("present")
+
+    def codes(self):
+        """Returns the packed values, or codes for a str column"""
+        return self.__typed("values", self.__header["typecode"])
+
+    def dictionary(self):
+        """Returns the list of the values of a str column, by code"""
+        if self.kind != "str":
+            return None
+        offsets = self.__typed("offsets", "Q")
+        blob = self.__section("dictionary")
+        return [str(blob[offsets[code]:offsets[code + 1]], "utf-8")
+                for code in range(self.__header["dictionary"])]
+
+    def __iter__(self):
+        """Yields the value of each row, None where it is missing"""
+        values = self.codes()
+        if self.kind == "str":
+            dictionary = self.dictionary()
+            values = (dictionary[code] for code in values)
+        present = self.present()
+        if present is None:
+            yield from values
+            return
+        for value, flag in zip(values, present):
+            yield value if flag else None
+
+    def __len__(self):
+        """Returns the number of rows"""
+        return self.__header["rows"]
+
+    def close(self):
+        """Unmaps the segment
+
+        The sequences returned by the segment must be released first.
+        """
+        if self.__view is not None:
+            self.__view.release()
+        self.__map.close()
+        self.__file.close()
+
+    def __enter__(self):
+        """Returns the segment"""
+        return self
+
+    def __exit__(self, *args):
+        """Unmaps the segment"""
+        self.close()
@@ -0,0 +1,288 @@
+#!/usr/bin/python3
+"""Module for CustomColumns class."""
+import operator
+from array import array
+from collections import Counter
+from itertools import compress
+from numbers import Real
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class CustomColumns:
+
+    """Class for a columnar copy of the attributes of the objects of a class
+
+    Each attribute is a column with one row per object: int and float
+    attributes are packed in array.array, str attributes are dictionary
+    encoded as an array of codes into the list of their distinct values.
+    A bytearray per column marks the rows holding a value of the right
+    type. Deleting a row moves the last row in its place, so columns
+    stay dense. aggregate and group_by work on whole columns, with NumPy
+    when it is installed.
+    """
+
+    typecodes = {int: "q", float: "d", str: "l"}
+    functions = ("count", "sum", "mean", "min", "max")
+
+    def __init__(self, attributes):
+        """Initializes empty columns
+
+        Args:
+            - attributes: dictionary of attribute name to type; types
+              other than int, float and str are left out
+        """
+        self.__types = {name: kind for name, kind in attributes.items()
+                        if kind in self.typecodes}
+        self.__columns = {name: array(self.typecodes[kind])
+                          for name, kind in self.__types.items()}
+        self.__present = {name: bytearray() for name in self.__types}
+        self.__dictionaries = {name: ([], {}) for name, kind in
+                               self.__types.items() if kind is str}
+        self.__keys = []
+        self.__rows = {}
+
+    def add(self, key, obj):
+        """Sets the row of key to the attributes of obj"""
+        row = self.__rows.get(key)
+        if row is None:
+            row = self.__rows[key] = len(self.__keys)
+            self.__keys.append(key)
+            for name in self.__types:
+                self.__columns[name].append(0)
+                self.__present[name].append(0)
+        for name, kind in self.__types.items():
+            value = getattr(obj, name, None)
+            if kind is str:
+                if type(value) is str:
+                    values, codes = self.__dictionaries[name]
+                    code = codes.get(value)
+                    if code is None:
+                        code = codes[value] = len(values)
+                        values.append(value)
+                    value = code
+                else:
+                    value = None
+            elif not self.__valid(kind, value):
+                value = None
+            self.__columns[name][row] = 0 if value is None else value
+            self.__present[name][row] = value is not None
+
+    def update(self, pairs):
+        """Adds the (key, obj) pairs, a column at a time if empty"""
+        if self.__keys:
+            for key, obj in pairs:
+                self.add(key, obj)
+            return
+        objects = dict(pairs)
+        self.__keys = list(objects)
+        self.__rows = dict(zip(self.__keys, range(len(self.__keys))))
+        for name, kind in self.__types.items():
+            values = [getattr(obj, name, None) for obj in objects.values()]
+            if kind is str:
+                dictionary, codes = self.__dictionaries[name]
+                values = [codes.setdefault(value, len(codes))
+                          if type(value) is str else None
+                          for value in values]
+                dictionary.extend(list(codes)[len(dictionary):])
+            try:
+                self.__columns[name] = array(self.typecodes[kind], values)
+                self.__present[name] = bytearray(b"\x01") * len(values)
+            except (TypeError, OverflowError):
+                # some values are missing or of another type
+                self.__columns[name] = array(self.typecodes[kind])
+                self.__present[name] = bytearray()
+                for row, value in enumerate(values):
+                    valid = value is not None and self.__valid(kind, value)
+                    self.__columns[name].append(value if valid else 0)
+                    self.__present[name].append(valid)
+
+    @staticmethod
+    def __valid(kind, value):
+        """Returns True if value fits a column of kind (codes for str)"""
+        if kind is float:
+            return isinstance(value, Real)
+        return isinstance(value, int) and -2 ** 63 <= value < 2 ** 63
+
+    def discard(self, key):
+        """Removes the row of key, if any, moving the last row in its place"""
+        row = self.__rows.pop(key, None)
+        if row is None:
+            return
+        last = self.__keys.pop()
+        for name in self.__types:
+            column, present = self.__columns[name], self.__present[name]
+            if row < len(self.__keys):
+                column[row] = column[-1]
+                present[row] = present[-1]
+            column.pop()
+            present.pop()
+        if row < len(self.__keys):
+            self.__keys[row] = last
+            self.__rows[last] = row
+
+    def names(self):
+        """Returns the list of the names of the columns"""
+        return list(self.__types)
+
+    def keys(self):
+        """Returns the list of keys, in row order"""
+        return list(self.__keys)
+
+    def column(self, name):
+        """Returns the array of name: values, or codes for a str column"""
+        return self.__columns[name]
+
+    def present(self, name):
+        """Returns the bytearray marking the rows holding a value of name"""
+        return self.__present[name]
+
+    def dictionary(self, name):
+        """Returns the list of the values of a str column, by code"""
+        return self.__dictionaries[name][0]
+
+    def values(self, name):
+        """Returns the list of the values of name, None where missing"""
+        column, present = self.__columns[name], self.__present[name]
+        if name in self.__dictionaries:
+            values = self.__dictionaries[name][0]
+            return [values[code] if flag else None
+                    for code, flag in zip(column, present)]
+        return [value if flag else None
+                for value, flag in zip(column, present)]
+
+    def to_numpy(self, name):
+        """Returns a copy of the column name as a NumPy array
+
+        Raises ImportError if NumPy is not installed.
+        """
+        if numpy is None:
+            raise ImportError("NumPy is not installed")
+        return self.__view(name).copy()
+
+    def __view(self, name):
+        """Returns the NumPy view of the column name
+
+        The view must not outlive the call: an array whose buffer is
+        exported can't grow or shrink.
+        """
+        return numpy.frombuffer(self.__columns[name],
+                                dtype=self.__columns[name].typecode)
+
+    def aggregate(self, name, function="sum"):
+        """Returns function (see functions) over the values of name
+
+        The values of a str column are its codes; count works on any
+        column. min, max and mean of no value are None.
+        """
+        return self.group_by(None, name, function).get(None, None if
+                                                       function != "count"
+                                                       else 0)
+
+    def group_by(self, by, name=None, function="count"):
+        """Returns the dictionary of each value of by to function of name
+
+        Args:
+            - by: column to group the rows by, None for a single group
+              whose key is None
+            - name: column to aggregate, None to count the rows
+            - function: one of functions
+        """
+        if function not in self.functions:
+            raise ValueError("unknown function {}".format(repr(function)))
+        if name is None and function != "count":
+            raise ValueError("{} needs a column".format(function))
+        masks = [self.__present[column] for column in (by, name)
+                 if column is not None]
+        if numpy is not None:
+            groups = self.__group_by_numpy(by, name, function, masks)
+        else:
+            groups = self.__group_by_python(by, name, function, masks)
+        if by in self.__dictionaries:
+            values = self.__dictionaries[by][0]
+            groups = {values[code]: result for code, result in groups.items()}
+        return groups
+
+    def __group_by_python(self, by, name, function, masks):
+        """Returns the groups of group_by, looping over the rows"""
+        mask = None
+        if masks:
+            mask = masks[0] if len(masks) == 1 else \
+                bytes(map(operator.and_, *masks))
+        select = (lambda column: compress(column, mask)) if mask \
+            else iter
+        if by is None:
+            if name is None or function == "count":
+                return {None: mask.count(1) if mask else len(self.__keys)}
+            values = list(select(self.__columns[name]))
+            if not values:
+                return {}
+            if function in ("sum", "mean"):
+                total = sum(values)
+                return {None: total / len(values) if function == "mean"
+                        else total}
+            return {None: min(values) if function == "min"
+                    else max(values)}
+        groups = select(self.__columns[by])
+        if name is None or function == "count":
+            return dict(Counter(groups))
+        results = {}
+        counts = Counter()
+        if function in ("sum", "mean"):
+            get = results.get
+            for group, value in zip(groups, select(self.__columns[name])):
+                results[group] = get(group, 0) + value
+            if function == "mean":
+                counts.update(select(self.__columns[by]))
+                results = {group: total / counts[group]
+                           for group, total in results.items()}
+            return results
+        better = min if function == "min" else max
+        for group, value in zip(groups, select(self.__columns[name])):
+            results[group] = better(results[group], value) \
+                if group in results else value
+        return results
+
+    def __group_by_numpy(self, by, name, function, masks):
+        """Returns the groups of group_by, with NumPy"""
+        size = len(self.__keys)
+        selected = numpy.ones(size, dtype=bool)
+        for mask in masks:
+            selected &= numpy.frombuffer(mask, dtype=numpy.uint8).astype(bool)
+        if by is None:
+            groups, inverse = [None], numpy.zeros(int(selected.sum()),
+                                                  dtype=numpy.intp)
+        else:
+            groups, inverse = numpy.unique(self.__view(by)[selected],
+                                           return_inverse=True)
+            groups = groups.tolist()
+        if not len(inverse):
+            return {}
+        counts = numpy.bincount(inverse, minlength=len(groups))
+        if name is None or function == "count":
+            results = counts
+        else:
+            column = self.__view(name)[selected]
+            if function in ("sum", "mean"):
+                results = numpy.bincount(inverse, weights=column,
+                                         minlength=len(groups))
+                if function == "mean":
+                    results = results / counts
+                elif column.dtype.kind == "i":
+                    results = results.astype(numpy.int64)
+            else:
+                order = numpy.lexsort((column, inverse))
+                starts = numpy.searchsorted(inverse[order],
+                                            numpy.arange(len(groups)))
+                if function == "max":
+                    starts = numpy.append(starts[1:], len(order)) - 1
+                results = column[order][starts]
+        return {group: result for group, result in
+                zip(groups, results.tolist()) if group is not None or
+                by is None}
+
+    def __len__(self):
+        """Returns the number of rows"""
+        return len(self.__keys)
@@ -0,0 +1,45 @@
+#!/usr/bin/python3
+"""Module for CustomCompactor class."""
+import threading
+import traceback
+
+
+class CustomCompactor:
+
+    """Class for checkpointing the storage journal from a background thread
+
+    Every interval seconds the thread checks the size of the journal and
+    folds it into a new snapshot once it holds at least min_size bytes.
+    A failed checkpoint is reported and tried again at the next check.
+    """
+
+    def __init__(self, storage, interval, min_size):
+        """Initializes and starts the compactor
+
+        Args:
+            - storage: storage whose checkpoint and get_journal_metrics
+              methods are called
+            - interval: seconds between two checks
+            - min_size: journal size in bytes triggering a checkpoint
+        """
+        self.__storage = storage
+        self.__interval = interval
+        self.__min_size = max(min_size, 1)
+        self.__stopped = threading.Event()
+        self.__thread = threading.Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        """Stops the thread"""
+        self.__stopped.set()
+        self.__thread.join()
+
+    def __run(self):
+        """Checkpoints the journal until stopped"""
+        while not self.__stopped.wait(self.__interval):
+            try:
+                metrics = self.__storage.get_journal_metrics()
+                if metrics["journal_size"] >= self.__min_size:
+                    self.__storage.checkpoint()
+            except Exception:
+                traceback.print_exc()
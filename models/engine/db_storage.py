@@ -0,0 +1,547 @@
+#!/usr/bin/python3
+"""Module for CustomDBStorage class."""
+import contextlib
+import datetime
+import json
+import sqlite3
+import threading
+from models.engine.columns import CustomColumns
+from models.engine.file_storage import CustomFileStorage, _has_members, \
+    _copy_state, _validate_objects
+from models.engine.grid_index import CustomGridIndex
+from models.engine.lazy_objects import CustomLazyObjects
+from models.engine.query import CustomQuery
+from models.engine.related_cache import CustomRelatedCache
+from models.engine.relation import CustomRelation
+from models.engine.text_index import CustomTextIndex
+
+
+class CustomDBStorage:
+
+    """Class for storing and retrieving data in a SQLite database
+
+    Every class gets a table with one column per valid attribute, used
+    for lookups, and a data column holding the JSON record the instance
+    is rebuilt from. reload_data only reads the keys; each row is fetched
+    the first time its key is accessed, and save_data only writes the
+    rows of the objects changed since the last save. The attributes of
+    get_valid_indexes get an index on their column, a UNIQUE one for
+    the "unique" kind, which leaves empty values out as
+    CustomFileStorage does.
+    """
+    __db_path = "custom_file.db"
+    __objects = {}
+    __class_keys = {}
+    __indexed = None
+    __dirty = set()
+    __deleted = set()
+    __batches = []
+    __deferred = False
+    __pool = threading.local()
+    __related = CustomRelatedCache()
+    __missing = object()
+    __sql_types = {str: "TEXT", int: "INTEGER", float: "REAL",
+                   list: "TEXT", datetime.datetime: "TEXT"}
+    __sql_operators = {"eq": "=", "lt": "<", "le": "<=", "gt": ">", "ge": ">="}
+
+    def __init__(self):
+        """Initializes the storage and its statements"""
+        self.__columns = {}
+        self.__statements = {}
+        attributes = self.get_valid_attributes()
+        indexes = self.get_valid_indexes()
+        for class_name in attributes:
+            columns = dict(attributes["BaseModel"])
+            columns.update(attributes.get(class_name, {}))
+            del columns["id"]
+            self.__columns[class_name] = columns
+            names = ", ".join(columns)
+            marks = ", ".join("?" * (len(columns) + 2))
+            kinds = indexes.get(class_name, {})
+            unique = [name for name, kind in kinds.items()
+                      if kind == "unique" and name in columns]
+            self.__statements[class_name] = {
+                "create": 'CREATE TABLE IF NOT EXISTS "{}" '
+                          '(id TEXT PRIMARY KEY, {}, data TEXT NOT NULL)'.
+                          format(class_name, ", ".join(
+                              "{} {}".format(name, self.__sql_types[kind])
+                              for name, kind in columns.items())),
+                "upsert": 'INSERT INTO "{}" (id, {}, data) VALUES ({}) '
+                          'ON CONFLICT(id) DO UPDATE SET {}'.format(
+                              class_name, names, marks, ", ".join(
+                                  "{0} = excluded.{0}".format(name)
+                                  for name in list(columns) + ["data"])),
+                "unique": unique,
+                "clear": 'UPDATE "{}" SET {} WHERE id = ?'.format(
+                    class_name, ", ".join("{} = NULL".format(name)
+                                          for name in unique))
+                         if unique else None,
+                "delete": 'DELETE FROM "{}" WHERE id = ?'.format(class_name),
+                "select": 'SELECT data FROM "{}" WHERE id = ?'.
+                          format(class_name),
+                "keys": 'SELECT id FROM "{}"'.format(class_name),
+                "indexes": ['CREATE INDEX IF NOT EXISTS "{0}_{1}" '
+                            'ON "{0}" ({2})'.format(
+                                class_name, "_".join(names), ", ".join(names))
+                            for names in (
+                                name if isinstance(name, tuple) else (name,)
+                                for name, kind in kinds.items()
+                                if kind not in ("text", "bitmap", "unique"))] +
+                           ['CREATE UNIQUE INDEX IF NOT EXISTS '
+                            '"{0}_{1}_unique" ON "{0}" ({1}) '
+                            "WHERE {1} IS NOT NULL AND {1} != ''".format(
+                                class_name, name) for name in unique],
+                "find": {name: {op: 'SELECT id FROM "{}" WHERE {} {} ?'.
+                                format(class_name, name, operator)
+                                for op, operator in self.__sql_operators.items()
+                                if op == "eq" or kind in (int, float)}
+                         for name, kind in columns.items()}}
+
+    def __connection(self):
+        """Returns the connection of the current thread, opening it once"""
+        conn = getattr(CustomDBStorage.__pool, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(CustomDBStorage.__db_path,
+                                   cached_statements=256)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                for statements in self.__statements.values():
+                    conn.execute(statements["create"])
+                    for statement in statements["indexes"]:
+                        conn.execute(statement)
+            CustomDBStorage.__pool.conn = conn
+        return conn
+
+    def close(self):
+        """Closes the connection of the current thread"""
+        conn = getattr(CustomDBStorage.__pool, "conn", None)
+        if conn is not None:
+            conn.close()
+            CustomDBStorage.__pool.conn = None
+
+    def get_all_objects(self):
+        """Returns the dictionary __objects"""
+        return CustomDBStorage.__objects
+
+    def get_objects_by_class(self, class_name):
+        """Yields the objects of class_name, in insertion order"""
+        objects = CustomDBStorage.__objects
+        for key in list(self.__class_index().get(class_name, ())):
+            obj = objects.get(key)
+            if obj is not None:
+                yield obj
+
+    def count_objects(self, class_name):
+        """Returns the number of objects of class_name"""
+        return len(self.__class_index().get(class_name, ()))
+
+    def get_objects_by_attribute(self, class_name, name, value):
+        """Yields the objects of class_name whose attribute name is value
+
+        Attributes with a column are looked up in the database, the
+        objects changed since the last save being compared in memory.
+        """
+        keys = self.find_keys(class_name, name, "eq", value)
+        if keys is None:
+            for obj in self.get_objects_by_class(class_name):
+                if getattr(obj, name, None) == value:
+                    yield obj
+            return
+        objects = CustomDBStorage.__objects
+        for key in keys:
+            obj = objects.get(key)
+            if obj is not None:
+                yield obj
+
+    def get_objects_by_members(self, class_name, name, all_of=(),
+                               any_of=(), none_of=()):
+        """Yields the objects of class_name whose list name meets the rules"""
+        for obj in self.get_objects_by_class(class_name):
+            if _has_members(getattr(obj, name, None), all_of, any_of,
+                            none_of):
+                yield obj
+
+    def find_keys(self, class_name, name, op, value):
+        """Returns the keys of the objects of class_name meeting a condition
+
+        The condition is one of CustomQuery: attribute name compared
+        with value by op. Returns None if no column can answer it.
+        """
+        find = self.__statements.get(class_name, {}).get("find", {})
+        values = value if op == "in" else (value,)
+        if op == "in":
+            op = "eq"
+        if op not in find.get(name, {}) or not values or not all(
+                isinstance(item, (str, int, float)) for item in values) or \
+                op != "eq" and not isinstance(value, (int, float)):
+            return None
+        objects = CustomDBStorage.__objects
+        dirty = CustomDBStorage.__dirty
+        conn = self.__connection()
+        keys = {}
+        for item in values:
+            for row in conn.execute(find[name][op], (item,)):
+                key = "{}.{}".format(class_name, row[0])
+                if key in objects and key not in dirty:
+                    keys[key] = None
+        compare = CustomQuery.operators[op]
+        prefix = class_name + "."
+        for key in list(dirty):
+            if key.startswith(prefix) and key in objects:
+                attribute = getattr(objects[key], name, None)
+                try:
+                    if any(compare(attribute, item) for item in values):
+                        keys[key] = None
+                except TypeError:
+                    pass
+        return list(keys)
+
+    def get_objects_near(self, class_name, latitude, longitude, radius):
+        """Yields the objects of class_name within radius km, nearest first"""
+        return self.__geo_search(class_name, "within_radius",
+                                 latitude, longitude, radius)
+
+    def get_objects_in_box(self, class_name, south, west, north, east):
+        """Yields the objects of class_name inside a bounding box"""
+        return self.__geo_search(class_name, "within_box",
+                                 south, west, north, east)
+
+    def get_nearest_objects(self, class_name, latitude, longitude, count):
+        """Yields the count objects of class_name nearest to a point"""
+        return self.__geo_search(class_name, "nearest",
+                                 latitude, longitude, count)
+
+    def __geo_search(self, class_name, search, *args):
+        """Yields the objects found by a search over the class positions"""
+        objects = {"{}.{}".format(class_name, obj.id): obj
+                   for obj in self.get_objects_by_class(class_name)}
+        index = CustomGridIndex()
+        index.update((key, (getattr(obj, "latitude", None),
+                            getattr(obj, "longitude", None)))
+                     for key, obj in objects.items())
+        for key in getattr(index, search)(*args):
+            yield objects[key]
+
+    def search_objects(self, class_name, text, limit=None):
+        """Yields the objects of class_name matching the words of text"""
+        objects = {"{}.{}".format(class_name, obj.id): obj
+                   for obj in self.get_objects_by_class(class_name)}
+        scores = {}
+        for name, kind in self.get_valid_indexes().get(class_name,
+                                                       {}).items():
+            if kind == "text":
+                index = CustomTextIndex()
+                index.update((key, getattr(obj, name, None))
+                             for key, obj in objects.items())
+                for key, score in index.scores(text).items():
+                    scores[key] = scores.get(key, 0.0) + score
+        for key in CustomTextIndex.rank(scores, limit):
+            yield objects[key]
+
+    def find_sorted_keys(self, class_name, name, reverse=False):
+        """Returns None: queries sort the objects themselves"""
+        return None
+
+    def query(self, cls):
+        """Returns a CustomQuery over the objects of cls"""
+        return CustomQuery(self, cls)
+
+    def __class_index(self):
+        """Returns the dictionary of class name to the keys of its objects
+
+        The index is rebuilt whenever __objects was replaced.
+        """
+        objects = CustomDBStorage.__objects
+        if CustomDBStorage.__indexed is not objects:
+            CustomDBStorage.__related.invalidate()
+            class_keys = {}
+            for key in objects:
+                class_keys.setdefault(key.split(".", 1)[0], {})[key] = None
+            CustomDBStorage.__class_keys = class_keys
+            CustomDBStorage.__indexed = objects
+        return CustomDBStorage.__class_keys
+
+    def get_columns(self, class_name):
+        """Returns the CustomColumns of the objects of class_name
+
+        The columns are built from the objects at each call.
+        """
+        columns = CustomColumns(self.get_valid_attributes().get(class_name,
+                                                                {}))
+        columns.update(("{}.{}".format(class_name, obj.id), obj)
+                       for obj in self.get_objects_by_class(class_name))
+        return columns
+
+    def export_columns(self, class_name):
+        """Writes the columns of class_name to segment files"""
+        return CustomFileStorage.export_columns(self, class_name)
+
+    def open_column(self, class_name, name):
+        """Returns the CustomColumnSegment of a column of class_name"""
+        return CustomFileStorage.open_column(self, class_name, name)
+
+    def add_new_object(self, obj):
+        """Sets in __objects the obj with key <obj class name>.id
+
+        Raises ValueError if obj breaks a unique index.
+        """
+        key = "{}.{}".format(type(obj).__name__, obj.id)
+        self.__check_unique({key: obj})
+        self.__keep_state(key)
+        self.__class_index().setdefault(type(obj).__name__, {})[key] = None
+        CustomDBStorage.__related.invalidate()
+        CustomDBStorage.__objects[key] = obj
+        CustomDBStorage.__dirty.add(key)
+        CustomDBStorage.__deleted.discard(key)
+
+    def mark_dirty(self, obj):
+        """Records that obj changed since the last save
+
+        Raises ValueError if the new values of obj break a unique index.
+        """
+        key = "{}.{}".format(type(obj).__name__, obj.id)
+        if key in CustomDBStorage.__objects:
+            self.__check_unique({key: obj})
+            self.__keep_state(key)
+            CustomDBStorage.__related.invalidate()
+            CustomDBStorage.__dirty.add(key)
+
+    def delete_object(self, obj):
+        """Deletes obj from __objects"""
+        key = "{}.{}".format(type(obj).__name__, obj.id)
+        self.__keep_state(key)
+        self.__class_index().get(type(obj).__name__, {}).pop(key, None)
+        CustomDBStorage.__related.invalidate()
+        if CustomDBStorage.__objects.pop(key, None) is not None:
+            CustomDBStorage.__dirty.discard(key)
+            CustomDBStorage.__deleted.add(key)
+
+    def destroy_object(self, obj):
+        """Deletes obj and its dependents, then saves once
+
+        Returns the list of deleted objects.
+        """
+        doomed = CustomRelation.cascade(self, obj)
+        for item in reversed(doomed):
+            self.delete_object(item)
+        self.save_data()
+        return doomed
+
+    def bulk_add(self, objects):
+        """Adds many objects at once, then saves once
+
+        The objects are checked with get_valid_attributes and the unique
+        indexes (including against each other) before any is added.
+        Raises ValueError if an object is refused. Returns the list of
+        objects.
+        """
+        objects = _validate_objects(self, objects)
+        self.__check_unique({"{}.{}".format(type(obj).__name__, obj.id): obj
+                             for obj in objects})
+        class_index = self.__class_index()
+        CustomDBStorage.__related.invalidate()
+        for obj in objects:
+            key = "{}.{}".format(type(obj).__name__, obj.id)
+            self.__keep_state(key)
+            class_index.setdefault(type(obj).__name__, {})[key] = None
+            CustomDBStorage.__objects[key] = obj
+            CustomDBStorage.__dirty.add(key)
+            CustomDBStorage.__deleted.discard(key)
+        self.save_data()
+        return objects
+
+    def bulk_create(self, cls, rows):
+        """Creates an object of cls for each dictionary of rows, at once"""
+        return CustomFileStorage.bulk_create(self, cls, rows)
+
+    def __check_unique(self, keyed):
+        """Raises ValueError if an object of keyed breaks a unique index
+
+        keyed maps keys to their objects, whose values are checked
+        against the other stored objects and against each other.
+        """
+        seen = {}
+        for key, obj in keyed.items():
+            class_name = type(obj).__name__
+            for name in self.__statements.get(class_name, {}).get(
+                    "unique", ()):
+                value = getattr(obj, name, None)
+                if value in ("", None):
+                    continue
+                found = self.find_keys(class_name, name, "eq", value) or ()
+                if seen.setdefault((class_name, name, value), key) != key or \
+                        any(other not in keyed for other in found):
+                    raise ValueError("{} is already used".format(repr(value)))
+
+    def will_change(self, obj):
+        """Records the state of obj before a change, for batch rollbacks"""
+        if not CustomDBStorage.__batches:
+            return
+        obj_id = getattr(obj, "id", None)
+        if obj_id is not None:
+            self.__keep_state("{}.{}".format(type(obj).__name__, obj_id))
+
+    def __keep_state(self, key):
+        """Records the stored state of key in the innermost batch, once"""
+        if not CustomDBStorage.__batches:
+            return
+        states = CustomDBStorage.__batches[-1][0]
+        if key in states:
+            return
+        obj = CustomDBStorage.__objects.get(key)
+        states[key] = None if obj is None else (obj, _copy_state(obj))
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Returns a context manager grouping changes into one transaction
+
+        As CustomFileStorage.batch: save_data waits for the end of the
+        outermost block, and a block that raises rolls back its changes
+        in memory without writing anything.
+        """
+        batches = CustomDBStorage.__batches
+        batches.append(({}, set(CustomDBStorage.__dirty),
+                        set(CustomDBStorage.__deleted)))
+        try:
+            yield self
+        except BaseException:
+            self.__roll_back(*batches.pop())
+            if not batches:
+                CustomDBStorage.__deferred = False
+            raise
+        states = batches.pop()[0]
+        if batches:
+            outer = batches[-1][0]
+            for key, state in states.items():
+                outer.setdefault(key, state)
+        elif CustomDBStorage.__deferred:
+            CustomDBStorage.__deferred = False
+            self.save_data()
+
+    def __roll_back(self, states, dirty, deleted):
+        """Gives the keys of states back their recorded state"""
+        objects = CustomDBStorage.__objects
+        class_index = self.__class_index()
+        for key, state in states.items():
+            class_name = key.split(".", 1)[0]
+            objects.pop(key, None)
+            class_index.get(class_name, {}).pop(key, None)
+            if state is None:
+                continue
+            obj, values = state
+            obj.__dict__.clear()
+            obj.__dict__.update(values)
+            class_index.setdefault(class_name, {})[key] = None
+            objects[key] = obj
+        CustomDBStorage.__related.invalidate()
+        CustomDBStorage.__dirty.clear()
+        CustomDBStorage.__dirty.update(dirty)
+        CustomDBStorage.__deleted.clear()
+        CustomDBStorage.__deleted.update(deleted)
+
+    def save_data(self):
+        """Writes the changed objects to the database in one transaction
+
+        Inside a batch the write waits for the end of the outermost block.
+        Raises ValueError, writing nothing, if the database refuses a
+        row for a unique index.
+        """
+        if CustomDBStorage.__batches:
+            CustomDBStorage.__deferred = True
+            return
+        objects = CustomDBStorage.__objects
+        conn = self.__connection()
+        try:
+            with conn:
+                for key in CustomDBStorage.__deleted:
+                    class_name, obj_id = key.split(".", 1)
+                    conn.execute(self.__statements[class_name]["delete"],
+                                 (obj_id,))
+                # unique values may move between the changed objects
+                for key in CustomDBStorage.__dirty:
+                    class_name, obj_id = key.split(".", 1)
+                    clear = self.__statements[class_name]["clear"]
+                    if clear is not None and key in objects:
+                        conn.execute(clear, (obj_id,))
+                for key in CustomDBStorage.__dirty:
+                    if key in objects:
+                        class_name = key.split(".", 1)[0]
+                        conn.execute(self.__statements[class_name]["upsert"],
+                                     self.__row(objects[key]))
+        except sqlite3.IntegrityError as error:
+            raise ValueError(str(error)) from error
+        CustomDBStorage.__dirty.clear()
+        CustomDBStorage.__deleted.clear()
+
+    def flush(self):
+        """Writes the changes deferred by save_data, which never defers"""
+        pass
+
+    def __row(self, obj):
+        """Returns the column values of obj"""
+        row = [obj.id]
+        for name in self.__columns[type(obj).__name__]:
+            value = getattr(obj, name, None)
+            if isinstance(value, list):
+                value = json.dumps(value)
+            elif isinstance(value, datetime.datetime):
+                value = value.isoformat()
+            row.append(value)
+        row.append(json.dumps(obj.to_dict()))
+        return row
+
+    def __load(self, key, value):
+        """Returns the instance stored in the row of key"""
+        class_name, obj_id = key.split(".", 1)
+        row = self.__connection().execute(
+            self.__statements[class_name]["select"], (obj_id,)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        record = json.loads(row[0])
+        return self.get_valid_classes()[record["__class__"]](**record)
+
+    def reload_data(self):
+        """Reloads the keys of the stored objects"""
+        conn = self.__connection()
+        keys = {}
+        for class_name, statements in self.__statements.items():
+            stub = {"__class__": class_name}
+            for row in conn.execute(statements["keys"]):
+                keys["{}.{}".format(class_name, row[0])] = stub
+        CustomDBStorage.__objects = CustomLazyObjects(keys, self.__load)
+        self.__class_index()
+        CustomDBStorage.__dirty.clear()
+        CustomDBStorage.__deleted.clear()
+
+    def get_valid_classes(self):
+        """Returns a dictionary of valid classes and their references"""
+        return CustomFileStorage.get_valid_classes(self)
+
+    def get_valid_attributes(self):
+        """Returns the valid attributes and their types for classname"""
+        return CustomFileStorage.get_valid_attributes(self)
+
+    def get_valid_indexes(self):
+        """Returns the indexed attributes of each class and their kind"""
+        return CustomFileStorage.get_valid_indexes(self)
+
+    def get_valid_relations(self):
+        """Returns the relations of each class"""
+        return CustomFileStorage.get_valid_relations(self)
+
+    def get_delete_policies(self):
+        """Returns what deleting an object does to its "many" relations"""
+        return CustomFileStorage.get_delete_policies(self)
+
+    def get_related(self, obj, name):
+        """Returns the objects related to obj by relation name"""
+        related = CustomDBStorage.__related.get(
+            obj, name, CustomDBStorage.__missing)
+        if related is CustomDBStorage.__missing:
+            related = CustomRelation.resolve(self, obj, name)
+        return related
+
+    def prefetch_related(self, objects, *names):
+        """Resolves the relations names of all objects in one pass each"""
+        CustomDBStorage.__related.prefetch(self, objects, names)
@@ -0,0 +1,80 @@
+#!/usr/bin/python3
+"""Module for CustomFileLock class."""
+import os
+import threading
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class CustomFileLock:
+
+    """Class for a lock shared by every process using the same storage
+
+    The lock is an fcntl advisory lock on a file of its own, taken with
+    a fresh file descriptor so that the threads of one process wait for
+    each other as other processes do. A thread already holding the lock
+    may take it again; the outermost hold decides shared or exclusive.
+    The file also holds a generation number that writers advance, so
+    a process can tell whether the storage changed since it last looked.
+    Where fcntl is missing (Windows), the lock does nothing.
+    """
+
+    def __init__(self, path):
+        """Initializes the lock
+
+        Args:
+            - path: lock file, created when first needed
+        """
+        self.__path = path
+        self.__held = threading.local()
+
+    def acquire(self, shared=False):
+        """Waits for the lock, shared by readers or exclusive for writers"""
+        depth = getattr(self.__held, "depth", 0)
+        if not depth:
+            fd = os.open(self.__path, os.O_RDWR | os.O_CREAT |
+                         getattr(os, "O_BINARY", 0), 0o644)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_SH if shared
+                                else fcntl.LOCK_EX)
+            except BaseException:
+                os.close(fd)
+                raise
+            self.__held.fd = fd
+        self.__held.depth = depth + 1
+
+    def release(self):
+        """Releases the lock once the outermost hold ends"""
+        self.__held.depth -= 1
+        if not self.__held.depth:
+            # closing the descriptor drops the lock
+            os.close(self.__held.fd)
+            self.__held.fd = None
+
+    def generation(self):
+        """Returns the generation number, the lock being held"""
+        os.lseek(self.__held.fd, 0, os.SEEK_SET)
+        data = os.read(self.__held.fd, 8)
+        return int.from_bytes(data, "little") if len(data) == 8 else 0
+
+    def advance(self):
+        """Adds one to the generation number and returns it
+
+        The lock must be held exclusively.
+        """
+        generation = self.generation() + 1
+        os.lseek(self.__held.fd, 0, os.SEEK_SET)
+        os.write(self.__held.fd, generation.to_bytes(8, "little"))
+        return generation
+
+    def __enter__(self):
+        """Takes the lock exclusively"""
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        """Releases the lock"""
+        self.release()
@@ -1,30 +1,1251 @@
 #!/usr/bin/python3
 """Module for FileStorage class."""
 import datetime
+import gc
 import json
+import marshal
 import os
+import atexit
+import contextlib
+import shutil
+import threading
+import time
+import traceback
+import zlib
+from models.engine.binary_serializer import CustomBinarySerializer
+from models.engine.bitmap_index import CustomBitmapIndex
+from models.engine.column_segment import CustomColumnSegment
+from models.engine.columns import CustomColumns
+from models.engine.compactor import CustomCompactor
+from models.engine.file_lock import CustomFileLock
+from models.engine.grid_index import CustomGridIndex
+from models.engine.hash_index import CustomHashIndex
+from models.engine.journal import CustomJournal
+from models.engine.json_serializer import CustomJSONSerializer
+from models.engine.lazy_objects import CustomLazyObjects
+from models.engine.query import CustomQuery
+from models.engine.related_cache import CustomRelatedCache
+from models.engine.relation import CustomRelation
+from models.engine.sorted_index import CustomSortedIndex
+from models.engine.text_index import CustomTextIndex
+from models.engine.write_behind import CustomWriteBehind
 
 
 class CustomFileStorage:
 
     """Class for storing and retrieving data"""
     __file_path = "custom_file.json"
+    __binary_path = "custom_file.bin"
+    __journal_path = "custom_file.json.journal"
+    __shard_dir = "custom_file.shards"
+    __text_index_path = "custom_file.text_index"
+    # the saved text indexes are only read back by the same marshal format
+    __text_index_magic = b"CFTI" + bytes((marshal.version,))
+    __columns_dir = "custom_file.columns"
+    __file_lock = CustomFileLock("custom_file.lock")
+    __checkpoint_file_lock = CustomFileLock("custom_file.checkpoint.lock")
     __objects = {}
+    __versions = {}
+    __generation = None
+    __class_keys = {}
+    __attribute_indexes = {}
+    __indexed = None
+    __preloaded = (None, None, set())
+    __saved_text_indexes = None
+    __related = CustomRelatedCache()
+    __column_sets = {}
+    __column_changes = {}
+    __missing = object()
+    __dirty = set()
+    __deleted = set()
+    __batches = []
+    __deferred = False
+    __fragments = {}
+    __shard_members = {}
+    __relayout = False
+    __lock = threading.RLock()
+    __checkpoint_lock = threading.Lock()
+    __metrics = {"journal_records": 0,
+                 "last_checkpoint": None,
+                 "checkpoints": 0,
+                 "replay_time": 0.0}
+
+    def __init__(self, *, journaled=False, lazy=False, shards=0,
+                 commit_window=0, flush_interval=0, flush_threshold=0,
+                 checkpoint_interval=0, checkpoint_size=0,
+                 checkpoint_rate=0, file_format="json"):
+        """Initializes the storage
+
+        Args:
+            - journaled: if True, save_data appends the changed objects
+              to the journal instead of rewriting the whole file
+            - lazy: if True, reload_data keeps the raw records and
+              builds each instance the first time it is accessed
+            - shards: if not 0, objects are saved in one file per class
+              split in that many hash partitions, and save_data only
+              rewrites the files holding changed objects
+            - commit_window: if not 0, number of milliseconds during
+              which calls to save_data are grouped into a single write
+            - flush_interval: if not 0, save_data only records that
+              changes are pending and a background thread writes them
+              every flush_interval milliseconds
+            - flush_threshold: if not 0, save_data only records that
+              changes are pending and a background thread writes them
+              once that many objects changed
+            - checkpoint_interval: if not 0, a background thread checks
+              the journal every checkpoint_interval milliseconds and
+              folds it into a new snapshot
+            - checkpoint_size: journal size in bytes from which the
+              background thread writes a checkpoint
+            - checkpoint_rate: if not 0, the maximum number of bytes per
+              second written by a checkpoint
+            - file_format: "json" or "binary", the format of the files
+              written by save_data; files in either format are read
+        """
+        self.__journaled = journaled
+        self.__lazy = lazy
+        self.__shards = shards
+        self.__commit_window = commit_window
+        self.__commit_timer = None
+        self.__pending = False
+        self.__write_behind = None
+        if flush_interval or flush_threshold:
+            self.__write_behind = CustomWriteBehind(
+                self.flush, flush_interval / 1000, flush_threshold)
+        if commit_window or self.__write_behind:
+            atexit.register(self.flush)
+        self.__journal = CustomJournal(CustomFileStorage.__journal_path)
+        self.__serializers = {
+            "json": CustomJSONSerializer(),
+            "binary": CustomBinarySerializer(self.get_valid_attributes())}
+        self.__serializer = self.__serializers[file_format]
+        self.__checkpoint_rate = checkpoint_rate
+        self.__compactor = None
+        if checkpoint_interval:
+            self.__compactor = CustomCompactor(
+                self, checkpoint_interval / 1000, checkpoint_size)
 
     def get_all_objects(self):
         """Returns the dictionary __objects"""
         return CustomFileStorage.__objects
 
+    def get_objects_by_class(self, class_name):
+        """Yields the objects of class_name, in insertion order"""
+        with CustomFileStorage.__lock:
+            self.__ensure_indexes()
+            keys = list(CustomFileStorage.__class_keys.get(class_name, ()))
+        objects = CustomFileStorage.__objects
+        for key in keys:
+            obj = objects.get(key)
+            if obj is not None:
+                yield obj
+
+    def count_objects(self, class_name):
+        """Returns the number of objects of class_name"""
+        with CustomFileStorage.__lock:
+            self.__ensure_indexes()
+            return len(CustomFileStorage.__class_keys.get(class_name, ()))
+
+    def get_objects_by_attribute(self, class_name, name, value):
+        """Yields the objects of class_name whose attribute name is value
+
+        Attributes declared in get_valid_indexes are looked up in their
+        index, the others are compared on every object of the class.
+        """
+        keys = self.find_keys(class_name, name, "eq", value)
+        if keys is None:
+            for obj in self.get_objects_by_class(class_name):
+                if getattr(obj, name, CustomFileStorage.__missing) == value:
+                    yield obj
+            return
+        objects = CustomFileStorage.__objects
+        for key in keys:
+            obj = objects.get(key)
+            if obj is not None:
+                yield obj
+
+    def get_objects_by_members(self, class_name, name, all_of=(),
+                               any_of=(), none_of=()):
+        """Yields the objects of class_name whose list name meets the rules
+
+        Args:
+            - class_name: class of the objects
+            - name: list attribute, like Place.amenity_ids
+            - all_of: members that must all be listed
+            - any_of: members of which one at least must be listed,
+              ignored if empty
+            - none_of: members that must not be listed
+        """
+        with CustomFileStorage.__lock:
+            self.__ensure_indexes(class_name)
+            index = CustomFileStorage.__attribute_indexes.get(
+                class_name, {}).get(name)
+            if isinstance(index, CustomBitmapIndex):
+                keys = index.keys(index.match(all_of, any_of, none_of))
+            else:
+                keys = None
+        if keys is None:
+            for obj in self.get_objects_by_class(class_name):
+                if _has_members(getattr(obj, name, None),
+                                all_of, any_of, none_of):
+                    yield obj
+            return
+        objects = CustomFileStorage.__objects
+        for key in keys:
+            obj = objects.get(key)
+            if obj is not None:
+                yield obj
+
+    def find_keys(self, class_name, name, op, value):
+        """Returns the keys of the objects of class_name meeting a condition
+
+        The condition is one of CustomQuery: attribute name compared
+        with value by op. Returns None if no index can answer it.
+        """
+        with CustomFileStorage.__lock:
+            self.__ensure_indexes(class_name)
+            index = CustomFileStorage.__attribute_indexes.get(
+                class_name, {}).get(name)
+            if index is None or isinstance(index, CustomTextIndex):
+                return None
+            if op == "contains":
+                if not isinstance(index, CustomBitmapIndex):
+                    return None
+                return index.keys(index.match(all_of=(value,)))
+            if not all(index.accepts(item) for item in
+                       (value if op == "in" else (value,))):
+                # only a scan compares the values that are not indexed
+                return None
+            if op == "eq":
+                return index.lookup(value)
+            if op == "in":
+                keys = {}
+                for item in value:
+                    keys.update(dict.fromkeys(index.lookup(item)))
+                return list(keys)
+            if not isinstance(index, CustomSortedIndex):
+                return None
+            if op in ("lt", "le"):
+                return list(index.range(high=value, include_high=op == "le"))
+            return list(index.range(low=value, include_low=op == "ge"))
+
+    def get_objects_near(self, class_name, latitude, longitude, radius):
+        """Yields the objects of class_name within radius km, nearest first"""
+        return self.__geo_search(class_name, "within_radius",
+                                 latitude, longitude, radius)
+
+    def get_objects_in_box(self, class_name, south, west, north, east):
+        """Yields the objects of class_name inside a bounding box"""
+        return self.__geo_search(class_name, "within_box",
+                                 south, west, north, east)
+
+    def get_nearest_objects(self, class_name, latitude, longitude, count):
+        """Yields the count objects of class_name nearest to a point"""
+        return self.__geo_search(class_name, "nearest",
+                                 latitude, longitude, count)
+
+    def __geo_search(self, class_name, search, *args):
+        """Yields the objects found by a search of the geo index of class_name
+
+        Classes without one are indexed for this search only.
+        """
+        with CustomFileStorage.__lock:
+            self.__ensure_indexes(class_name)
+            index = next((index for index in
+                          CustomFileStorage.__attribute_indexes.get(
+                              class_name, {}).values()
+                          if isinstance(index, CustomGridIndex)), None)
+            if index is not None:
+                keys = getattr(index, search)(*args)
+        if index is None:
+            index = CustomGridIndex()
+            index.update(
+                ("{}.{}".format(class_name, obj.id),
+                 (getattr(obj, "latitude", None),
+                  getattr(obj, "longitude", None)))
+                for obj in self.get_objects_by_class(class_name))
+            keys = getattr(index, search)(*args)
+        objects = CustomFileStorage.__objects
+        for key in keys:
+            obj = objects.get(key)
+            if obj is not None:
+                yield obj
+
+    def search_objects(self, class_name, text, limit=None):
+        """Yields the objects of class_name matching the words of text
+
+        The text attributes of the class in get_valid_indexes are
+        searched, and the objects ranked by their BM25 score.
+        """
+        with CustomFileStorage.__lock:
+            self.__ensure_indexes(class_name)
+            scores = {}
+            for index in CustomFileStorage.__attribute_indexes.get(
+                    class_name, {}).values():
+                if isinstance(index, CustomTextIndex):
+                    for key, score in index.scores(text).items():
+                        scores[key] = scores.get(key, 0.0) + score
+        objects = CustomFileStorage.__objects
+        for key in CustomTextIndex.rank(scores, limit):
+            obj = objects.get(key)
+            if obj is not None:
+                yield obj
+
+    def find_sorted_keys(self, class_name, name, reverse=False):
+        """Yields the keys of class_name in the order of attribute name
+
+        Objects whose value is not a number are skipped. Returns None if
+        name has no sorted index.
+        """
+        with CustomFileStorage.__lock:
+            self.__ensure_indexes(class_name)
+            index = CustomFileStorage.__attribute_indexes.get(
+                class_name, {}).get(name)
+        if not isinstance(index, CustomSortedIndex):
+            return None
+        return index.range(reverse=reverse)
+
+    def query(self, cls):
+        """Returns a CustomQuery over the objects of cls"""
+        return CustomQuery(self, cls)
+
+    def __ensure_indexes(self, *class_names):
+        """Builds the indexes of class_names that are missing for __objects
+
+        __class_keys maps a class name to the keys of its objects and is
+        rebuilt whenever __objects was replaced. __attribute_indexes maps
+        a class name and an attribute to its index; the indexes of a class
+        are only built the first time they are needed.
+        """
+        objects = CustomFileStorage.__objects
+        if CustomFileStorage.__indexed is not objects:
+            CustomFileStorage.__related.invalidate()
+            CustomFileStorage.__column_sets = {}
+            CustomFileStorage.__column_changes = {}
+            class_keys = {}
+            for key in objects:
+                class_keys.setdefault(key.split(".", 1)[0], {})[key] = None
+            if CustomFileStorage.__preloaded[0] is not objects:
+                CustomFileStorage.__preloaded = (None, None, set())
+            CustomFileStorage.__class_keys = class_keys
+            CustomFileStorage.__attribute_indexes = {}
+            CustomFileStorage.__indexed = objects
+        for class_name in class_names:
+            if class_name not in CustomFileStorage.__attribute_indexes:
+                self.__build_indexes(class_name)
+
+    def __build_indexes(self, class_name):
+        """Builds the indexes of class_name from its objects
+
+        Text indexes saved with the snapshot read by reload_data are
+        loaded instead, and only the keys changed since are indexed again.
+        """
+        objects = CustomFileStorage.__objects
+        names = self.get_valid_indexes().get(class_name, {})
+        missing = CustomFileStorage.__missing
+        _, stamp, changed = CustomFileStorage.__preloaded
+        saved = {}
+        if stamp is not None and "text" in names.values():
+            if CustomFileStorage.__saved_text_indexes is None:
+                CustomFileStorage.__saved_text_indexes = \
+                    self.__load_text_indexes(stamp)
+            saved = CustomFileStorage.__saved_text_indexes
+        indexes = {}
+        preloaded = set()
+        for name, kind in names.items():
+            index = saved.pop((class_name, name), None)
+            if index is None:
+                index = self.__new_index(kind)
+            else:
+                preloaded.add(name)
+            indexes[name] = index
+        keys = CustomFileStorage.__class_keys.get(class_name, {})
+        # saved indexes only miss the changes since the snapshot
+        for key in changed:
+            if key.startswith(class_name + ".") and key not in keys:
+                for name in preloaded:
+                    indexes[name].discard(key)
+        fresh = [name for name in names if name not in preloaded]
+        pairs = {name: [] for name in names}
+        lazy = isinstance(objects, CustomLazyObjects)
+        cls = self.get_valid_classes().get(class_name)
+        for key in keys:
+            stale = names if key in changed else fresh
+            if not stale:
+                continue
+            record = objects.get_record(key) if lazy else None
+            if record is None:
+                obj = objects[key]
+                get = lambda name: getattr(obj, name, missing)
+            else:
+                get = lambda name: record.get(name,
+                                              getattr(cls, name, missing))
+            for name in stale:
+                value = self.__index_value(name, get)
+                if value is not missing:
+                    pairs[name].append((key, value))
+        for name, index_pairs in pairs.items():
+            indexes[name].update(index_pairs)
+        CustomFileStorage.__attribute_indexes[class_name] = indexes
+
+    def __new_index(self, kind):
+        """Returns an empty index of kind, as in get_valid_indexes"""
+        if kind == "sorted":
+            return CustomSortedIndex()
+        if kind == "geo":
+            return CustomGridIndex()
+        if kind == "text":
+            return CustomTextIndex()
+        if kind == "bitmap":
+            return CustomBitmapIndex()
+        return CustomHashIndex(unique=kind == "unique")
+
+    def __index_value(self, name, get):
+        """Returns the value indexed under name, reading attributes with get
+
+        A tuple of names indexes the tuple of their values.
+        """
+        if type(name) is not tuple:
+            return get(name)
+        values = tuple(get(item) for item in name)
+        if any(value is CustomFileStorage.__missing for value in values):
+            return CustomFileStorage.__missing
+        return values
+
+    def __reindex(self, key, obj):
+        """Updates the attribute indexes of key with the values of obj
+
+        Raises ValueError, before changing any index, if obj breaks
+        a unique index.
+        """
+        class_name = type(obj).__name__
+        built = class_name in CustomFileStorage.__attribute_indexes
+        indexes = self.__indexes_to_change(class_name, (key,))
+        if not indexes:
+            return
+        if not built:
+            # built with the new values of obj, which must be checked
+            for index in indexes.values():
+                index.discard(key)
+        missing = CustomFileStorage.__missing
+        get = lambda name: getattr(obj, name, missing)
+        values = {name: self.__index_value(name, get) for name in indexes}
+        for name, index in indexes.items():
+            if values[name] is not missing:
+                index.check(key, values[name])
+        for name, index in indexes.items():
+            if values[name] is missing:
+                index.discard(key)
+            else:
+                index.add(key, values[name])
+
+    def __indexes_to_change(self, class_name, keys):
+        """Returns the indexes of class_name to update for keys, or None
+
+        Indexes that were not built yet are left for their first use,
+        which indexes keys with the others, unless one of them is unique:
+        its values must be checked now.
+        """
+        indexes = CustomFileStorage.__attribute_indexes.get(class_name)
+        if indexes is not None:
+            return indexes
+        kinds = self.get_valid_indexes().get(class_name, {}).values()
+        if "unique" in kinds:
+            self.__ensure_indexes(class_name)
+            return CustomFileStorage.__attribute_indexes[class_name]
+        if kinds:
+            CustomFileStorage.__preloaded[2].update(keys)
+        return None
+
+    def __unindex(self, key):
+        """Removes key from the attribute indexes of its class"""
+        indexes = CustomFileStorage.__attribute_indexes.get(
+            key.split(".", 1)[0])
+        if indexes is None:
+            CustomFileStorage.__preloaded[2].add(key)
+            return
+        for index in indexes.values():
+            index.discard(key)
+
+    def __column_changed(self, key):
+        """Records that the columns of the class of key must be refreshed"""
+        changes = CustomFileStorage.__column_changes.get(key.split(".")[0])
+        if changes is not None:
+            changes.add(key)
+
+    def get_columns(self, class_name):
+        """Returns the CustomColumns of the objects of class_name
+
+        The columns hold the attributes of get_valid_attributes. They
+        are built on the first call; later calls only refresh the rows
+        of the objects added, changed or deleted since.
+        """
+        with CustomFileStorage.__lock:
+            self.__ensure_indexes()
+            objects = CustomFileStorage.__objects
+            columns = CustomFileStorage.__column_sets.get(class_name)
+            if columns is None:
+                columns = CustomColumns(
+                    self.get_valid_attributes().get(class_name, {}))
+                columns.update(
+                    (key, objects[key]) for key in
+                    CustomFileStorage.__class_keys.get(class_name, {}))
+                CustomFileStorage.__column_sets[class_name] = columns
+                CustomFileStorage.__column_changes[class_name] = set()
+                return columns
+            changes = CustomFileStorage.__column_changes[class_name]
+            for key in changes:
+                obj = objects.get(key)
+                if obj is None:
+                    columns.discard(key)
+                else:
+                    columns.add(key, obj)
+            changes.clear()
+            return columns
+
+    def export_columns(self, class_name):
+        """Writes the columns of class_name to segment files
+
+        Each column of get_columns goes to <name>.seg, and the keys of
+        the rows to _keys.seg, in the directory of the class under
+        custom_file.columns. Returns that directory.
+        """
+        kinds = {int: "int", float: "float", str: "str"}
+        attributes = self.get_valid_attributes().get(class_name, {})
+        directory = os.path.join(CustomFileStorage.__columns_dir, class_name)
+        os.makedirs(directory, exist_ok=True)
+        columns = self.get_columns(class_name)
+        keys = columns.keys()
+        CustomColumnSegment.write(os.path.join(directory, "_keys.seg"),
+                                  "str", range(len(keys)), None, keys)
+        for name in columns.names():
+            kind = kinds[attributes[name]]
+            CustomColumnSegment.write(
+                os.path.join(directory, name + ".seg"), kind,
+                columns.column(name), columns.present(name),
+                columns.dictionary(name) if kind == "str" else None)
+        return directory
+
+    def open_column(self, class_name, name):
+        """Returns the CustomColumnSegment of a column of class_name
+
+        The segment is the one written by the last export_columns; name
+        "_keys" opens the keys of the rows.
+        """
+        return CustomColumnSegment(os.path.join(
+            CustomFileStorage.__columns_dir, class_name, name + ".seg"))
+
     def add_new_object(self, obj):
         """Sets in __objects the obj with key <obj class name>.id"""
         key = "{}.{}".format(type(obj).__name__, obj.id)
-        CustomFileStorage.__objects[key] = obj
+        with CustomFileStorage.__lock:
+            self.__ensure_indexes()
+            self.__reindex(key, obj)
+            self.__keep_state(key)
+            CustomFileStorage.__related.invalidate()
+            self.__column_changed(key)
+            CustomFileStorage.__class_keys.setdefault(
+                type(obj).__name__, {})[key] = None
+            CustomFileStorage.__objects[key] = obj
+            CustomFileStorage.__dirty.add(key)
+            CustomFileStorage.__deleted.discard(key)
+
+    def mark_dirty(self, obj):
+        """Records that obj changed since the last save
+
+        Raises ValueError if the new values of obj break a unique index.
+        """
+        key = "{}.{}".format(type(obj).__name__, obj.id)
+        with CustomFileStorage.__lock:
+            if key in CustomFileStorage.__objects:
+                self.__ensure_indexes()
+                self.__reindex(key, obj)
+                self.__keep_state(key)
+                CustomFileStorage.__related.invalidate()
+                self.__column_changed(key)
+                CustomFileStorage.__dirty.add(key)
+
+    def delete_object(self, obj):
+        """Deletes obj from __objects"""
+        key = "{}.{}".format(type(obj).__name__, obj.id)
+        with CustomFileStorage.__lock:
+            self.__ensure_indexes()
+            self.__keep_state(key)
+            CustomFileStorage.__related.invalidate()
+            self.__column_changed(key)
+            CustomFileStorage.__class_keys.get(
+                type(obj).__name__, {}).pop(key, None)
+            self.__unindex(key)
+            if CustomFileStorage.__objects.pop(key, None) is not None:
+                CustomFileStorage.__dirty.discard(key)
+                CustomFileStorage.__deleted.add(key)
+
+    def destroy_object(self, obj):
+        """Deletes obj and its dependents, then saves once
+
+        The dependents follow get_delete_policies. Raises ValueError,
+        before deleting anything, if a "restrict" relation forbids it.
+        Returns the list of deleted objects.
+        """
+        with CustomFileStorage.__lock:
+            doomed = CustomRelation.cascade(self, obj)
+            for item in reversed(doomed):
+                self.delete_object(item)
+        self.save_data()
+        return doomed
+
+    def bulk_add(self, objects):
+        """Adds many objects at once, then saves once
+
+        The objects are checked with get_valid_attributes and the unique
+        indexes (including against each other) before any is added, and
+        each index is then given all the objects of its class at once.
+        Raises ValueError if an object is refused. Returns the list of
+        objects.
+        """
+        objects = _validate_objects(self, objects)
+        missing = CustomFileStorage.__missing
+        with CustomFileStorage.__lock:
+            self.__ensure_indexes()
+            groups = {}
+            for obj in objects:
+                key = "{}.{}".format(type(obj).__name__, obj.id)
+                groups.setdefault(type(obj).__name__, {})[key] = obj
+            pairs = {}
+            for class_name, keyed in groups.items():
+                indexes = self.__indexes_to_change(class_name, keyed) or {}
+                for name, index in indexes.items():
+                    values = []
+                    seen = {}
+                    unique = getattr(index, "unique", False)
+                    for key, obj in keyed.items():
+                        value = self.__index_value(
+                            name, lambda attribute: getattr(obj, attribute,
+                                                            missing))
+                        if value is missing:
+                            index.discard(key)
+                            continue
+                        index.check(key, value)
+                        if unique and value not in ("", None):
+                            if seen.setdefault(value, key) != key:
+                                raise ValueError("{} is already used".format(
+                                    repr(value)))
+                        values.append((key, value))
+                    pairs[class_name, name] = values
+            for (class_name, name), values in pairs.items():
+                CustomFileStorage.__attribute_indexes[class_name][name].update(
+                    values)
+            CustomFileStorage.__related.invalidate()
+            for class_name, keyed in groups.items():
+                for key in keyed:
+                    self.__keep_state(key)
+                CustomFileStorage.__class_keys.setdefault(
+                    class_name, {}).update(dict.fromkeys(keyed))
+                CustomFileStorage.__objects.update(keyed)
+                CustomFileStorage.__dirty.update(keyed)
+                CustomFileStorage.__deleted.difference_update(keyed)
+                for key in keyed:
+                    self.__column_changed(key)
+        self.save_data()
+        return objects
+
+    def bulk_create(self, cls, rows):
+        """Creates an object of cls for each dictionary of rows, at once
+
+        The values are cast to the types of get_valid_attributes; a name
+        missing from them raises ValueError, and so does a value that
+        can't be cast. The objects are then given to bulk_add.
+        """
+        if isinstance(cls, str):
+            cls = self.get_valid_classes()[cls]
+        attributes = self.get_valid_attributes().get(cls.__name__, {})
+        now = datetime.datetime.now()
+        rows = list(rows)
+        ids = _new_ids(len(rows))
+        objects = []
+        for row, obj_id in zip(rows, ids):
+            values = {}
+            for name, value in row.items():
+                if name not in attributes:
+                    raise ValueError("{} has no attribute {}".format(
+                        cls.__name__, repr(name)))
+                try:
+                    values[name] = attributes[name](value)
+                except (TypeError, ValueError):
+                    raise ValueError("{} is not a valid {}".format(
+                        repr(value), name))
+            # filled in directly: neither stored nor marked dirty one by one
+            obj = cls.__new__(cls)
+            obj.__dict__.update(id=obj_id, created_at=now, updated_at=now)
+            obj.__dict__.update(values)
+            objects.append(obj)
+        return self.bulk_add(objects)
+
+    def will_change(self, obj):
+        """Records the state of obj before a change, for batch rollbacks"""
+        if not CustomFileStorage.__batches:
+            return
+        obj_id = getattr(obj, "id", None)
+        if obj_id is None:
+            return
+        with CustomFileStorage.__lock:
+            self.__keep_state("{}.{}".format(type(obj).__name__, obj_id))
+
+    def __keep_state(self, key):
+        """Records the stored state of key in the innermost batch, once"""
+        if not CustomFileStorage.__batches:
+            return
+        states = CustomFileStorage.__batches[-1][0]
+        if key in states:
+            return
+        obj = CustomFileStorage.__objects.get(key)
+        states[key] = None if obj is None else (obj, _copy_state(obj))
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Returns a context manager grouping changes into a single write
+
+        Inside the block save_data only records that a write is due, so
+        any number of saves, updates and destroys cost one write when the
+        outermost block exits. The block holds the storage lock. If it
+        raises, every object it added, changed or deleted gets back its
+        state from before the block and nothing is written; a nested
+        block rolls back only its own changes.
+        """
+        with CustomFileStorage.__lock:
+            batches = CustomFileStorage.__batches
+            batches.append(({}, set(CustomFileStorage.__dirty),
+                            set(CustomFileStorage.__deleted)))
+            try:
+                yield self
+            except BaseException:
+                self.__roll_back(*batches.pop())
+                if not batches:
+                    CustomFileStorage.__deferred = False
+                raise
+            states = batches.pop()[0]
+            if batches:
+                # the outer block keeps the oldest state of each key
+                outer = batches[-1][0]
+                for key, state in states.items():
+                    outer.setdefault(key, state)
+            elif CustomFileStorage.__deferred:
+                CustomFileStorage.__deferred = False
+                self.save_data()
+
+    def __roll_back(self, states, dirty, deleted):
+        """Gives the keys of states back their recorded state"""
+        self.__ensure_indexes()
+        objects = CustomFileStorage.__objects
+        # every key is taken out first, so that restored values can't
+        # clash in a unique index with values about to be rolled back
+        for key in states:
+            class_name = key.split(".", 1)[0]
+            objects.pop(key, None)
+            CustomFileStorage.__class_keys.get(class_name, {}).pop(key, None)
+            self.__unindex(key)
+            self.__column_changed(key)
+        for key, state in states.items():
+            if state is None:
+                continue
+            obj, values = state
+            obj.__dict__.clear()
+            obj.__dict__.update(values)
+            self.__reindex(key, obj)
+            CustomFileStorage.__class_keys.setdefault(
+                key.split(".", 1)[0], {})[key] = None
+            objects[key] = obj
+        CustomFileStorage.__related.invalidate()
+        CustomFileStorage.__dirty.clear()
+        CustomFileStorage.__dirty.update(dirty)
+        CustomFileStorage.__deleted.clear()
+        CustomFileStorage.__deleted.update(deleted)
 
     def save_data(self):
-        """Serializes __objects to the JSON file (path: __file_path)"""
-        with open(CustomFileStorage.__file_path, "w", encoding="utf-8") as file:
-            data = {key: value.to_dict() for key, value in CustomFileStorage.__objects.items()}
-            json.dump(data, file)
+        """Serializes __objects to the JSON file (path: __file_path)
+
+        Only the objects changed since the last save are encoded again,
+        the others are spliced in from the cache of encoded fragments.
+        In journaled mode the changed objects are appended to the journal
+        instead of rewriting the file, and in sharded mode only the shard
+        files holding changed objects are rewritten. With a commit window,
+        the first call schedules the write and the calls arriving before
+        the window closes share it. In write-behind mode the write is left
+        to the background flusher; call flush for durability. Inside a
+        batch the write waits for the end of the outermost block.
+        """
+        with CustomFileStorage.__lock:
+            # other threads wait here for the batch to end
+            if CustomFileStorage.__batches:
+                CustomFileStorage.__deferred = True
+                return
+        if not self.__commit_window and not self.__write_behind:
+            self.__commit()
+            return
+        with CustomFileStorage.__lock:
+            self.__pending = True
+            if self.__write_behind:
+                self.__write_behind.request(len(CustomFileStorage.__dirty) +
+                                            len(CustomFileStorage.__deleted))
+            elif self.__commit_timer is None:
+                self.__commit_timer = threading.Timer(
+                    self.__commit_window / 1000, self.__timed_commit)
+                self.__commit_timer.daemon = True
+                self.__commit_timer.start()
+
+    def __timed_commit(self):
+        """Writes the changes when the commit window closes
+
+        An error is reported rather than raised, the changes staying
+        pending for the next save_data or flush.
+        """
+        try:
+            self.__commit()
+        except Exception:
+            traceback.print_exc()
+
+    def flush(self):
+        """Writes the changes deferred by save_data, if any"""
+        with CustomFileStorage.__lock:
+            if self.__commit_timer is not None:
+                self.__commit_timer.cancel()
+            if self.__pending:
+                self.__commit()
+
+    def close(self):
+        """Writes the deferred changes and stops the background threads
+
+        The text indexes built by this process are saved too, if the
+        snapshot changed since they were last saved.
+        """
+        if self.__write_behind:
+            self.__write_behind.stop()
+            self.__write_behind = None
+        if self.__compactor:
+            self.__compactor.stop()
+            self.__compactor = None
+        self.flush()
+        with CustomFileStorage.__lock, CustomFileStorage.__file_lock:
+            # the indexes must hold what the files hold, no more, no less
+            if CustomFileStorage.__dirty or CustomFileStorage.__deleted or \
+                    CustomFileStorage.__file_lock.generation() != \
+                    CustomFileStorage.__generation:
+                return
+            if self.__text_indexes_built() and \
+                    self.__snapshot_stamp() != self.__saved_text_stamp():
+                self.__save_text_indexes(self.__dump_text_indexes(build=False))
+
+    def __commit(self):
+        """Writes the changes since the last save"""
+        with CustomFileStorage.__lock, CustomFileStorage.__file_lock:
+            self.__commit_timer = None
+            if CustomFileStorage.__file_lock.generation() != \
+                    CustomFileStorage.__generation:
+                self.__merge()
+            objects = CustomFileStorage.__objects
+            versions = CustomFileStorage.__versions
+            for key in CustomFileStorage.__dirty:
+                if key in objects:
+                    versions[key] = versions.get(key, 0) + 1
+            for key in CustomFileStorage.__deleted:
+                versions.pop(key, None)
+            fragments = CustomFileStorage.__fragments
+            for key in CustomFileStorage.__deleted:
+                fragments.pop(key, None)
+            if self.__journaled:
+                # fragments are only needed by the next checkpoint
+                for key in CustomFileStorage.__dirty:
+                    fragments.pop(key, None)
+                self.__append_to_journal()
+            else:
+                for key in CustomFileStorage.__dirty:
+                    if key in objects:
+                        fragments[key] = self.__serializer.encode(
+                            key, self.__record_of(key))
+                if self.__shards:
+                    self.__save_shards()
+                else:
+                    path = self.__snapshot_path()
+                    self.__write_atomically(path, self.__encode_objects(objects))
+                    self.__remove_snapshots(keep=(path,))
+                    self.__journal.truncate()
+            if CustomFileStorage.__dirty or CustomFileStorage.__deleted:
+                CustomFileStorage.__generation = \
+                    CustomFileStorage.__file_lock.advance()
+            CustomFileStorage.__dirty.clear()
+            CustomFileStorage.__deleted.clear()
+            # a failed write stays pending for flush to try again
+            self.__pending = False
+
+    def __merge(self):
+        """Brings in the changes saved by other processes since our last read
+
+        An object another process changed, added or deleted is taken as
+        saved, unless this process changed or deleted it too: each such
+        conflict keeps the local change and raises ValueError, after the
+        other changes are merged and before anything is written. Saving
+        again then overwrites the other process; reload_data drops the
+        local changes instead.
+        """
+        stored, versions, stored_fragments, _, _ = self.__read_stored(
+            lambda key, value: value, raw=True)
+        objects = CustomFileStorage.__objects
+        known = CustomFileStorage.__versions
+        dirty = CustomFileStorage.__dirty
+        changed = dirty | CustomFileStorage.__deleted
+        conflicts = []
+        taken = {}
+        for key, version in versions.items():
+            if known.get(key) == version:
+                continue
+            if key in changed:
+                conflicts.append(key)
+            else:
+                taken[key] = stored[key]
+        removed = []
+        for key in known:
+            if key not in versions:
+                if key in dirty:
+                    conflicts.append(key)
+                elif key not in changed:
+                    removed.append(key)
+        self.__ensure_indexes()
+        classes = self.get_valid_classes()
+        fragments = CustomFileStorage.__fragments
+        members = CustomFileStorage.__shard_members
+        # taken keys leave the indexes first, so that values they swapped
+        # don't clash in a unique index
+        for key in removed + list(taken):
+            self.__unindex(key)
+            fragments.pop(key, None)
+            self.__column_changed(key)
+        for key in removed:
+            objects.pop(key, None)
+            CustomFileStorage.__class_keys.get(
+                key.split(".", 1)[0], {}).pop(key, None)
+            if self.__shards:
+                members.get(self.__shard_of(key), set()).discard(key)
+        for key, record in taken.items():
+            if type(record) is bytes:
+                record = self.__serializer.decode(record)
+            obj = classes[record["__class__"]](**record)
+            current = objects.get(key)
+            if current is not None:
+                # objects held elsewhere see the change too
+                current.__dict__.clear()
+                current.__dict__.update(obj.__dict__)
+                obj = current
+            try:
+                self.__reindex(key, obj)
+            except ValueError:
+                # a value this process gave to one of its own objects
+                conflicts.append(key)
+            CustomFileStorage.__class_keys.setdefault(
+                key.split(".", 1)[0], {})[key] = None
+            objects[key] = obj
+            if key in stored_fragments:
+                fragments[key] = stored_fragments[key]
+            if self.__shards:
+                members.setdefault(self.__shard_of(key), set()).add(key)
+        CustomFileStorage.__related.invalidate()
+        CustomFileStorage.__versions = versions
+        CustomFileStorage.__generation = \
+            CustomFileStorage.__file_lock.generation()
+        if conflicts:
+            raise ValueError("{} changed in another process".format(
+                ", ".join(sorted(conflicts))))
+
+    def checkpoint(self):
+        """Folds the journal into a new snapshot
+
+        The journal is rotated and the snapshot encoded while holding the
+        storage lock; the snapshot is then written, at checkpoint_rate
+        if set, while saves keep appending to the new journal. Superseded
+        records and the records of destroyed objects are dropped with
+        the rotated journal. Processes sharing the storage checkpoint one
+        at a time.
+        """
+        with CustomFileStorage.__checkpoint_lock, \
+                CustomFileStorage.__checkpoint_file_lock:
+            with CustomFileStorage.__lock, CustomFileStorage.__file_lock:
+                if not self.__journaled:
+                    self.__commit()
+                    self.__save_text_indexes(self.__dump_text_indexes())
+                    return
+                self.__commit()
+                objects = CustomFileStorage.__objects
+                if self.__shards:
+                    members = {}
+                    for key in objects:
+                        members.setdefault(self.__shard_of(key), set()).add(key)
+                    CustomFileStorage.__shard_members = members
+                    texts = {os.path.join(CustomFileStorage.__shard_dir, name):
+                             self.__encode_objects(keys)
+                             for name, keys in members.items()}
+                else:
+                    texts = {self.__snapshot_path():
+                             self.__encode_objects(objects)}
+                self.__journal.rotate()
+                CustomFileStorage.__metrics["journal_records"] = 0
+                text_indexes = self.__dump_text_indexes()
+            if self.__shards:
+                os.makedirs(CustomFileStorage.__shard_dir, exist_ok=True)
+            for path, text in texts.items():
+                self.__write_atomically(path, text, self.__checkpoint_rate)
+            # a reader holding the lock may still need the rotated journal
+            with CustomFileStorage.__file_lock:
+                self.__remove_snapshots(keep=texts)
+                self.__journal.drop_rotated()
+            self.__save_text_indexes(text_indexes)
+            CustomFileStorage.__relayout = False
+            CustomFileStorage.__metrics["last_checkpoint"] = datetime.datetime.now()
+            CustomFileStorage.__metrics["checkpoints"] += 1
+
+    def get_journal_metrics(self):
+        """Returns a dictionary describing the journal
+
+        Keys: journal_size (bytes), journal_records (records appended
+        or replayed since the last checkpoint), last_checkpoint
+        (datetime or None), checkpoints (count) and replay_time (seconds
+        spent replaying the journal in the last reload_data, or the last
+        read of the changes of another process).
+        """
+        metrics = dict(CustomFileStorage.__metrics)
+        metrics["journal_size"] = self.__journal.size()
+        return metrics
+
+    def __write_atomically(self, path, text, rate=0):
+        """Replaces the file at path with the bytes text, never truncating it
+
+        The text goes to a temporary file that is flushed to disk and
+        then renamed over path, so a crash leaves either the old or the
+        new content. If rate is not 0, at most rate bytes are written
+        per second.
+        """
+        tmp_path = "{}.{}.tmp".format(path, os.getpid())
+        with open(tmp_path, "wb") as file:
+            if rate:
+                chunk_size = 65536
+                for start in range(0, len(text), chunk_size):
+                    file.write(text[start:start + chunk_size])
+                    time.sleep(chunk_size / rate)
+            else:
+                file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+        fd = os.open(os.path.dirname(path) or ".", os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def __shard_of(self, key):
+        """Returns the name of the shard file holding key"""
+        class_name, obj_id = key.split(".", 1)
+        return "{}.{}{}".format(
+            class_name, zlib.crc32(obj_id.encode("utf-8")) % self.__shards,
+            self.__serializer.extension)
+
+    def __save_shards(self):
+        """Rewrites the shard files holding changed objects"""
+        objects = CustomFileStorage.__objects
+        members = CustomFileStorage.__shard_members
+        changed = CustomFileStorage.__dirty | CustomFileStorage.__deleted
+        for key in CustomFileStorage.__dirty:
+            if key in objects:
+                members.setdefault(self.__shard_of(key), set()).add(key)
+        for key in CustomFileStorage.__deleted:
+            members.get(self.__shard_of(key), set()).discard(key)
+        os.makedirs(CustomFileStorage.__shard_dir, exist_ok=True)
+        # the journal, a single file, a different partitioning or format
+        # may hold objects that are not in the shards yet
+        if CustomFileStorage.__relayout or self.__journal.size() or \
+                os.path.isfile(CustomFileStorage.__file_path) or \
+                os.path.isfile(CustomFileStorage.__binary_path):
+            names = set(members) | set(
+                os.path.basename(path) for path in self.__snapshot_files()
+                if os.path.dirname(path) == CustomFileStorage.__shard_dir)
+        else:
+            names = {self.__shard_of(key) for key in changed}
+        for name in names:
+            path = os.path.join(CustomFileStorage.__shard_dir, name)
+            keys = [key for key in members.get(name, ()) if key in objects]
+            if keys:
+                self.__write_atomically(path, self.__encode_objects(keys))
+            elif os.path.isfile(path):
+                os.remove(path)
+        for path in (CustomFileStorage.__file_path, CustomFileStorage.__binary_path):
+            if os.path.isfile(path):
+                os.remove(path)
+        self.__journal.truncate()
+        CustomFileStorage.__relayout = False
+
+    def __encode_objects(self, keys):
+        """Returns the bytes of the file holding the objects of keys
+
+        The file is built from the cached fragments.
+        """
+        fragments = CustomFileStorage.__fragments
+        parts = []
+        for key in keys:
+            fragment = fragments.get(key)
+            if fragment is None:
+                fragment = fragments[key] = self.__serializer.encode(
+                    key, self.__record_of(key))
+            parts.append(fragment)
+        return self.__serializer.dump(parts)
+
+    def __snapshot_stamp(self):
+        """Returns the list of (path, inode, size, mtime) of the snapshot"""
+        stamp = []
+        for path in self.__snapshot_files():
+            stat = os.stat(path)
+            stamp.append((path, stat.st_ino, stat.st_size, stat.st_mtime_ns))
+        return stamp
+
+    def __text_classes(self):
+        """Returns the names of the classes having a text index"""
+        return [class_name for class_name, names in
+                self.get_valid_indexes().items() if "text" in names.values()]
+
+    def __text_indexes_built(self):
+        """Returns True if a text index was built by this process"""
+        self.__ensure_indexes()
+        return any(class_name in CustomFileStorage.__attribute_indexes
+                   for class_name in self.__text_classes())
+
+    def __dump_text_indexes(self, build=True):
+        """Returns the marshal bytes of the text indexes, None if empty
+
+        If build is False, only the indexes already built are dumped.
+        """
+        self.__ensure_indexes(*(self.__text_classes() if build else ()))
+        dumps = {"{}.{}".format(class_name, name): index.dump()
+                 for class_name, indexes in
+                 CustomFileStorage.__attribute_indexes.items()
+                 for name, index in indexes.items()
+                 if isinstance(index, CustomTextIndex) and len(index)}
+        return marshal.dumps(dumps) if dumps else None
+
+    def __save_text_indexes(self, data):
+        """Writes the dumped text indexes with the stamp of the snapshot
+
+        They are written by checkpoint and close only. The first use of
+        a text index after reload_data reads it back instead of tokenizing
+        every text while the stamp still matches the snapshot read, and
+        rebuilds it from the objects otherwise, or once a Python with
+        another marshal version reads the file.
+        """
+        path = CustomFileStorage.__text_index_path
+        if data is None:
+            if os.path.isfile(path):
+                os.remove(path)
+            return
+        self.__write_atomically(
+            path, CustomFileStorage.__text_index_magic +
+            marshal.dumps(self.__snapshot_stamp()) + data)
+
+    def __saved_text_stamp(self):
+        """Returns the stamp of the saved text indexes, None if unreadable"""
+        try:
+            with open(CustomFileStorage.__text_index_path, "rb") as file:
+                magic = CustomFileStorage.__text_index_magic
+                if file.read(len(magic)) != magic:
+                    return None
+                return marshal.load(file)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+    def __load_text_indexes(self, stamp):
+        """Returns the saved text indexes if they match stamp, else {}"""
+        try:
+            with open(CustomFileStorage.__text_index_path, "rb") as file:
+                magic = CustomFileStorage.__text_index_magic
+                if file.read(len(magic)) != magic or \
+                        marshal.load(file) != stamp:
+                    return {}
+                dumps = marshal.load(file)
+        except (OSError, EOFError, ValueError, TypeError):
+            return {}
+        return {tuple(name.rsplit(".", 1)): CustomTextIndex.load(data)
+                for name, data in dumps.items()}
+
+    def __snapshot_path(self):
+        """Returns the path of the single snapshot file"""
+        if self.__serializer.extension == ".bin":
+            return CustomFileStorage.__binary_path
+        return CustomFileStorage.__file_path
+
+    def __snapshot_files(self):
+        """Returns the paths of the existing snapshot and shard files"""
+        paths = [path for path in (CustomFileStorage.__file_path,
+                                   CustomFileStorage.__binary_path)
+                 if os.path.isfile(path)]
+        if os.path.isdir(CustomFileStorage.__shard_dir):
+            paths.extend(
+                os.path.join(CustomFileStorage.__shard_dir, name)
+                for name in sorted(os.listdir(CustomFileStorage.__shard_dir))
+                if name.endswith((".json", ".bin")))
+        return paths
+
+    def __remove_snapshots(self, keep):
+        """Removes the snapshot and shard files whose path is not in keep"""
+        for path in self.__snapshot_files():
+            if path not in keep:
+                os.remove(path)
+        if not self.__shards and os.path.isdir(CustomFileStorage.__shard_dir):
+            shutil.rmtree(CustomFileStorage.__shard_dir)
+
+    def convert(self, file_format):
+        """Rewrites the stored objects in file_format ("json" or "binary")
+
+        The files of the previous format are removed and file_format is
+        used by the following saves.
+        """
+        with CustomFileStorage.__lock:
+            self.__serializer = self.__serializers[file_format]
+            CustomFileStorage.__fragments = {}
+            CustomFileStorage.__relayout = True
+            if self.__shards:
+                # shard names carry the extension of the format
+                members = {}
+                for key in CustomFileStorage.__objects:
+                    members.setdefault(self.__shard_of(key), set()).add(key)
+                CustomFileStorage.__shard_members = members
+            if self.__journaled:
+                self.checkpoint()
+            else:
+                self.__commit()
+
+    def __record_of(self, key):
+        """Returns the dictionary to serialize for key
+
+        Objects that were never accessed since a lazy reload are saved
+        from their raw record without being built.
+        """
+        objects = CustomFileStorage.__objects
+        version = CustomFileStorage.__versions.get(key)
+        if isinstance(objects, CustomLazyObjects):
+            record = objects.get_record(key)
+            if record is not None:
+                return dict(record, __version__=version) if version \
+                    else record
+        record = objects[key].to_dict()
+        if version:
+            record["__version__"] = version
+        return record
+
+    def __append_to_journal(self):
+        """Appends put/delete records for the changed objects"""
+        objects = CustomFileStorage.__objects
+        records = [("put", key, json.dumps(
+            self.__record_of(key), default=datetime.datetime.isoformat))
+                   for key in CustomFileStorage.__dirty if key in objects]
+        records.extend(("delete", key, None)
+                       for key in CustomFileStorage.__deleted)
+        self.__journal.append(records)
+        CustomFileStorage.__metrics["journal_records"] += len(records)
 
     def get_valid_classes(self):
         """Returns a dictionary of valid classes and their references"""
@@ -46,14 +1267,126 @@ class CustomFileStorage:
         return classes
 
     def reload_data(self):
-        """Reloads the stored objects"""
-        if not os.path.isfile(CustomFileStorage.__file_path):
-            return
-        with open(CustomFileStorage.__file_path, "r", encoding="utf-8") as file:
-            obj_dict = json.load(file)
-            obj_dict = {key: self.get_valid_classes()[value["__class__"]](**value)
-                        for key, value in obj_dict.items()}
+        """Reloads the stored objects from the snapshot and the journal
+
+        The bytes read for each object are kept as its cached fragment.
+        In lazy mode the files in the current format are only split into
+        these fragments, and each instance is decoded and built the first
+        time it is accessed. The files are read under the shared
+        inter-process lock.
+        """
+        classes = self.get_valid_classes()
+
+        def build(key, value):
+            """Returns the instance stored in value"""
+            return classes[value["__class__"]](**value)
+
+        load = (lambda key, value: value) if self.__lazy else build
+        CustomFileStorage.__file_lock.acquire(shared=True)
+        try:
+            paths = self.__snapshot_files()
+            if not paths and not self.__journal.size():
+                return
+            stamp = self.__snapshot_stamp()
+            obj_dict, versions, fragments, replayed, relayout = \
+                self.__read_stored(load, raw=self.__lazy)
+            generation = CustomFileStorage.__file_lock.generation()
+        finally:
+            CustomFileStorage.__file_lock.release()
+        shard_members = {}
+        if self.__shards:
+            for key in obj_dict:
+                shard_members.setdefault(self.__shard_of(key), set()).add(key)
+        if self.__lazy:
+            obj_dict = CustomLazyObjects(obj_dict, build,
+                                         self.__serializer.decode)
+        with CustomFileStorage.__lock:
             CustomFileStorage.__objects = obj_dict
+            CustomFileStorage.__versions = versions
+            CustomFileStorage.__generation = generation
+            # indexes are built on first use, the saved text indexes
+            # read back then if the snapshot is still this one
+            CustomFileStorage.__preloaded = (obj_dict, stamp, replayed)
+            CustomFileStorage.__saved_text_indexes = None
+            CustomFileStorage.__fragments = fragments
+            CustomFileStorage.__shard_members = shard_members
+            CustomFileStorage.__relayout = relayout
+            CustomFileStorage.__dirty.clear()
+            CustomFileStorage.__deleted.clear()
+
+    def __read_stored(self, load, raw=False):
+        """Reads the snapshot and the journal
+
+        Returns the dictionary of each stored key to load(key, record),
+        the dictionary of their versions, the encoded fragments read for
+        them in the current format, the set of keys replayed from the
+        journal and whether the shards need a new layout. If raw, the
+        keys read from a file in the current format are given their
+        fragment instead, without decoding it.
+        """
+
+        def read(path):
+            """Returns the (key, version, object) of the records of path
+
+            The fragments of path are added to fragments if path is in
+            the current format.
+            """
+            if path.endswith(".bin"):
+                serializer = self.__serializers["binary"]
+            else:
+                serializer = self.__serializers["json"]
+            found = fragments if serializer is self.__serializer else None
+            with open(path, "rb") as file:
+                if raw and found is not None:
+                    members = serializer.scan(file)
+                    if members is not None:
+                        found.update((key, fragment)
+                                     for key, _, fragment in members)
+                        return members
+                    file.seek(0)
+                return [(key, value.pop("__version__", 0), load(key, value))
+                        for key, value in serializer.read(file,
+                                                          fragments=found)]
+
+        paths = self.__snapshot_files()
+        obj_dict = {}
+        fragments = {}
+        versions = {}
+        relayout = False
+        # nothing built here is garbage, collecting would only slow it down
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for path in paths:
+                members = read(path)
+                for key, version, obj in members:
+                    obj_dict[key] = obj
+                    versions[key] = version
+                if self.__shards and \
+                        os.path.dirname(path) == CustomFileStorage.__shard_dir:
+                    name = os.path.basename(path)
+                    relayout = relayout or any(
+                        self.__shard_of(key) != name
+                        for key, _, _ in members)
+        finally:
+            if gc_enabled:
+                gc.enable()
+        start = time.monotonic()
+        records = 0
+        replayed = set()
+        for op, key, value in self.__journal.replay():
+            if op == "put":
+                versions[key] = value.pop("__version__", 0)
+                obj_dict[key] = load(key, value)
+            else:
+                versions.pop(key, None)
+                obj_dict.pop(key, None)
+            fragments.pop(key, None)
+            replayed.add(key)
+            records += 1
+        CustomFileStorage.__metrics["replay_time"] = time.monotonic() - start
+        CustomFileStorage.__metrics["journal_records"] = records
+        return obj_dict, versions, fragments, replayed, relayout
 
     def get_valid_attributes(self):
         """Returns the valid attributes and their types for classname"""
@@ -93,3 +1426,161 @@ class CustomFileStorage:
         }
         return attributes
 
+    def get_valid_indexes(self):
+        """Returns the indexed attributes of each class and their kind
+
+        A "hash" index looks objects up by value; a "unique" one also
+        refuses a value that another object of the class already holds.
+        A "sorted" index also answers ranges and orderings; every int and
+        float attribute of get_valid_attributes gets one. A "geo" index,
+        on a (latitude, longitude) pair of names, answers radius, bounding
+        box and nearest neighbours searches. A "text" index answers ranked
+        word searches. A "bitmap" index, on a list attribute, answers
+        which objects list all, any or none of some members.
+        """
+        indexes = {
+            "User":
+                {"email": "unique"},
+            "City":
+                {"state_id": "hash"},
+            "Place":
+                {"city_id": "hash",
+                 "user_id": "hash",
+                 "description": "text",
+                 "amenity_ids": "bitmap",
+                 ("latitude", "longitude"): "geo"},
+            "Review":
+                {"place_id": "hash",
+                 "user_id": "hash",
+                 "text": "text"}
+        }
+        for class_name, attributes in self.get_valid_attributes().items():
+            for name, kind in attributes.items():
+                if kind in (int, float):
+                    indexes.setdefault(class_name, {}).setdefault(
+                        name, "sorted")
+        return indexes
+
+    def get_valid_relations(self):
+        """Returns the relations of each class
+
+        A relation is (class name, foreign key, "one" or "many"): "one"
+        is the object whose id the foreign key of this object holds,
+        "many" the objects whose foreign key holds the id of this one.
+        The foreign keys of "many" relations are in get_valid_indexes.
+        """
+        return {
+            "State":
+                {"cities": ("City", "state_id", "many")},
+            "City":
+                {"state": ("State", "state_id", "one"),
+                 "places": ("Place", "city_id", "many")},
+            "Place":
+                {"city": ("City", "city_id", "one"),
+                 "user": ("User", "user_id", "one"),
+                 "reviews": ("Review", "place_id", "many")},
+            "Review":
+                {"place": ("Place", "place_id", "one"),
+                 "user": ("User", "user_id", "one")},
+            "User":
+                {"places": ("Place", "user_id", "many"),
+                 "reviews": ("Review", "user_id", "many")}
+        }
+
+    def get_delete_policies(self):
+        """Returns what deleting an object does to its "many" relations
+
+        "cascade" deletes the related objects too, "restrict" refuses to
+        delete an object that still has related objects. Relations not
+        listed are left pointing at the deleted object.
+        """
+        return {
+            "State":
+                {"cities": "cascade"},
+            "City":
+                {"places": "cascade"},
+            "Place":
+                {"reviews": "cascade"},
+            "User":
+                {"places": "restrict",
+                 "reviews": "cascade"}
+        }
+
+    def get_related(self, obj, name):
+        """Returns the objects related to obj by relation name
+
+        A "one" relation returns the object, or None; a "many" relation
+        returns a CustomRelation, the lazy view of the objects. Relations
+        read ahead by prefetch_related are returned without a lookup.
+        """
+        related = CustomFileStorage.__related.get(
+            obj, name, CustomFileStorage.__missing)
+        if related is CustomFileStorage.__missing:
+            related = CustomRelation.resolve(self, obj, name)
+        return related
+
+    def prefetch_related(self, objects, *names):
+        """Resolves the relations names of all objects in one pass each
+
+        Args:
+            - objects: objects owning the relations
+            - names: relation names, or dotted paths like "reviews.user"
+        """
+        CustomFileStorage.__related.prefetch(self, objects, names)
+
+
+def _has_members(value, all_of=(), any_of=(), none_of=()):
+    """Returns True if the list value meets the rules of a bitmap match"""
+    if not isinstance(value, (list, tuple, set, frozenset)):
+        return False
+    return all(member in value for member in all_of) and \
+        (not any_of or any(member in value for member in any_of)) and \
+        not any(member in value for member in none_of)
+
+
+def _validate_objects(storage, objects):
+    """Returns the list of objects, or raises ValueError for a bad one
+
+    The class of every object must be in get_valid_classes, and its
+    attributes of get_valid_attributes must have their type (an int
+    is a valid float).
+    """
+    objects = list(objects)
+    classes = storage.get_valid_classes()
+    attributes = storage.get_valid_attributes()
+    for obj in objects:
+        class_name = type(obj).__name__
+        if classes.get(class_name) is not type(obj):
+            raise ValueError("{} isn't a valid class".format(class_name))
+        for name, kind in attributes.get(class_name, {}).items():
+            if name not in obj.__dict__:
+                continue
+            value = obj.__dict__[name]
+            if not isinstance(value, kind) and \
+                    not (kind is float and type(value) is int):
+                raise ValueError("{} is not a valid {}".format(
+                    repr(value), name))
+    return objects
+
+
+def _copy_state(obj):
+    """Returns a copy of the attributes of obj, lists copied too"""
+    return {name: list(value) if type(value) is list else value
+            for name, value in obj.__dict__.items()}
+
+
+def _new_ids(count):
+    """Returns a list of count random version 4 UUID strings
+
+    All the random bytes are drawn at once and formatted from one hex
+    string, which is about three times faster than uuid.uuid4 per id.
+    """
+    data = bytearray(os.urandom(16 * count))
+    data[6::16] = bytes(byte & 0x0f | 0x40 for byte in data[6::16])
+    data[8::16] = bytes(byte & 0x3f | 0x80 for byte in data[8::16])
+    digits = data.hex()
+    return ["{}-{}-{}-{}-{}".format(digits[i:i + 8], digits[i + 8:i + 12],
+                                    digits[i + 12:i + 16],
+                                    digits[i + 16:i + 20],
+                                    digits[i + 20:i + 32])
+            for i in range(0, 32 * count, 32)]
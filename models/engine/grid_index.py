@@ -0,0 +1,243 @@
+#!/usr/bin/python3
+"""Module for CustomGridIndex class."""
+import heapq
+import math
+from numbers import Real
+
+
+class CustomGridIndex:
+
+    """Class for looking up the keys of objects by (latitude, longitude)
+
+    Points are bucketed in square cells of cell_size degrees, so a
+    bounding box or radius query only visits the cells it overlaps and
+    a nearest-neighbours query visits rings of cells around the point
+    until no unvisited cell can hold a closer one. Distances are great
+    circle distances in kilometers.
+    """
+
+    earth_radius = 6371.0088
+    km_per_degree = math.pi * earth_radius / 180
+
+    def __init__(self, cell_size=0.1):
+        """Initializes an empty index
+
+        Args:
+            - cell_size: side of the cells, in degrees
+        """
+        self.__cell_size = cell_size
+        self.__columns = round(360 / cell_size)
+        self.__cells = {}
+        self.__points = {}
+
+    @classmethod
+    def distance(cls, latitude1, longitude1, latitude2, longitude2):
+        """Returns the great circle distance between two points, in km"""
+        phi1 = math.radians(latitude1)
+        phi2 = math.radians(latitude2)
+        half_dphi = (phi2 - phi1) / 2
+        half_dlambda = math.radians(longitude2 - longitude1) / 2
+        a = math.sin(half_dphi) ** 2 + \
+            math.cos(phi1) * math.cos(phi2) * math.sin(half_dlambda) ** 2
+        return 2 * cls.earth_radius * math.asin(min(1.0, math.sqrt(a)))
+
+    def accepts(self, value):
+        """Returns True if value is a valid (latitude, longitude) pair"""
+        if type(value) is not tuple or len(value) != 2:
+            return False
+        latitude, longitude = value
+        if not (type(latitude) is float or isinstance(latitude, Real)) or \
+                not (type(longitude) is float or isinstance(longitude, Real)):
+            return False
+        return -90 <= latitude <= 90 and -180 <= longitude <= 180
+
+    def check(self, key, value):
+        """Does nothing: a grid index accepts any value"""
+        pass
+
+    def add(self, key, value):
+        """Records that the object of key is at value, (lat, lon)"""
+        if self.__points.get(key) == value:
+            return
+        self.discard(key)
+        if self.accepts(value):
+            self.__cells.setdefault(self.__cell_of(*value), {})[key] = value
+            self.__points[key] = value
+
+    def update(self, pairs):
+        """Adds the (key, value) pairs"""
+        cells = self.__cells
+        points = self.__points
+        size = self.__cell_size
+        last_column = self.__columns // 2 - 1
+        floor = math.floor
+        for key, value in pairs:
+            if key in points or not self.accepts(value):
+                self.add(key, value)
+                continue
+            cell = (floor(value[0] / size),
+                    min(floor(value[1] / size), last_column))
+            bucket = cells.get(cell)
+            if bucket is None:
+                bucket = cells[cell] = {}
+            bucket[key] = value
+            points[key] = value
+
+    def discard(self, key):
+        """Forgets the position of key, if any"""
+        if key in self.__points:
+            cell = self.__cell_of(*self.__points.pop(key))
+            del self.__cells[cell][key]
+            if not self.__cells[cell]:
+                del self.__cells[cell]
+
+    def lookup(self, value):
+        """Returns the list of keys at exactly value"""
+        if not self.accepts(value):
+            return []
+        return [key for key, point in
+                self.__cells.get(self.__cell_of(*value), {}).items()
+                if point == value]
+
+    def within_box(self, south, west, north, east):
+        """Returns the keys inside a bounding box
+
+        A box whose west is greater than its east crosses the
+        antimeridian.
+        """
+        if west > east:
+            return self.within_box(south, west, north, 180) + \
+                self.within_box(south, -180, north, east)
+        keys = []
+        for points in self.__cells_in(south, west, north, east):
+            keys.extend(key for key, (latitude, longitude) in points.items()
+                        if south <= latitude <= north and
+                        west <= longitude <= east)
+        return keys
+
+    def within_radius(self, latitude, longitude, radius):
+        """Returns the keys within radius km of a point, nearest first"""
+        dlat = radius / self.km_per_degree
+        south, north = latitude - dlat, latitude + dlat
+        cos_lat = math.cos(math.radians(min(89.9, abs(latitude) + dlat)))
+        dlon = radius / (self.km_per_degree * cos_lat)
+        if south <= -90 or north >= 90 or dlon >= 180:
+            boxes = [(max(south, -90), -180, min(north, 90), 180)]
+        else:
+            west, east = longitude - dlon, longitude + dlon
+            boxes = [(south, max(west, -180), north, min(east, 180))]
+            if west < -180:
+                boxes.append((south, west + 360, north, 180))
+            if east > 180:
+                boxes.append((south, -180, north, east - 360))
+        found = {}
+        for box in boxes:
+            for points in self.__cells_in(*box):
+                for key, point in points.items():
+                    distance = self.distance(latitude, longitude, *point)
+                    if distance <= radius:
+                        found[key] = distance
+        return sorted(found, key=found.get)
+
+    def nearest(self, latitude, longitude, count):
+        """Returns the keys of the count points nearest to a point"""
+        if count <= 0 or not self.__points:
+            return []
+        if longitude >= 180:
+            longitude -= 360
+        row, column = self.__cell_of(latitude, longitude)
+        best = []
+        ring = 0
+        while True:
+            # once a ring is larger than the occupied cells (or wraps
+            # around the globe) the remaining cells are checked at once
+            exhaustive = 8 * ring > len(self.__cells) or \
+                2 * ring + 1 >= self.__columns
+            if exhaustive:
+                cells = [points for cell, points in self.__cells.items()
+                         if self.__ring_of(cell, row, column) >= ring]
+            else:
+                cells = self.__ring(row, column, ring)
+            for points in cells:
+                for key, point in points.items():
+                    entry = (-self.distance(latitude, longitude, *point), key)
+                    if len(best) < count:
+                        heapq.heappush(best, entry)
+                    elif entry > best[0]:
+                        heapq.heapreplace(best, entry)
+            if exhaustive or len(best) == count and -best[0][0] <= \
+                    self.__bound(latitude, longitude, row, column, ring):
+                break
+            ring += 1
+        return [key for _, key in sorted(best, reverse=True)]
+
+    def __bound(self, latitude, longitude, row, column, ring):
+        """Returns how close a point outside the visited rings can be, in km
+
+        A point outside differs from (latitude, longitude) by at least
+        the latitude or the longitude margin of the visited cells; the
+        longitude one is turned into the distance to that meridian.
+        """
+        size = self.__cell_size
+        latitude_margin = min(latitude - (row - ring) * size,
+                              (row + ring + 1) * size - latitude)
+        longitude_margin = min(longitude - (column - ring) * size,
+                               (column + ring + 1) * size - longitude)
+        return min(latitude_margin * self.km_per_degree,
+                   self.earth_radius * math.asin(
+                       math.cos(math.radians(latitude)) *
+                       math.sin(math.radians(min(longitude_margin, 90)))))
+
+    def __ring_of(self, cell, row, column):
+        """Returns the ring of cell around (row, column)"""
+        columns = abs(cell[1] - column) % self.__columns
+        return max(abs(cell[0] - row), min(columns, self.__columns - columns))
+
+    def __ring(self, row, column, ring):
+        """Yields the occupied cells at ring cells of (row, column)"""
+        cells = self.__cells
+        for cell_row in range(row - ring, row + ring + 1):
+            if ring == 0 or cell_row in (row - ring, row + ring):
+                cell_columns = range(column - ring, column + ring + 1)
+            else:
+                cell_columns = (column - ring, column + ring)
+            for cell_column in cell_columns:
+                points = cells.get((cell_row, self.__wrap(cell_column)))
+                if points:
+                    yield points
+
+    def __cells_in(self, south, west, north, east):
+        """Yields the occupied cells overlapping a bounding box"""
+        size = self.__cell_size
+        first_row, last_row = math.floor(south / size), math.floor(north / size)
+        first_column = math.floor(west / size)
+        last_column = min(math.floor(east / size),
+                          first_column + self.__columns - 1)
+        area = (last_row - first_row + 1) * (last_column - first_column + 1)
+        if area > len(self.__cells):
+            for (row, column), points in self.__cells.items():
+                if first_row <= row <= last_row and \
+                        first_column <= column <= last_column:
+                    yield points
+            return
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                points = self.__cells.get((row, self.__wrap(column)))
+                if points:
+                    yield points
+
+    def __cell_of(self, latitude, longitude):
+        """Returns the (row, column) of the cell holding a point"""
+        # the 180th meridian belongs to the last column
+        return (math.floor(latitude / self.__cell_size),
+                min(math.floor(longitude / self.__cell_size),
+                    self.__columns // 2 - 1))
+
+    def __wrap(self, column):
+        """Returns column moved around the globe into the valid columns"""
+        half = self.__columns // 2
+        return (column + half) % self.__columns - half
+
+    def __len__(self):
+        """Returns the number of indexed keys"""
+        return len(self.__points)
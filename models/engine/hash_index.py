@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+"""Module for CustomHashIndex class."""
+
+
+class CustomHashIndex:
+
+    """Class for looking up the keys of objects by an attribute value
+
+    Keys are grouped by value, so a lookup costs the size of its answer.
+    A unique index is one whose values must be checked with check before
+    they are added; add itself accepts duplicates, so that stored data
+    breaking the rule can still be indexed. Empty values ("" and None)
+    are never duplicates.
+    """
+
+    def __init__(self, unique=False):
+        """Initializes an empty index
+
+        Args:
+            - unique: if True, check raises ValueError for a value that
+              another key already holds
+        """
+        self.unique = unique
+        self.__buckets = {}
+        self.__values = {}
+
+    def accepts(self, value):
+        """Returns True if value can be indexed"""
+        return _hashable(value)
+
+    def check(self, key, value):
+        """Raises ValueError if key can't hold value in a unique index"""
+        if self.unique and value not in ("", None) and _hashable(value):
+            bucket = self.__buckets.get(value)
+            if bucket and key not in bucket:
+                raise ValueError("{} is already used".format(repr(value)))
+
+    def add(self, key, value):
+        """Records that the object of key holds value"""
+        if key in self.__values and self.__values[key] == value:
+            return
+        self.discard(key)
+        if _hashable(value):
+            self.__buckets.setdefault(value, {})[key] = None
+            self.__values[key] = value
+
+    def update(self, pairs):
+        """Adds the (key, value) pairs"""
+        for key, value in pairs:
+            self.add(key, value)
+
+    def discard(self, key):
+        """Forgets the value of key, if any"""
+        if key in self.__values:
+            value = self.__values.pop(key)
+            bucket = self.__buckets[value]
+            del bucket[key]
+            if not bucket:
+                del self.__buckets[value]
+
+    def lookup(self, value):
+        """Returns the list of keys holding value, in insertion order"""
+        if not _hashable(value):
+            return []
+        return list(self.__buckets.get(value, ()))
+
+    def __len__(self):
+        """Returns the number of indexed keys"""
+        return len(self.__values)
+
+
+def _hashable(value):
+    """Returns True if value can be a dictionary key"""
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
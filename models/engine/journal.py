@@ -0,0 +1,102 @@
+#!/usr/bin/python3
+"""Module for CustomJournal class."""
+import json
+import os
+
+
+class CustomJournal:
+
+    """Class for appending storage mutations to a log file
+
+    Every line of the log is one JSON record, either
+    {"op": "put", "key": <Class>.<id>, "value": <dict>} or
+    {"op": "delete", "key": <Class>.<id>}. While a checkpoint is being
+    written, the records it covers are moved to a rotated log next to
+    the current one.
+    """
+
+    def __init__(self, path):
+        """Initializes the journal
+
+        Args:
+            - path: path of the log file
+        """
+        self.__path = path
+        self.__rotated_path = path + ".1"
+
+    def append(self, records):
+        """Appends (op, key, value) records to the log in one write
+
+        The value of a put record is the JSON text of the object.
+        """
+        lines = []
+        for op, key, value in records:
+            if op == "put":
+                lines.append('{{"op": "put", "key": {}, "value": {}}}\n'.
+                             format(json.dumps(key), value))
+            else:
+                lines.append('{{"op": "delete", "key": {}}}\n'.
+                             format(json.dumps(key)))
+        if not lines:
+            return
+        with open(self.__path, "a", encoding="utf-8") as file:
+            file.write("".join(lines))
+            file.flush()
+            os.fsync(file.fileno())
+
+    def replay(self):
+        """Yields the (op, key, value) records of the rotated and current log
+
+        A torn record left by a crash is cut off the end of its log so
+        that the next append starts on a clean line.
+        """
+        for path in (self.__rotated_path, self.__path):
+            if not os.path.isfile(path):
+                continue
+            good_size = 0
+            with open(path, "rb") as file:
+                for line in file:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("Unterminated record")
+                        record = json.loads(line)
+                    except ValueError:
+                        # a torn write can only be the last line
+                        break
+                    good_size += len(line)
+                    yield record["op"], record["key"], record.get("value")
+            if good_size < os.path.getsize(path):
+                with open(path, "rb+") as file:
+                    file.truncate(good_size)
+
+    def size(self):
+        """Returns the number of bytes in the rotated and current log"""
+        return sum(os.path.getsize(path)
+                   for path in (self.__rotated_path, self.__path)
+                   if os.path.isfile(path))
+
+    def rotate(self):
+        """Moves the current log aside so that new records start a new log"""
+        if not os.path.isfile(self.__path):
+            return
+        if not os.path.isfile(self.__rotated_path):
+            os.replace(self.__path, self.__rotated_path)
+            return
+        # an interrupted checkpoint left a rotated log, keep its records
+        with open(self.__path, "rb") as src, \
+                open(self.__rotated_path, "ab") as dst:
+            dst.write(src.read())
+            dst.flush()
+            os.fsync(dst.fileno())
+        os.remove(self.__path)
+
+    def drop_rotated(self):
+        """Removes the rotated log once a checkpoint covers it"""
+        if os.path.isfile(self.__rotated_path):
+            os.remove(self.__rotated_path)
+
+    def truncate(self):
+        """Removes the logs once their records are part of the snapshot"""
+        for path in (self.__rotated_path, self.__path):
+            if os.path.isfile(path):
+                os.remove(path)
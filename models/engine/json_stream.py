@@ -0,0 +1,114 @@
+#!/usr/bin/python3
+"""Module for CustomJSONObjectReader class."""
+import json
+import re
+
+
+class CustomJSONObjectReader:
+
+    """Class for reading the members of a top-level JSON object one by one
+
+    The file is read in chunks, so only the member being decoded has to
+    be held in memory instead of the whole document.
+    """
+
+    __whitespace = re.compile(r"[ \t\n\r]*")
+    __simple_key = re.compile(r'[ \t\n\r]*"([^"\\]*)"[ \t\n\r]*:')
+    __delimiter = re.compile(r"[ \t\n\r]*([,}])")
+
+    def __init__(self, file, chunk_size=65536):
+        """Initializes the reader
+
+        Args:
+            - file: text file positioned at the start of the object
+            - chunk_size: number of characters read at a time
+        """
+        self.__file = file
+        self.__chunk_size = chunk_size
+        self.__decoder = json.JSONDecoder()
+        self.__buffer = ""
+        self.__pos = 0
+        self.__eof = False
+
+    def __iter__(self):
+        """Yields the (key, value) members of the object in file order"""
+        self.__expect("{")
+        if self.__peek() == "}":
+            return
+        while True:
+            # keys without escapes are matched directly in the buffer
+            match = self.__simple_key.match(self.__buffer, self.__pos)
+            if match:
+                key = match.group(1)
+                self.__pos = match.end()
+            else:
+                key = self.__decode()
+                self.__expect(":")
+            value = self.__decode()
+            yield key, value
+            match = self.__delimiter.match(self.__buffer, self.__pos)
+            if match:
+                char = match.group(1)
+                self.__pos = match.end()
+            else:
+                char = self.__next_char()
+            if char == "}":
+                return
+            if char != ",":
+                raise ValueError("Expecting ',' delimiter: offset {}".
+                                 format(self.__pos - 1))
+
+    def __fill(self, size):
+        """Appends up to size characters from the file to the buffer"""
+        if self.__pos > self.__chunk_size:
+            self.__buffer = self.__buffer[self.__pos:]
+            self.__pos = 0
+        data = self.__file.read(size)
+        if not data:
+            self.__eof = True
+        self.__buffer += data
+
+    def __peek(self):
+        """Returns the next non-whitespace character without consuming it"""
+        while True:
+            self.__pos = self.__whitespace.match(self.__buffer,
+                                                 self.__pos).end()
+            if self.__pos < len(self.__buffer):
+                return self.__buffer[self.__pos]
+            if self.__eof:
+                raise ValueError("Unexpected end of JSON object")
+            self.__fill(self.__chunk_size)
+
+    def __next_char(self):
+        """Consumes and returns the next non-whitespace character"""
+        char = self.__peek()
+        self.__pos += 1
+        return char
+
+    def __expect(self, expected):
+        """Consumes the next non-whitespace character, which must match"""
+        char = self.__next_char()
+        if char != expected:
+            raise ValueError("Expecting '{}': offset {}".
+                             format(expected, self.__pos - 1))
+
+    def __decode(self):
+        """Decodes the next JSON value, reading more of the file if needed"""
+        self.__pos = self.__whitespace.match(self.__buffer, self.__pos).end()
+        if self.__pos == len(self.__buffer):
+            self.__peek()
+        size = self.__chunk_size
+        while True:
+            try:
+                value, end = self.__decoder.raw_decode(self.__buffer,
+                                                       self.__pos)
+            except json.JSONDecodeError:
+                if self.__eof:
+                    raise
+            else:
+                # a value ending at the buffer end may be a cut number
+                if end < len(self.__buffer) or self.__eof:
+                    self.__pos = end
+                    return value
+            self.__fill(size)
+            size *= 2
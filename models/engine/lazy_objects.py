@@ -0,0 +1,71 @@
+#!/usr/bin/python3
+"""Module for CustomLazyObjects class."""
+
+
+class CustomLazyObjects(dict):
+
+    """Dictionary of objects that are built on first access
+
+    Values that are still raw, either records (plain dicts) or their
+    encoded bytes, are turned into instances by the loader the first
+    time they are looked up, so iterating over the keys or testing
+    membership builds nothing.
+    """
+
+    def __init__(self, records, loader, decoder=None):
+        """Initializes the dictionary
+
+        Args:
+            - records: dictionary of key to raw record, or to its bytes
+            - loader: callable taking (key, record) and returning
+              the instance for that record
+            - decoder: callable taking the bytes of a record and
+              returning the record, needed if records holds bytes
+        """
+        super().__init__(records)
+        self.__loader = loader
+        self.__decoder = decoder
+
+    def __getitem__(self, key):
+        """Returns the instance for key, building it if needed"""
+        value = super().__getitem__(key)
+        if type(value) in (dict, bytes):
+            value = self.__load(key, value)
+            super().__setitem__(key, value)
+        return value
+
+    def get(self, key, default=None):
+        """Returns the instance for key, or default if key is missing"""
+        if key in self:
+            return self[key]
+        return default
+
+    def pop(self, key, *default):
+        """Removes key and returns its instance"""
+        value = super().pop(key, *default)
+        if type(value) in (dict, bytes):
+            value = self.__load(key, value)
+        return value
+
+    def values(self):
+        """Returns the list of all instances, building the missing ones"""
+        return [self[key] for key in self]
+
+    def items(self):
+        """Returns the list of all (key, instance) pairs"""
+        return [(key, self[key]) for key in self]
+
+    def get_record(self, key):
+        """Returns the raw record of key, or None if it was built"""
+        value = super().get(key)
+        if type(value) is bytes:
+            return self.__decoder(value)
+        if type(value) is dict:
+            return value
+        return None
+
+    def __load(self, key, value):
+        """Returns the instance for the raw value of key"""
+        if type(value) is bytes:
+            value = self.__decoder(value)
+        return self.__loader(key, value)
@@ -0,0 +1,175 @@
+#!/usr/bin/python3
+"""Module for CustomQuery class."""
+import heapq
+from itertools import islice
+
+
+class CustomQuery:
+
+    """Class for filtering the stored objects of a class
+
+    Conditions are given to where as keyword arguments, name=value for
+    equality or name__op=value with op one of lt, le, gt, ge, in and
+    contains (the list attribute name holds value).
+    Calling where again adds conditions (all must hold). Iterating the
+    query yields the matching objects one by one: the planner asks the
+    storage's find_keys for the candidates of every condition an index
+    can answer, keeps the smallest set, and checks the other conditions
+    on those objects only. Without any usable index the class is scanned.
+    order_by and limit return the objects sorted by an attribute; when
+    nothing narrower is available they are read from the sorted index of
+    that attribute, so the first ones come without sorting the class.
+    include names relations (see get_valid_relations) to resolve for all
+    the yielded objects at once, in one pass per relation, before the
+    first one is yielded.
+    """
+
+    operators = {
+        "eq": lambda left, right: left == right,
+        "lt": lambda left, right: left < right,
+        "le": lambda left, right: left <= right,
+        "gt": lambda left, right: left > right,
+        "ge": lambda left, right: left >= right,
+        "in": lambda left, right: left in right,
+        "contains": lambda left, right: right in left,
+    }
+    __missing = object()
+
+    def __init__(self, storage, cls, conditions=(), order=None, limit=None,
+                 includes=()):
+        """Initializes the query
+
+        Args:
+            - storage: storage holding the objects
+            - cls: class, or class name, of the objects
+            - conditions: tuple of (name, op, value) conditions
+            - order: (name, reverse) to sort by, or None
+            - limit: maximum number of objects, or None
+            - includes: tuple of relations to prefetch
+        """
+        self.__storage = storage
+        self.__class_name = cls if isinstance(cls, str) else cls.__name__
+        self.__conditions = tuple(conditions)
+        self.__order = order
+        self.__limit = limit
+        self.__includes = tuple(includes)
+
+    def where(self, **conditions):
+        """Returns a new query also requiring conditions"""
+        added = []
+        for name, value in conditions.items():
+            attribute, _, op = name.rpartition("__")
+            if not attribute or op not in self.operators:
+                attribute, op = name, "eq"
+            if op == "in":
+                value = tuple(value)
+            added.append((attribute, op, value))
+        return CustomQuery(self.__storage, self.__class_name,
+                           self.__conditions + tuple(added),
+                           self.__order, self.__limit, self.__includes)
+
+    def order_by(self, name, reverse=False):
+        """Returns a new query sorted by attribute name
+
+        Objects without a value for name are left out.
+        """
+        return CustomQuery(self.__storage, self.__class_name,
+                           self.__conditions + ((name, "has", None),),
+                           (name, reverse), self.__limit, self.__includes)
+
+    def limit(self, count):
+        """Returns a new query yielding at most count objects"""
+        return CustomQuery(self.__storage, self.__class_name,
+                           self.__conditions, self.__order, count,
+                           self.__includes)
+
+    def include(self, *names):
+        """Returns a new query prefetching the relations names
+
+        A name may be a dotted path, like "reviews.user" to also read
+        the user of every review.
+        """
+        return CustomQuery(self.__storage, self.__class_name,
+                           self.__conditions, self.__order, self.__limit,
+                           self.__includes + names)
+
+    def explain(self):
+        """Returns the plan: ("index", name, op) or ("scan", None, None)
+
+        op is "order" when the objects are read in the order of the
+        sorted index of name.
+        """
+        return self.__plan()[0]
+
+    def __plan(self):
+        """Returns the plan and the candidate keys, None for a scan"""
+        best = (("scan", None, None), None)
+        for name, op, value in self.__conditions:
+            if op == "has":
+                continue
+            keys = self.__storage.find_keys(self.__class_name, name, op, value)
+            if keys is not None and (best[1] is None or
+                                     len(keys) < len(best[1])):
+                best = (("index", name, op), keys)
+        if best[1] is None and self.__order is not None:
+            name, reverse = self.__order
+            keys = self.__storage.find_sorted_keys(self.__class_name, name,
+                                                   reverse)
+            if keys is not None:
+                best = (("index", name, "order"), keys)
+        return best
+
+    def __matches(self, obj):
+        """Returns True if obj meets every condition"""
+        for name, op, value in self.__conditions:
+            attribute = getattr(obj, name, self.__missing)
+            if attribute is self.__missing:
+                return False
+            if op == "has":
+                continue
+            try:
+                if not self.operators[op](attribute, value):
+                    return False
+            except TypeError:
+                return False
+        return True
+
+    def __iter__(self):
+        """Yields the matching objects"""
+        plan, keys = self.__plan()
+        if keys is None:
+            candidates = self.__storage.get_objects_by_class(self.__class_name)
+        else:
+            candidates = self.__objects_of(keys)
+        matches = (obj for obj in candidates if self.__matches(obj))
+        if self.__order is not None and plan[2] != "order":
+            name, reverse = self.__order
+            key = lambda obj: getattr(obj, name)
+            if self.__limit is None:
+                matches = iter(sorted(matches, key=key, reverse=reverse))
+            elif reverse:
+                matches = iter(heapq.nlargest(self.__limit, matches, key))
+            else:
+                matches = iter(heapq.nsmallest(self.__limit, matches, key))
+        if not self.__includes:
+            yield from islice(matches, self.__limit)
+            return
+        matches = list(islice(matches, self.__limit))
+        self.__storage.prefetch_related(matches, *self.__includes)
+        yield from matches
+
+    def __objects_of(self, keys):
+        """Yields the objects of keys that are still stored"""
+        objects = self.__storage.get_all_objects()
+        for key in keys:
+            obj = objects.get(key)
+            if obj is not None:
+                yield obj
+
+    def first(self):
+        """Returns the first matching object, or None"""
+        return next(iter(self), None)
+
+    def count(self):
+        """Returns the number of matching objects"""
+        return sum(1 for _ in self)
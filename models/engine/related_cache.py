@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+"""Module for CustomRelatedCache class."""
+import threading
+import weakref
+from models.engine.relation import CustomRelation
+
+
+class CustomRelatedCache:
+
+    """Class for keeping the related objects read ahead by a query
+
+    prefetch resolves a relation for many objects at once and keeps the
+    result of each object until the storage changes: the storage calls
+    invalidate on every change, so a cached relation never differs from
+    what get_related would look up. Entries go away with their objects.
+    """
+
+    def __init__(self):
+        """Initializes an empty cache"""
+        self.__entries = weakref.WeakKeyDictionary()
+        self.__generation = 0
+        self.__lock = threading.Lock()
+
+    def invalidate(self):
+        """Forgets every cached relation"""
+        with self.__lock:
+            self.__generation += 1
+            if self.__entries:
+                self.__entries.clear()
+
+    def get(self, obj, name, default=None):
+        """Returns the cached relation name of obj, or default"""
+        entry = self.__entries.get(obj)
+        if entry is None:
+            return default
+        return entry.get(name, default)
+
+    def prefetch(self, storage, objects, paths):
+        """Resolves and caches the relations of objects named by paths
+
+        Args:
+            - storage: storage holding the objects
+            - objects: objects owning the relations
+            - paths: relation names; "reviews.user" also prefetches the
+              user of every review
+        """
+        for path in paths:
+            owners = list(objects)
+            for name in path.split("."):
+                generation = self.__generation
+                related = CustomRelation.prefetch(storage, owners, name)
+                with self.__lock:
+                    if generation != self.__generation:
+                        # the storage changed while the relation was read
+                        return
+                    for obj, value in related.items():
+                        self.__entries.setdefault(obj, {})[name] = value
+                owners = []
+                for value in related.values():
+                    if isinstance(value, CustomRelation):
+                        owners.extend(value)
+                    elif value is not None:
+                        owners.append(value)
+
+    def __len__(self):
+        """Returns the number of objects with cached relations"""
+        return len(self.__entries)
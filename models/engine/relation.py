@@ -0,0 +1,165 @@
+#!/usr/bin/python3
+"""Module for CustomRelation class."""
+
+
+class CustomRelation:
+
+    """Class for the lazy view of the objects related to an object
+
+    The view holds the objects of class_name whose attribute name (a
+    foreign key) is value. Nothing is looked up until the view is
+    iterated or measured, and then only through the index of name, so
+    the cost is the size of the answer. The view follows later changes
+    of the storage, unless it was built by prefetch with its keys.
+    """
+
+    def __init__(self, storage, class_name, name, value, keys=None):
+        """Initializes the view
+
+        Args:
+            - storage: storage holding the objects
+            - class_name: class of the related objects
+            - name: foreign key of the related objects
+            - value: foreign key value, the id of the owning object
+            - keys: keys of the related objects if already known
+        """
+        self.__storage = storage
+        self.__class_name = class_name
+        self.__name = name
+        self.__value = value
+        self.__keys = keys
+
+    @classmethod
+    def resolve(cls, storage, obj, name):
+        """Returns the objects related to obj by the relation name
+
+        A "one" relation returns the object, or None; a "many" relation
+        returns the view of the objects.
+        """
+        class_name, key_name, kind = \
+            storage.get_valid_relations()[type(obj).__name__][name]
+        if kind == "many":
+            return cls(storage, class_name, key_name, obj.id)
+        return storage.get_all_objects().get("{}.{}".format(
+            class_name, getattr(obj, key_name, None)))
+
+    @classmethod
+    def prefetch(cls, storage, objects, name):
+        """Returns the dictionary of each of objects to its relation name
+
+        The foreign keys of all objects are looked up at once: one pass
+        over the index of a "many" relation instead of one per object.
+        """
+        groups = {}
+        for obj in objects:
+            groups.setdefault(type(obj).__name__, []).append(obj)
+        stored = storage.get_all_objects()
+        related = {}
+        for owner_name, owners in groups.items():
+            class_name, key_name, kind = \
+                storage.get_valid_relations()[owner_name][name]
+            if kind == "one":
+                for obj in owners:
+                    related[obj] = stored.get("{}.{}".format(
+                        class_name, getattr(obj, key_name, None)))
+                continue
+            ids = tuple({obj.id: None for obj in owners})
+            keys = storage.find_keys(class_name, key_name, "in", ids)
+            if keys is None:
+                ids = set(ids)
+                keys = ["{}.{}".format(class_name, item.id) for item in
+                        storage.get_objects_by_class(class_name)
+                        if getattr(item, key_name, None) in ids]
+            grouped = {}
+            for key in keys:
+                item = stored.get(key)
+                if item is not None:
+                    grouped.setdefault(getattr(item, key_name, None),
+                                       []).append(key)
+            for obj in owners:
+                related[obj] = cls(storage, class_name, key_name, obj.id,
+                                   grouped.get(obj.id, []))
+        return related
+
+    @classmethod
+    def cascade(cls, storage, obj):
+        """Returns obj and the objects to delete with it, parents first
+
+        The "cascade" relations of get_delete_policies are followed level
+        by level, each level in one prefetch per relation. Raises
+        ValueError if a "restrict" relation still holds an object that
+        is not deleted too.
+        """
+        policies = storage.get_delete_policies()
+        doomed = {"{}.{}".format(type(obj).__name__, obj.id): obj}
+        restricted = []
+        level = [obj]
+        while level:
+            groups = {}
+            for owner in level:
+                groups.setdefault(type(owner).__name__, []).append(owner)
+            level = []
+            for owner_name, owners in groups.items():
+                for name, policy in policies.get(owner_name, {}).items():
+                    related = cls.prefetch(storage, owners, name)
+                    for owner, view in related.items():
+                        if policy == "restrict":
+                            restricted.extend((owner, name, key)
+                                              for key in view.keys())
+                            continue
+                        for item in view:
+                            key = "{}.{}".format(type(item).__name__,
+                                                 item.id)
+                            if key not in doomed:
+                                doomed[key] = item
+                                level.append(item)
+        for owner, name, key in restricted:
+            if key not in doomed:
+                raise ValueError("{} {} still has {}".format(
+                    type(owner).__name__, owner.id, name))
+        return list(doomed.values())
+
+    def keys(self):
+        """Returns the list of keys of the related objects"""
+        if self.__keys is not None:
+            return list(self.__keys)
+        keys = self.__storage.find_keys(self.__class_name, self.__name,
+                                        "eq", self.__value)
+        if keys is None:
+            keys = ["{}.{}".format(self.__class_name, obj.id)
+                    for obj in self]
+        return keys
+
+    def query(self):
+        """Returns a CustomQuery over the related objects"""
+        return self.__storage.query(self.__class_name).where(
+            **{self.__name: self.__value})
+
+    def __iter__(self):
+        """Yields the related objects"""
+        if self.__keys is None:
+            yield from self.__storage.get_objects_by_attribute(
+                self.__class_name, self.__name, self.__value)
+            return
+        stored = self.__storage.get_all_objects()
+        for key in self.__keys:
+            obj = stored.get(key)
+            if obj is not None:
+                yield obj
+
+    def __len__(self):
+        """Returns the number of related objects"""
+        return len(self.keys())
+
+    def __contains__(self, obj):
+        """Returns True if obj is one of the related objects"""
+        key = "{}.{}".format(type(obj).__name__, getattr(obj, "id", None))
+        return type(obj).__name__ == self.__class_name and \
+            getattr(obj, self.__name, None) == self.__value and \
+            self.__storage.get_all_objects().get(key) is obj
+
+    def __repr__(self):
+        """Returns the string representation of the view"""
+        return "<{} {}.{} == {}>".format(type(self).__name__,
+                                         self.__class_name, self.__name,
+                                         repr(self.__value))
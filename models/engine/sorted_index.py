@@ -0,0 +1,102 @@
+#!/usr/bin/python3
+"""Module for CustomSortedIndex class."""
+import bisect
+from itertools import islice
+from numbers import Real
+from operator import itemgetter
+
+
+class CustomSortedIndex:
+
+    """Class for looking up the keys of objects by a range of numbers
+
+    The (value, key) pairs are kept in a list sorted with bisect, so a
+    range costs a binary search plus the size of its answer, and the
+    smallest or largest values are read from either end without sorting.
+    Values that are not real numbers (or are NaN) are not indexed.
+    """
+
+    __value = itemgetter(0)
+
+    def __init__(self):
+        """Initializes an empty index"""
+        self.__entries = []
+        self.__values = {}
+
+    def accepts(self, value):
+        """Returns True if value can be indexed"""
+        return _indexable(value)
+
+    def check(self, key, value):
+        """Does nothing: a sorted index accepts any value"""
+        pass
+
+    def add(self, key, value):
+        """Records that the object of key holds value"""
+        if key in self.__values and self.__values[key] == value:
+            return
+        self.discard(key)
+        if _indexable(value):
+            bisect.insort(self.__entries, (value, key))
+            self.__values[key] = value
+
+    def update(self, pairs):
+        """Adds the (key, value) pairs, sorting once if the index is empty"""
+        if self.__values:
+            for key, value in pairs:
+                self.add(key, value)
+            return
+        for key, value in pairs:
+            if _indexable(value):
+                self.__values[key] = value
+        self.__entries = sorted((value, key)
+                                for key, value in self.__values.items())
+
+    def discard(self, key):
+        """Forgets the value of key, if any"""
+        if key in self.__values:
+            entry = (self.__values.pop(key), key)
+            del self.__entries[bisect.bisect_left(self.__entries, entry)]
+
+    def lookup(self, value):
+        """Returns the list of keys holding value, in key order"""
+        return list(self.range(value, value))
+
+    def range(self, low=None, high=None, include_low=True,
+              include_high=True, reverse=False):
+        """Yields the keys whose value is between low and high, in order
+
+        Args:
+            - low: smallest value, None for no lower bound
+            - high: largest value, None for no upper bound
+            - include_low: if False, low itself is excluded
+            - include_high: if False, high itself is excluded
+            - reverse: if True, yields the largest values first
+        """
+        entries = self.__entries
+        start, stop = 0, len(entries)
+        if low is not None:
+            find = bisect.bisect_left if include_low else bisect.bisect_right
+            start = find(entries, low, key=self.__value)
+        if high is not None:
+            find = bisect.bisect_right if include_high else bisect.bisect_left
+            stop = find(entries, high, key=self.__value)
+        positions = range(stop - 1, start - 1, -1) if reverse \
+            else range(start, stop)
+        for position in positions:
+            # entries may shrink while the caller consumes the keys
+            if position < len(entries):
+                yield entries[position][1]
+
+    def first(self, count, reverse=False):
+        """Returns the keys of the count smallest (or largest) values"""
+        return list(islice(self.range(reverse=reverse), count))
+
+    def __len__(self):
+        """Returns the number of indexed keys"""
+        return len(self.__values)
+
+
+def _indexable(value):
+    """Returns True if value is a real number other than NaN"""
+    return isinstance(value, Real) and value == value
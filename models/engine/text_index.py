@@ -0,0 +1,149 @@
+#!/usr/bin/python3
+"""Module for CustomTextIndex class."""
+import heapq
+import math
+import re
+from collections import Counter
+from operator import itemgetter
+
+
+class CustomTextIndex:
+
+    """Class for searching the keys of objects by the words of a text
+
+    Texts are split into lowercase word tokens; each token has a posting
+    list mapping the keys whose text holds it to the number of times it
+    does. search ranks the keys holding any of the query words with BM25.
+    """
+
+    k1 = 1.2
+    b = 0.75
+    __word = re.compile(r"\w+")
+
+    def __init__(self):
+        """Initializes an empty index"""
+        self.__postings = {}
+        self.__lengths = {}
+        self.__terms = {}
+        self.__texts = {}
+        self.__total = 0
+
+    @classmethod
+    def tokenize(cls, text):
+        """Returns the list of lowercase words of text"""
+        return cls.__word.findall(text.lower())
+
+    def accepts(self, value):
+        """Returns True if value can be indexed"""
+        return isinstance(value, str)
+
+    def check(self, key, value):
+        """Does nothing: a text index accepts any value"""
+        pass
+
+    def add(self, key, value):
+        """Records that the object of key holds the text value"""
+        if key in self.__texts and self.__texts[key] == value:
+            return
+        self.discard(key)
+        if not self.accepts(value):
+            return
+        counts = Counter(self.tokenize(value))
+        self.__texts[key] = value
+        if not counts:
+            return
+        for term, count in counts.items():
+            self.__postings.setdefault(term, {})[key] = count
+        length = sum(counts.values())
+        self.__lengths[key] = length
+        self.__terms[key] = tuple(counts)
+        self.__total += length
+
+    def update(self, pairs):
+        """Adds the (key, value) pairs, new keys without going through add"""
+        postings, lengths, terms = self.__postings, self.__lengths, self.__terms
+        texts = self.__texts
+        findall = self.__word.findall
+        total = 0
+        for key, value in pairs:
+            if key in texts or key in terms or type(value) is not str:
+                self.add(key, value)
+                continue
+            texts[key] = value
+            counts = Counter(findall(value.lower()))
+            if not counts:
+                continue
+            for term, count in counts.items():
+                posting = postings.get(term)
+                if posting is None:
+                    postings[term] = {key: count}
+                else:
+                    posting[key] = count
+            length = sum(counts.values())
+            lengths[key] = length
+            terms[key] = tuple(counts)
+            total += length
+        self.__total += total
+
+    def discard(self, key):
+        """Forgets the text of key, if any"""
+        self.__texts.pop(key, None)
+        if key not in self.__lengths:
+            return
+        for term in self.__terms.pop(key):
+            posting = self.__postings[term]
+            del posting[key]
+            if not posting:
+                del self.__postings[term]
+        self.__total -= self.__lengths.pop(key)
+
+    def scores(self, text):
+        """Returns the dictionary of key to BM25 score for the words of text"""
+        count = len(self.__lengths)
+        if not count:
+            return {}
+        average = self.__total / count
+        lengths = self.__lengths
+        k1, b = self.k1, self.b
+        scores = {}
+        for term in set(self.tokenize(text)):
+            posting = self.__postings.get(term)
+            if not posting:
+                continue
+            idf = math.log(1 + (count - len(posting) + 0.5) /
+                           (len(posting) + 0.5))
+            for key, frequency in posting.items():
+                norm = k1 * (1 - b + b * lengths[key] / average)
+                scores[key] = scores.get(key, 0.0) + \
+                    idf * frequency * (k1 + 1) / (frequency + norm)
+        return scores
+
+    def search(self, text, limit=None):
+        """Returns the keys matching the words of text, best first"""
+        return self.rank(self.scores(text), limit)
+
+    @staticmethod
+    def rank(scores, limit=None):
+        """Returns the keys of scores sorted by decreasing score"""
+        if limit is None:
+            ranked = sorted(scores.items(), key=lambda item: (-item[1],
+                                                              item[0]))
+        else:
+            ranked = heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+        return [key for key, _ in ranked]
+
+    def dump(self):
+        """Returns the postings and lengths as plain dicts and tuples"""
+        return (self.__postings, self.__lengths, self.__terms)
+
+    @classmethod
+    def load(cls, data):
+        """Returns the index holding data, as returned by dump"""
+        index = cls()
+        index.__postings, index.__lengths, index.__terms = data
+        index.__total = sum(index.__lengths.values())
+        return index
+
+    def __len__(self):
+        """Returns the number of indexed texts"""
+        return len(self.__lengths)
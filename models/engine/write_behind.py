@@ -0,0 +1,66 @@
+#!/usr/bin/python3
+"""Module for CustomWriteBehind class."""
+import threading
+import traceback
+
+
+class CustomWriteBehind:
+
+    """Class for flushing storage changes from a background thread
+
+    The thread calls flush every interval seconds, or as soon as the
+    number of changed objects reaches threshold. A failed flush is
+    reported and the thread goes on, the next request trying again.
+    """
+
+    def __init__(self, flush, interval, threshold):
+        """Initializes and starts the flusher
+
+        Args:
+            - flush: callable writing the pending changes
+            - interval: seconds between two flushes, 0 for no timer
+            - threshold: number of changed objects triggering a flush,
+              0 for no threshold
+        """
+        self.__flush = flush
+        self.__interval = interval or None
+        self.__threshold = threshold
+        self.__changes = 0
+        self.__stopped = False
+        self.__condition = threading.Condition()
+        self.__thread = threading.Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+    def request(self, changes):
+        """Records that changes objects are waiting to be written"""
+        with self.__condition:
+            self.__changes = changes
+            if self.__full():
+                self.__condition.notify()
+
+    def stop(self):
+        """Stops the thread without flushing"""
+        with self.__condition:
+            self.__stopped = True
+            self.__condition.notify()
+        self.__thread.join()
+
+    def __full(self):
+        """Returns True if the changes reached the threshold"""
+        return self.__stopped or (bool(self.__threshold) and
+                                  self.__changes >= self.__threshold)
+
+    def __run(self):
+        """Flushes the pending changes until stopped"""
+        while True:
+            with self.__condition:
+                self.__condition.wait_for(self.__full, self.__interval)
+                if self.__stopped:
+                    return
+                changes = self.__changes
+                self.__changes = 0
+            if changes:
+                try:
+                    self.__flush()
+                except Exception:
+                    traceback.print_exc()
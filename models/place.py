@@ -1,6 +1,7 @@
 #!/usr/bin/python3
 """This module creates a Place class"""
 
+from models import storage
 from models.base_model import BaseModel
 
 
@@ -18,3 +19,18 @@ class Place(BaseModel):
     latitude = 0.0
     longitude = 0.0
     amenity_ids = []
+
+    @property
+    def city(self):
+        """Returns the city of the place, or None"""
+        return storage.get_related(self, "city")
+
+    @property
+    def user(self):
+        """Returns the user owning the place, or None"""
+        return storage.get_related(self, "user")
+
+    @property
+    def reviews(self):
+        """Returns the lazy view of the reviews of the place"""
+        return storage.get_related(self, "reviews")
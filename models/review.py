@@ -1,6 +1,7 @@
 #!/usr/bin/python3
 """This module creates a Review class"""
 
+from models import storage
 from models.base_model import BaseModel
 
 
@@ -10,3 +11,13 @@ class Review(BaseModel):
     place_id = ""
     user_id = ""
     text = ""
+
+    @property
+    def place(self):
+        """Returns the reviewed place, or None"""
+        return storage.get_related(self, "place")
+
+    @property
+    def user(self):
+        """Returns the user who wrote the review, or None"""
+        return storage.get_related(self, "user")
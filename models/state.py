@@ -1,6 +1,7 @@
 #!/usr/bin/python3
 """This module creates a User class"""
 
+from models import storage
 from models.base_model import BaseModel
 
 
@@ -8,3 +9,8 @@ class State(BaseModel):
     """Class for managing state objects"""
 
     name = ""
+
+    @property
+    def cities(self):
+        """Returns the lazy view of the cities of the state"""
+        return storage.get_related(self, "cities")
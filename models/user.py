@@ -1,5 +1,6 @@
 #!/usr/bin/python3
 """This module creates a User class"""
+from models import storage
 from models.base_model import BaseModel
 
 
@@ -10,3 +11,13 @@ class User(BaseModel):
     password = ""
     first_name = ""
     last_name = ""
+
+    @property
+    def places(self):
+        """Returns the lazy view of the places of the user"""
+        return storage.get_related(self, "places")
+
+    @property
+    def reviews(self):
+        """Returns the lazy view of the reviews of the user"""
+        return storage.get_related(self, "reviews")
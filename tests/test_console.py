@@ -2,752 +2,856 @@
 """Defines unittests for console.py.
 
 Unittest classes:
-    TestHBNBCommand_prompting
-    TestHBNBCommand_help
-    TestHBNBCommand_exit
-    TestHBNBCommand_create
-    TestHBNBCommand_show
-    TestHBNBCommand_all
-    TestHBNBCommand_destroy
-    TestHBNBCommand_update
+    TestCustomCommandInterpreter_prompting
+    TestCustomCommandInterpreter_help
+    TestCustomCommandInterpreter_exit
+    TestCustomCommandInterpreter_create
+    TestCustomCommandInterpreter_show
+    TestCustomCommandInterpreter_all
+    TestCustomCommandInterpreter_destroy
+    TestCustomCommandInterpreter_update
+    TestCustomCommandInterpreter_count
+    TestCustomCommandInterpreter_class_index
+    TestCustomCommandInterpreter_geo
+    TestCustomCommandInterpreter_search
+    TestCustomCommandInterpreter_cascade
+    TestCustomCommandInterpreter_script
 """
 import os
+import re
+import subprocess
 import sys
 import unittest
 from models import storage
-from models.engine.file_storage import FileStorage
-from console import HBNBCommand
+from models.engine.file_storage import CustomFileStorage
+from console import CustomCommandInterpreter
+from models.city import City
+from models.place import Place
+from models.review import Review
+from models.state import State
+from models.user import User
 from io import StringIO
 from unittest.mock import patch
 
 
-class TestHBNBCommand_prompting(unittest.TestCase):
-    """Unittests for testing prompting of the HBNB command interpreter."""
+class TestCustomCommandInterpreter_prompting(unittest.TestCase):
+    """Unittests for testing prompting of the custom command interpreter."""
 
     def test_prompt_string(self):
-        self.assertEqual("(hbnb) ", HBNBCommand.prompt)
+        self.assertEqual("(custom_cmd) ", CustomCommandInterpreter.prompt)
 
     def test_empty_line(self):
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd(""))
+            self.assertFalse(CustomCommandInterpreter().onecmd(""))
             self.assertEqual("", output.getvalue().strip())
 
 
-class TestHBNBCommand_help(unittest.TestCase):
-    """Unittests for testing help messages of the HBNB command interpreter."""
+class TestCustomCommandInterpreter_help(unittest.TestCase):
+    """Unittests for testing help of the custom command interpreter."""
 
-    def test_help_quit(self):
-        h = "Quit command to exit the program."
+    def help(self, topic):
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("help quit"))
-            self.assertEqual(h, output.getvalue().strip())
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "help " + topic))
+        return output.getvalue().strip()
+
+    def test_help_exit(self):
+        self.assertEqual("Exits the program.", self.help("exit"))
 
     def test_help_create(self):
-        h = ("Usage: create <class>\n        "
-             "Create a new class instance and print its id.")
-        with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("help create"))
-            self.assertEqual(h, output.getvalue().strip())
+        self.assertEqual("Creates an instance.",
+                         self.help("create_instance"))
 
     def test_help_EOF(self):
-        h = "EOF signal to exit the program."
-        with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("help EOF"))
-            self.assertEqual(h, output.getvalue().strip())
+        self.assertEqual("Handles End Of File character.", self.help("EOF"))
 
     def test_help_show(self):
-        h = ("Usage: show <class> <id> or <class>.show(<id>)\n        "
-             "Display the string representation of a class instance of"
-             " a given id.")
-        with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("help show"))
-            self.assertEqual(h, output.getvalue().strip())
+        self.assertEqual("Prints the string representation of an instance.",
+                         self.help("show_instance"))
 
     def test_help_destroy(self):
-        h = ("Usage: destroy <class> <id> or <class>.destroy(<id>)\n        "
-             "Delete a class instance of a given id.")
-        with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("help destroy"))
-            self.assertEqual(h, output.getvalue().strip())
+        self.assertIn("Deletes an instance", self.help("destroy_instance"))
 
     def test_help_all(self):
-        h = ("Usage: all or all <class> or <class>.all()\n        "
-             "Display string representations of all instances of a given class"
-             ".\n        If no class is specified, displays all instantiated "
-             "objects.")
-        with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("help all"))
-            self.assertEqual(h, output.getvalue().strip())
+        self.assertEqual(
+            "Prints all string representations of all instances.",
+            self.help("list_all_instances"))
 
     def test_help_count(self):
-        h = ("Usage: count <class> or <class>.count()\n        "
-             "Retrieve the number of instances of a given class.")
-        with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("help count"))
-            self.assertEqual(h, output.getvalue().strip())
+        self.assertEqual("Counts the instances of a class.",
+                         self.help("count_instances"))
 
     def test_help_update(self):
-        h = ("Usage: update <class> <id> <attribute_name> <attribute_value> or"
-             "\n       <class>.update(<id>, <attribute_name>, <attribute_value"
-             ">) or\n       <class>.update(<id>, <dictionary>)\n        "
-             "Update a class instance of a given id by adding or updating\n   "
-             "     a given attribute key/value pair or dictionary.")
-        with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("help update"))
-            self.assertEqual(h, output.getvalue().strip())
+        self.assertEqual(
+            "Updates an instance by adding or updating attribute.",
+            self.help("update_instance"))
 
     def test_help(self):
-        h = ("Documented commands (type help <topic>):\n"
-             "========================================\n"
-             "EOF  all  count  create  destroy  help  quit  show  update")
-        with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("help"))
-            self.assertEqual(h, output.getvalue().strip())
+        h = self.help("")
+        self.assertIn("Documented commands (type help <topic>):", h)
+        for command in ("EOF", "count_instances", "create_instance",
+                        "destroy_instance", "exit", "help",
+                        "list_all_instances", "show_instance",
+                        "update_instance"):
+            self.assertIn(command, h.split())
 
 
-class TestHBNBCommand_exit(unittest.TestCase):
-    """Unittests for testing exiting from the HBNB command interpreter."""
+class TestCustomCommandInterpreter_exit(unittest.TestCase):
+    """Unittests for testing exiting from the custom command interpreter."""
 
-    def test_quit_exits(self):
+    def test_exit_exits(self):
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertTrue(HBNBCommand().onecmd("quit"))
+            self.assertTrue(CustomCommandInterpreter().onecmd("exit"))
 
     def test_EOF_exits(self):
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertTrue(HBNBCommand().onecmd("EOF"))
+            self.assertTrue(CustomCommandInterpreter().onecmd("EOF"))
 
 
-class TestHBNBCommand_create(unittest.TestCase):
-    """Unittests for testing create from the HBNB command interpreter."""
+class TestCustomCommandInterpreter_create(unittest.TestCase):
+    """Unittests for testing create from the custom command interpreter."""
 
     @classmethod
     def setUp(self):
         try:
-            os.rename("file.json", "tmp")
+            os.rename("custom_file.json", "tmp")
         except IOError:
             pass
-        FileStorage.__objects = {}
+        CustomFileStorage._CustomFileStorage__objects = {}
 
     @classmethod
     def tearDown(self):
         try:
-            os.remove("file.json")
+            os.remove("custom_file.json")
         except IOError:
             pass
         try:
-            os.rename("tmp", "file.json")
+            os.rename("tmp", "custom_file.json")
         except IOError:
             pass
 
     def test_create_missing_class(self):
         correct = "** class name missing **"
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance"))
             self.assertEqual(correct, output.getvalue().strip())
 
     def test_create_invalid_class(self):
         correct = "** class doesn't exist **"
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create MyModel"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance MyModel"))
             self.assertEqual(correct, output.getvalue().strip())
 
-    def test_create_invalid_syntax(self):
-        correct = "*** Unknown syntax: MyModel.create()"
+    def test_create_dot_notation(self):
+        correct = "** class doesn't exist **"
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("MyModel.create()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "MyModel.create_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
-        correct = "*** Unknown syntax: BaseModel.create()"
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("BaseModel.create()"))
-            self.assertEqual(correct, output.getvalue().strip())
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "BaseModel.create_instance()"))
+            testKey = "BaseModel.{}".format(output.getvalue().strip())
+            self.assertIn(testKey, storage.get_all_objects().keys())
 
     def test_create_object(self):
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create BaseModel"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance BaseModel"))
             self.assertLess(0, len(output.getvalue().strip()))
             testKey = "BaseModel.{}".format(output.getvalue().strip())
-            self.assertIn(testKey, storage.all().keys())
+            self.assertIn(testKey, storage.get_all_objects().keys())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create User"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance User"))
             self.assertLess(0, len(output.getvalue().strip()))
             testKey = "User.{}".format(output.getvalue().strip())
-            self.assertIn(testKey, storage.all().keys())
+            self.assertIn(testKey, storage.get_all_objects().keys())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create State"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance State"))
             self.assertLess(0, len(output.getvalue().strip()))
             testKey = "State.{}".format(output.getvalue().strip())
-            self.assertIn(testKey, storage.all().keys())
+            self.assertIn(testKey, storage.get_all_objects().keys())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create City"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance City"))
             self.assertLess(0, len(output.getvalue().strip()))
             testKey = "City.{}".format(output.getvalue().strip())
-            self.assertIn(testKey, storage.all().keys())
+            self.assertIn(testKey, storage.get_all_objects().keys())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create Amenity"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Amenity"))
             self.assertLess(0, len(output.getvalue().strip()))
             testKey = "Amenity.{}".format(output.getvalue().strip())
-            self.assertIn(testKey, storage.all().keys())
+            self.assertIn(testKey, storage.get_all_objects().keys())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create Place"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Place"))
             self.assertLess(0, len(output.getvalue().strip()))
             testKey = "Place.{}".format(output.getvalue().strip())
-            self.assertIn(testKey, storage.all().keys())
+            self.assertIn(testKey, storage.get_all_objects().keys())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create Review"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Review"))
             self.assertLess(0, len(output.getvalue().strip()))
             testKey = "Review.{}".format(output.getvalue().strip())
-            self.assertIn(testKey, storage.all().keys())
+            self.assertIn(testKey, storage.get_all_objects().keys())
 
 
-class TestHBNBCommand_show(unittest.TestCase):
-    """Unittests for testing show from the HBNB command interpreter"""
+class TestCustomCommandInterpreter_show(unittest.TestCase):
+    """Unittests for testing show from the custom command interpreter"""
 
     @classmethod
     def setUp(self):
         try:
-            os.rename("file.json", "tmp")
+            os.rename("custom_file.json", "tmp")
         except IOError:
             pass
-        FileStorage.__objects = {}
+        CustomFileStorage._CustomFileStorage__objects = {}
 
     @classmethod
     def tearDown(self):
         try:
-            os.remove("file.json")
+            os.remove("custom_file.json")
         except IOError:
             pass
         try:
-            os.rename("tmp", "file.json")
+            os.rename("tmp", "custom_file.json")
         except IOError:
             pass
 
     def test_show_missing_class(self):
         correct = "** class name missing **"
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("show"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "show_instance"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd(".show()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                ".show_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
 
     def test_show_invalid_class(self):
         correct = "** class doesn't exist **"
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("show MyModel"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "show_instance MyModel"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("MyModel.show()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "MyModel.show_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
 
     def test_show_missing_id_space_notation(self):
         correct = "** instance id missing **"
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("show BaseModel"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "show_instance BaseModel"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("show User"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "show_instance User"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("show State"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "show_instance State"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("show City"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "show_instance City"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("show Amenity"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "show_instance Amenity"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("show Place"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "show_instance Place"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("show Review"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "show_instance Review"))
             self.assertEqual(correct, output.getvalue().strip())
 
     def test_show_missing_id_dot_notation(self):
         correct = "** instance id missing **"
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("BaseModel.show()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "BaseModel.show_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("User.show()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "User.show_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("State.show()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "State.show_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("City.show()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "City.show_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("Amenity.show()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "Amenity.show_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("Place.show()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "Place.show_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("Review.show()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "Review.show_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
 
     def test_show_no_instance_found_space_notation(self):
         correct = "** no instance found **"
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("show BaseModel 1"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "show_instance BaseModel 1"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("show User 1"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "show_instance User 1"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("show State 1"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "show_instance State 1"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("show City 1"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "show_instance City 1"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("show Amenity 1"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "show_instance Amenity 1"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("show Place 1"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "show_instance Place 1"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("show Review 1"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "show_instance Review 1"))
             self.assertEqual(correct, output.getvalue().strip())
 
     def test_show_no_instance_found_dot_notation(self):
         correct = "** no instance found **"
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("BaseModel.show(1)"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "BaseModel.show_instance(1)"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("User.show(1)"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "User.show_instance(1)"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("State.show(1)"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "State.show_instance(1)"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("City.show(1)"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "City.show_instance(1)"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("Amenity.show(1)"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "Amenity.show_instance(1)"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("Place.show(1)"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "Place.show_instance(1)"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("Review.show(1)"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "Review.show_instance(1)"))
             self.assertEqual(correct, output.getvalue().strip())
 
     def test_show_objects_space_notation(self):
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create BaseModel"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance BaseModel"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["BaseModel.{}".format(testID)]
-            command = "show BaseModel {}".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
+            obj = storage.get_all_objects()["BaseModel.{}".format(testID)]
+            command = "show_instance BaseModel {}".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
             self.assertEqual(obj.__str__(), output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create User"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance User"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["User.{}".format(testID)]
-            command = "show User {}".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
+            obj = storage.get_all_objects()["User.{}".format(testID)]
+            command = "show_instance User {}".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
             self.assertEqual(obj.__str__(), output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create State"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance State"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["State.{}".format(testID)]
-            command = "show State {}".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
+            obj = storage.get_all_objects()["State.{}".format(testID)]
+            command = "show_instance State {}".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
             self.assertEqual(obj.__str__(), output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create Place"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Place"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["Place.{}".format(testID)]
-            command = "show Place {}".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
+            obj = storage.get_all_objects()["Place.{}".format(testID)]
+            command = "show_instance Place {}".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
             self.assertEqual(obj.__str__(), output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create City"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance City"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["City.{}".format(testID)]
-            command = "show City {}".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
+            obj = storage.get_all_objects()["City.{}".format(testID)]
+            command = "show_instance City {}".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
             self.assertEqual(obj.__str__(), output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create Amenity"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Amenity"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["Amenity.{}".format(testID)]
-            command = "show Amenity {}".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
+            obj = storage.get_all_objects()["Amenity.{}".format(testID)]
+            command = "show_instance Amenity {}".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
             self.assertEqual(obj.__str__(), output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create Review"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Review"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["Review.{}".format(testID)]
-            command = "show Review {}".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
+            obj = storage.get_all_objects()["Review.{}".format(testID)]
+            command = "show_instance Review {}".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
             self.assertEqual(obj.__str__(), output.getvalue().strip())
 
     def test_show_objects_space_notation(self):
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create BaseModel"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance BaseModel"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["BaseModel.{}".format(testID)]
-            command = "BaseModel.show({})".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
+            obj = storage.get_all_objects()["BaseModel.{}".format(testID)]
+            command = "BaseModel.show_instance({})".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
             self.assertEqual(obj.__str__(), output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create User"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance User"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["User.{}".format(testID)]
-            command = "User.show({})".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
+            obj = storage.get_all_objects()["User.{}".format(testID)]
+            command = "User.show_instance({})".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
             self.assertEqual(obj.__str__(), output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create State"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance State"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["State.{}".format(testID)]
-            command = "State.show({})".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
+            obj = storage.get_all_objects()["State.{}".format(testID)]
+            command = "State.show_instance({})".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
             self.assertEqual(obj.__str__(), output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create Place"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Place"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["Place.{}".format(testID)]
-            command = "Place.show({})".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
+            obj = storage.get_all_objects()["Place.{}".format(testID)]
+            command = "Place.show_instance({})".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
             self.assertEqual(obj.__str__(), output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create City"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance City"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["City.{}".format(testID)]
-            command = "City.show({})".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
+            obj = storage.get_all_objects()["City.{}".format(testID)]
+            command = "City.show_instance({})".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
             self.assertEqual(obj.__str__(), output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create Amenity"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Amenity"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["Amenity.{}".format(testID)]
-            command = "Amenity.show({})".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
+            obj = storage.get_all_objects()["Amenity.{}".format(testID)]
+            command = "Amenity.show_instance({})".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
             self.assertEqual(obj.__str__(), output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create Review"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Review"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["Review.{}".format(testID)]
-            command = "Review.show({})".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
+            obj = storage.get_all_objects()["Review.{}".format(testID)]
+            command = "Review.show_instance({})".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
             self.assertEqual(obj.__str__(), output.getvalue().strip())
 
 
-class TestHBNBCommand_destroy(unittest.TestCase):
-    """Unittests for testing destroy from the HBNB command interpreter."""
+class TestCustomCommandInterpreter_destroy(unittest.TestCase):
+    """Unittests for testing destroy from the custom command interpreter."""
 
     @classmethod
     def setUp(self):
         try:
-            os.rename("file.json", "tmp")
+            os.rename("custom_file.json", "tmp")
         except IOError:
             pass
-        FileStorage.__objects = {}
+        CustomFileStorage._CustomFileStorage__objects = {}
 
     @classmethod
     def tearDown(self):
         try:
-            os.remove("file.json")
+            os.remove("custom_file.json")
         except IOError:
             pass
         try:
-            os.rename("tmp", "file.json")
+            os.rename("tmp", "custom_file.json")
         except IOError:
             pass
-        storage.reload()
+        storage.reload_data()
 
     def test_destroy_missing_class(self):
         correct = "** class name missing **"
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("destroy"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "destroy_instance"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd(".destroy()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                ".destroy_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
 
     def test_destroy_invalid_class(self):
         correct = "** class doesn't exist **"
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("destroy MyModel"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "destroy_instance MyModel"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("MyModel.destroy()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "MyModel.destroy_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
 
     def test_destroy_id_missing_space_notation(self):
         correct = "** instance id missing **"
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("destroy BaseModel"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "destroy_instance BaseModel"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("destroy User"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "destroy_instance User"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("destroy State"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "destroy_instance State"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("destroy City"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "destroy_instance City"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("destroy Amenity"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "destroy_instance Amenity"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("destroy Place"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "destroy_instance Place"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("destroy Review"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "destroy_instance Review"))
             self.assertEqual(correct, output.getvalue().strip())
 
     def test_destroy_id_missing_dot_notation(self):
         correct = "** instance id missing **"
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("BaseModel.destroy()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "BaseModel.destroy_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("User.destroy()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "User.destroy_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("State.destroy()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "State.destroy_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("City.destroy()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "City.destroy_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("Amenity.destroy()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "Amenity.destroy_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("Place.destroy()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "Place.destroy_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("Review.destroy()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "Review.destroy_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
 
     def test_destroy_invalid_id_space_notation(self):
         correct = "** no instance found **"
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("destroy BaseModel 1"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "destroy_instance BaseModel 1"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("destroy User 1"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "destroy_instance User 1"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("destroy State 1"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "destroy_instance State 1"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("destroy City 1"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "destroy_instance City 1"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("destroy Amenity 1"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "destroy_instance Amenity 1"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("destroy Place 1"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "destroy_instance Place 1"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("destroy Review 1"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "destroy_instance Review 1"))
             self.assertEqual(correct, output.getvalue().strip())
 
     def test_destroy_invalid_id_dot_notation(self):
         correct = "** no instance found **"
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("BaseModel.destroy(1)"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "BaseModel.destroy_instance(1)"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("User.destroy(1)"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "User.destroy_instance(1)"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("State.destroy(1)"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "State.destroy_instance(1)"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("City.destroy(1)"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "City.destroy_instance(1)"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("Amenity.destroy(1)"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "Amenity.destroy_instance(1)"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("Place.destroy(1)"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "Place.destroy_instance(1)"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("Review.destroy(1)"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "Review.destroy_instance(1)"))
             self.assertEqual(correct, output.getvalue().strip())
 
     def test_destroy_objects_space_notation(self):
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create BaseModel"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance BaseModel"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["BaseModel.{}".format(testID)]
-            command = "destroy BaseModel {}".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
-            self.assertNotIn(obj, storage.all())
+            obj = storage.get_all_objects()["BaseModel.{}".format(testID)]
+            command = "destroy_instance BaseModel {}".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
+            self.assertNotIn(obj, storage.get_all_objects())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create User"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance User"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["User.{}".format(testID)]
-            command = "show User {}".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
-            self.assertNotIn(obj, storage.all())
+            obj = storage.get_all_objects()["User.{}".format(testID)]
+            command = "show_instance User {}".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
+            self.assertNotIn(obj, storage.get_all_objects())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create State"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance State"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["State.{}".format(testID)]
-            command = "show State {}".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
-            self.assertNotIn(obj, storage.all())
+            obj = storage.get_all_objects()["State.{}".format(testID)]
+            command = "show_instance State {}".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
+            self.assertNotIn(obj, storage.get_all_objects())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create Place"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Place"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["Place.{}".format(testID)]
-            command = "show Place {}".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
-            self.assertNotIn(obj, storage.all())
+            obj = storage.get_all_objects()["Place.{}".format(testID)]
+            command = "show_instance Place {}".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
+            self.assertNotIn(obj, storage.get_all_objects())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create City"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance City"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["City.{}".format(testID)]
-            command = "show City {}".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
-            self.assertNotIn(obj, storage.all())
+            obj = storage.get_all_objects()["City.{}".format(testID)]
+            command = "show_instance City {}".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
+            self.assertNotIn(obj, storage.get_all_objects())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create Amenity"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Amenity"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["Amenity.{}".format(testID)]
-            command = "show Amenity {}".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
-            self.assertNotIn(obj, storage.all())
+            obj = storage.get_all_objects()["Amenity.{}".format(testID)]
+            command = "show_instance Amenity {}".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
+            self.assertNotIn(obj, storage.get_all_objects())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create Review"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Review"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["Review.{}".format(testID)]
-            command = "show Review {}".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
-            self.assertNotIn(obj, storage.all())
+            obj = storage.get_all_objects()["Review.{}".format(testID)]
+            command = "show_instance Review {}".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
+            self.assertNotIn(obj, storage.get_all_objects())
 
     def test_destroy_objects_dot_notation(self):
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create BaseModel"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance BaseModel"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["BaseModel.{}".format(testID)]
-            command = "BaseModel.destroy({})".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
-            self.assertNotIn(obj, storage.all())
+            obj = storage.get_all_objects()["BaseModel.{}".format(testID)]
+            command = "BaseModel.destroy_instance({})".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
+            self.assertNotIn(obj, storage.get_all_objects())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create User"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance User"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["User.{}".format(testID)]
-            command = "User.destroy({})".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
-            self.assertNotIn(obj, storage.all())
+            obj = storage.get_all_objects()["User.{}".format(testID)]
+            command = "User.destroy_instance({})".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
+            self.assertNotIn(obj, storage.get_all_objects())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create State"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance State"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["State.{}".format(testID)]
-            command = "State.destroy({})".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
-            self.assertNotIn(obj, storage.all())
+            obj = storage.get_all_objects()["State.{}".format(testID)]
+            command = "State.destroy_instance({})".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
+            self.assertNotIn(obj, storage.get_all_objects())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create Place"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Place"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["Place.{}".format(testID)]
-            command = "Place.destroy({})".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
-            self.assertNotIn(obj, storage.all())
+            obj = storage.get_all_objects()["Place.{}".format(testID)]
+            command = "Place.destroy_instance({})".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
+            self.assertNotIn(obj, storage.get_all_objects())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create City"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance City"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["City.{}".format(testID)]
-            command = "City.destroy({})".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
-            self.assertNotIn(obj, storage.all())
+            obj = storage.get_all_objects()["City.{}".format(testID)]
+            command = "City.destroy_instance({})".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
+            self.assertNotIn(obj, storage.get_all_objects())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create Amenity"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Amenity"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["Amenity.{}".format(testID)]
-            command = "Amenity.destroy({})".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
-            self.assertNotIn(obj, storage.all())
+            obj = storage.get_all_objects()["Amenity.{}".format(testID)]
+            command = "Amenity.destroy_instance({})".format(testID)
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
+            self.assertNotIn(obj, storage.get_all_objects())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create Review"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Review"))
             testID = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            obj = storage.all()["Review.{}".format(testID)]
+            obj = storage.get_all_objects()["Review.{}".format(testID)]
             command = "Review.destory({})".format(testID)
-            self.assertFalse(HBNBCommand().onecmd(command))
-            self.assertNotIn(obj, storage.all())
+            self.assertFalse(CustomCommandInterpreter().onecmd(command))
+            self.assertNotIn(obj, storage.get_all_objects())
 
 
-class TestHBNBCommand_all(unittest.TestCase):
-    """Unittests for testing all of the HBNB command interpreter."""
+class TestCustomCommandInterpreter_all(unittest.TestCase):
+    """Unittests for testing all of the custom command interpreter."""
 
     @classmethod
     def setUp(self):
         try:
-            os.rename("file.json", "tmp")
+            os.rename("custom_file.json", "tmp")
         except IOError:
             pass
-        FileStorage.__objects = {}
+        CustomFileStorage._CustomFileStorage__objects = {}
 
     @classmethod
     def tearDown(self):
         try:
-            os.remove("file.json")
+            os.remove("custom_file.json")
         except IOError:
             pass
         try:
-            os.rename("tmp", "file.json")
+            os.rename("tmp", "custom_file.json")
         except IOError:
             pass
 
     def test_all_invalid_class(self):
         correct = "** class doesn't exist **"
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("all MyModel"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "list_all_instances MyModel"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("MyModel.all()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "MyModel.list_all_instances()"))
             self.assertEqual(correct, output.getvalue().strip())
 
     def test_all_objects_space_notation(self):
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create BaseModel"))
-            self.assertFalse(HBNBCommand().onecmd("create User"))
-            self.assertFalse(HBNBCommand().onecmd("create State"))
-            self.assertFalse(HBNBCommand().onecmd("create Place"))
-            self.assertFalse(HBNBCommand().onecmd("create City"))
-            self.assertFalse(HBNBCommand().onecmd("create Amenity"))
-            self.assertFalse(HBNBCommand().onecmd("create Review"))
-        with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("all"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance BaseModel"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance User"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance State"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Place"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance City"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Amenity"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Review"))
+        with patch("sys.stdout", new=StringIO()) as output:
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "list_all_instances"))
             self.assertIn("BaseModel", output.getvalue().strip())
             self.assertIn("User", output.getvalue().strip())
             self.assertIn("State", output.getvalue().strip())
@@ -758,15 +862,23 @@ class TestHBNBCommand_all(unittest.TestCase):
 
     def test_all_objects_dot_notation(self):
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create BaseModel"))
-            self.assertFalse(HBNBCommand().onecmd("create User"))
-            self.assertFalse(HBNBCommand().onecmd("create State"))
-            self.assertFalse(HBNBCommand().onecmd("create Place"))
-            self.assertFalse(HBNBCommand().onecmd("create City"))
-            self.assertFalse(HBNBCommand().onecmd("create Amenity"))
-            self.assertFalse(HBNBCommand().onecmd("create Review"))
-        with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd(".all()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance BaseModel"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance User"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance State"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Place"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance City"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Amenity"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Review"))
+        with patch("sys.stdout", new=StringIO()) as output:
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                ".list_all_instances()"))
             self.assertIn("BaseModel", output.getvalue().strip())
             self.assertIn("User", output.getvalue().strip())
             self.assertIn("State", output.getvalue().strip())
@@ -777,795 +889,1221 @@ class TestHBNBCommand_all(unittest.TestCase):
 
     def test_all_single_object_space_notation(self):
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create BaseModel"))
-            self.assertFalse(HBNBCommand().onecmd("create User"))
-            self.assertFalse(HBNBCommand().onecmd("create State"))
-            self.assertFalse(HBNBCommand().onecmd("create Place"))
-            self.assertFalse(HBNBCommand().onecmd("create City"))
-            self.assertFalse(HBNBCommand().onecmd("create Amenity"))
-            self.assertFalse(HBNBCommand().onecmd("create Review"))
-        with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("all BaseModel"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance BaseModel"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance User"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance State"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Place"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance City"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Amenity"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Review"))
+        with patch("sys.stdout", new=StringIO()) as output:
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "list_all_instances BaseModel"))
             self.assertIn("BaseModel", output.getvalue().strip())
             self.assertNotIn("User", output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("all User"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "list_all_instances User"))
             self.assertIn("User", output.getvalue().strip())
             self.assertNotIn("BaseModel", output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("all State"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "list_all_instances State"))
             self.assertIn("State", output.getvalue().strip())
             self.assertNotIn("BaseModel", output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("all City"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "list_all_instances City"))
             self.assertIn("City", output.getvalue().strip())
             self.assertNotIn("BaseModel", output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("all Amenity"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "list_all_instances Amenity"))
             self.assertIn("Amenity", output.getvalue().strip())
             self.assertNotIn("BaseModel", output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("all Place"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "list_all_instances Place"))
             self.assertIn("Place", output.getvalue().strip())
             self.assertNotIn("BaseModel", output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("all Review"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "list_all_instances Review"))
             self.assertIn("Review", output.getvalue().strip())
             self.assertNotIn("BaseModel", output.getvalue().strip())
 
     def test_all_single_object_dot_notation(self):
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create BaseModel"))
-            self.assertFalse(HBNBCommand().onecmd("create User"))
-            self.assertFalse(HBNBCommand().onecmd("create State"))
-            self.assertFalse(HBNBCommand().onecmd("create Place"))
-            self.assertFalse(HBNBCommand().onecmd("create City"))
-            self.assertFalse(HBNBCommand().onecmd("create Amenity"))
-            self.assertFalse(HBNBCommand().onecmd("create Review"))
-        with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("BaseModel.all()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance BaseModel"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance User"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance State"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Place"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance City"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Amenity"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Review"))
+        with patch("sys.stdout", new=StringIO()) as output:
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "BaseModel.list_all_instances()"))
             self.assertIn("BaseModel", output.getvalue().strip())
             self.assertNotIn("User", output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("User.all()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "User.list_all_instances()"))
             self.assertIn("User", output.getvalue().strip())
             self.assertNotIn("BaseModel", output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("State.all()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "State.list_all_instances()"))
             self.assertIn("State", output.getvalue().strip())
             self.assertNotIn("BaseModel", output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("City.all()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "City.list_all_instances()"))
             self.assertIn("City", output.getvalue().strip())
             self.assertNotIn("BaseModel", output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("Amenity.all()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "Amenity.list_all_instances()"))
             self.assertIn("Amenity", output.getvalue().strip())
             self.assertNotIn("BaseModel", output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("Place.all()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "Place.list_all_instances()"))
             self.assertIn("Place", output.getvalue().strip())
             self.assertNotIn("BaseModel", output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("Review.all()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "Review.list_all_instances()"))
             self.assertIn("Review", output.getvalue().strip())
             self.assertNotIn("BaseModel", output.getvalue().strip())
 
 
-class TestHBNBCommand_update(unittest.TestCase):
-    """Unittests for testing update from the HBNB command interpreter."""
+class TestCustomCommandInterpreter_update(unittest.TestCase):
+    """Unittests for testing update from the custom command interpreter."""
 
     @classmethod
     def setUp(self):
         try:
-            os.rename("file.json", "tmp")
+            os.rename("custom_file.json", "tmp")
         except IOError:
             pass
-        FileStorage.__objects = {}
+        CustomFileStorage._CustomFileStorage__objects = {}
 
     @classmethod
     def tearDown(self):
         try:
-            os.remove("file.json")
+            os.remove("custom_file.json")
         except IOError:
             pass
         try:
-            os.rename("tmp", "file.json")
+            os.rename("tmp", "custom_file.json")
         except IOError:
             pass
 
     def test_update_missing_class(self):
         correct = "** class name missing **"
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("update"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "update_instance"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd(".update()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                ".update_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
 
     def test_update_invalid_class(self):
         correct = "** class doesn't exist **"
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("update MyModel"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "update_instance MyModel"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("MyModel.update()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "MyModel.update_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
 
     def test_update_missing_id_space_notation(self):
         correct = "** instance id missing **"
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("update BaseModel"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "update_instance BaseModel"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("update User"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "update_instance User"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("update State"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "update_instance State"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("update City"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "update_instance City"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("update Amenity"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "update_instance Amenity"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("update Place"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "update_instance Place"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("update Review"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "update_instance Review"))
             self.assertEqual(correct, output.getvalue().strip())
 
     def test_update_missing_id_dot_notation(self):
         correct = "** instance id missing **"
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("BaseModel.update()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "BaseModel.update_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("User.update()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "User.update_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("State.update()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "State.update_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("City.update()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "City.update_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("Amenity.update()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "Amenity.update_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("Place.update()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "Place.update_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("Review.update()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "Review.update_instance()"))
             self.assertEqual(correct, output.getvalue().strip())
 
     def test_update_invalid_id_space_notation(self):
         correct = "** no instance found **"
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("update BaseModel 1"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "update_instance BaseModel 1"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("update User 1"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "update_instance User 1"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("update State 1"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "update_instance State 1"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("update City 1"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "update_instance City 1"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("update Amenity 1"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "update_instance Amenity 1"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("update Place 1"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "update_instance Place 1"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("update Review 1"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "update_instance Review 1"))
             self.assertEqual(correct, output.getvalue().strip())
 
     def test_update_invalid_id_dot_notation(self):
         correct = "** no instance found **"
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("BaseModel.update(1)"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "BaseModel.update_instance(1)"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("User.update(1)"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "User.update_instance(1)"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("State.update(1)"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "State.update_instance(1)"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("City.update(1)"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "City.update_instance(1)"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("Amenity.update(1)"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "Amenity.update_instance(1)"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("Place.update(1)"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "Place.update_instance(1)"))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("Review.update(1)"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "Review.update_instance(1)"))
             self.assertEqual(correct, output.getvalue().strip())
 
     def test_update_missing_attr_name_space_notation(self):
         correct = "** attribute name missing **"
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create BaseModel"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance BaseModel"))
             testId = output.getvalue().strip()
-            testCmd = "update BaseModel {}".format(testId)
+            testCmd = "update_instance BaseModel {}".format(testId)
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd(testCmd))
+            self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create User"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance User"))
             testId = output.getvalue().strip()
-            testCmd = "update User {}".format(testId)
+            testCmd = "update_instance User {}".format(testId)
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd(testCmd))
+            self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create State"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance State"))
             testId = output.getvalue().strip()
-            testCmd = "update State {}".format(testId)
+            testCmd = "update_instance State {}".format(testId)
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd(testCmd))
+            self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create City"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance City"))
             testId = output.getvalue().strip()
-            testCmd = "update City {}".format(testId)
+            testCmd = "update_instance City {}".format(testId)
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd(testCmd))
+            self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create Amenity"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Amenity"))
             testId = output.getvalue().strip()
-            testCmd = "update Amenity {}".format(testId)
+            testCmd = "update_instance Amenity {}".format(testId)
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd(testCmd))
+            self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create Place"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Place"))
             testId = output.getvalue().strip()
-            testCmd = "update Place {}".format(testId)
+            testCmd = "update_instance Place {}".format(testId)
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd(testCmd))
+            self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
             self.assertEqual(correct, output.getvalue().strip())
 
     def test_update_missing_attr_name_dot_notation(self):
         correct = "** attribute name missing **"
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create BaseModel"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance BaseModel"))
             testId = output.getvalue().strip()
-            testCmd = "BaseModel.update({})".format(testId)
+            testCmd = "BaseModel.update_instance({})".format(testId)
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd(testCmd))
+            self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create User"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance User"))
             testId = output.getvalue().strip()
-            testCmd = "User.update({})".format(testId)
+            testCmd = "User.update_instance({})".format(testId)
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd(testCmd))
+            self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create State"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance State"))
             testId = output.getvalue().strip()
-            testCmd = "State.update({})".format(testId)
+            testCmd = "State.update_instance({})".format(testId)
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd(testCmd))
+            self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create City"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance City"))
             testId = output.getvalue().strip()
-            testCmd = "City.update({})".format(testId)
+            testCmd = "City.update_instance({})".format(testId)
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd(testCmd))
+            self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create Amenity"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Amenity"))
             testId = output.getvalue().strip()
-            testCmd = "Amenity.update({})".format(testId)
+            testCmd = "Amenity.update_instance({})".format(testId)
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd(testCmd))
+            self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create Place"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Place"))
             testId = output.getvalue().strip()
-            testCmd = "Place.update({})".format(testId)
+            testCmd = "Place.update_instance({})".format(testId)
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd(testCmd))
+            self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
             self.assertEqual(correct, output.getvalue().strip())
 
     def test_update_missing_attr_value_space_notation(self):
         correct = "** value missing **"
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create BaseModel")
+            CustomCommandInterpreter().onecmd("create_instance BaseModel")
             testId = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            testCmd = "update BaseModel {} attr_name".format(testId)
-            self.assertFalse(HBNBCommand().onecmd(testCmd))
+            testCmd = "update_instance BaseModel {} attr_name".format(testId)
+            self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create User")
+            CustomCommandInterpreter().onecmd("create_instance User")
             testId = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            testCmd = "update User {} attr_name".format(testId)
-            self.assertFalse(HBNBCommand().onecmd(testCmd))
+            testCmd = "update_instance User {} attr_name".format(testId)
+            self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create State")
+            CustomCommandInterpreter().onecmd("create_instance State")
             testId = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            testCmd = "update State {} attr_name".format(testId)
-            self.assertFalse(HBNBCommand().onecmd(testCmd))
+            testCmd = "update_instance State {} attr_name".format(testId)
+            self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create City")
+            CustomCommandInterpreter().onecmd("create_instance City")
             testId = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            testCmd = "update City {} attr_name".format(testId)
-            self.assertFalse(HBNBCommand().onecmd(testCmd))
+            testCmd = "update_instance City {} attr_name".format(testId)
+            self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create Amenity")
+            CustomCommandInterpreter().onecmd("create_instance Amenity")
             testId = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            testCmd = "update Amenity {} attr_name".format(testId)
-            self.assertFalse(HBNBCommand().onecmd(testCmd))
+            testCmd = "update_instance Amenity {} attr_name".format(testId)
+            self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create Place")
+            CustomCommandInterpreter().onecmd("create_instance Place")
             testId = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            testCmd = "update Place {} attr_name".format(testId)
-            self.assertFalse(HBNBCommand().onecmd(testCmd))
+            testCmd = "update_instance Place {} attr_name".format(testId)
+            self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create Review")
+            CustomCommandInterpreter().onecmd("create_instance Review")
             testId = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            testCmd = "update Review {} attr_name".format(testId)
-            self.assertFalse(HBNBCommand().onecmd(testCmd))
+            testCmd = "update_instance Review {} attr_name".format(testId)
+            self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
             self.assertEqual(correct, output.getvalue().strip())
 
     def test_update_missing_attr_value_dot_notation(self):
         correct = "** value missing **"
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create BaseModel")
+            CustomCommandInterpreter().onecmd("create_instance BaseModel")
             testId = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            testCmd = "BaseModel.update({}, attr_name)".format(testId)
-            self.assertFalse(HBNBCommand().onecmd(testCmd))
+            testCmd = 'BaseModel.update_instance("{}", "attr_name")'.format(
+                testId)
+            self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create User")
+            CustomCommandInterpreter().onecmd("create_instance User")
             testId = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            testCmd = "User.update({}, attr_name)".format(testId)
-            self.assertFalse(HBNBCommand().onecmd(testCmd))
+            testCmd = 'User.update_instance("{}", "attr_name")'.format(testId)
+            self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create State")
+            CustomCommandInterpreter().onecmd("create_instance State")
             testId = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            testCmd = "State.update({}, attr_name)".format(testId)
-            self.assertFalse(HBNBCommand().onecmd(testCmd))
+            testCmd = 'State.update_instance("{}", "attr_name")'.format(testId)
+            self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create City")
+            CustomCommandInterpreter().onecmd("create_instance City")
             testId = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            testCmd = "City.update({}, attr_name)".format(testId)
-            self.assertFalse(HBNBCommand().onecmd(testCmd))
+            testCmd = 'City.update_instance("{}", "attr_name")'.format(testId)
+            self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create Amenity")
+            CustomCommandInterpreter().onecmd("create_instance Amenity")
             testId = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            testCmd = "Amenity.update({}, attr_name)".format(testId)
-            self.assertFalse(HBNBCommand().onecmd(testCmd))
+            testCmd = 'Amenity.update_instance("{}", "attr_name")'.format(
+                testId)
+            self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create Place")
+            CustomCommandInterpreter().onecmd("create_instance Place")
             testId = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            testCmd = "Place.update({}, attr_name)".format(testId)
-            self.assertFalse(HBNBCommand().onecmd(testCmd))
+            testCmd = 'Place.update_instance("{}", "attr_name")'.format(testId)
+            self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
             self.assertEqual(correct, output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create Review")
+            CustomCommandInterpreter().onecmd("create_instance Review")
             testId = output.getvalue().strip()
         with patch("sys.stdout", new=StringIO()) as output:
-            testCmd = "Review.update({}, attr_name)".format(testId)
-            self.assertFalse(HBNBCommand().onecmd(testCmd))
+            testCmd = 'Review.update_instance("{}", "attr_name")'.format(
+                testId)
+            self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
             self.assertEqual(correct, output.getvalue().strip())
 
     def test_update_valid_string_attr_space_notation(self):
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create BaseModel")
+            CustomCommandInterpreter().onecmd("create_instance BaseModel")
             testId = output.getvalue().strip()
-        testCmd = "update BaseModel {} attr_name 'attr_value'".format(testId)
-        self.assertFalse(HBNBCommand().onecmd(testCmd))
-        test_dict = storage.all()["BaseModel.{}".format(testId)].__dict__
+        testCmd = 'update_instance BaseModel {} attr_name "attr_value"'.format(
+            testId)
+        self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
+        test_dict = storage.get_all_objects()[
+            "BaseModel.{}".format(testId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create User")
+            CustomCommandInterpreter().onecmd("create_instance User")
             testId = output.getvalue().strip()
-        testCmd = "update User {} attr_name 'attr_value'".format(testId)
-        self.assertFalse(HBNBCommand().onecmd(testCmd))
-        test_dict = storage.all()["User.{}".format(testId)].__dict__
+        testCmd = 'update_instance User {} attr_name "attr_value"'.format(
+            testId)
+        self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
+        test_dict = storage.get_all_objects()[
+            "User.{}".format(testId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create State")
+            CustomCommandInterpreter().onecmd("create_instance State")
             testId = output.getvalue().strip()
-        testCmd = "update State {} attr_name 'attr_value'".format(testId)
-        self.assertFalse(HBNBCommand().onecmd(testCmd))
-        test_dict = storage.all()["State.{}".format(testId)].__dict__
+        testCmd = 'update_instance State {} attr_name "attr_value"'.format(
+            testId)
+        self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
+        test_dict = storage.get_all_objects()[
+            "State.{}".format(testId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create City")
+            CustomCommandInterpreter().onecmd("create_instance City")
             testId = output.getvalue().strip()
-        testCmd = "update City {} attr_name 'attr_value'".format(testId)
-        self.assertFalse(HBNBCommand().onecmd(testCmd))
-        test_dict = storage.all()["City.{}".format(testId)].__dict__
+        testCmd = 'update_instance City {} attr_name "attr_value"'.format(
+            testId)
+        self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
+        test_dict = storage.get_all_objects()[
+            "City.{}".format(testId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create Place")
+            CustomCommandInterpreter().onecmd("create_instance Place")
             testId = output.getvalue().strip()
-        testCmd = "update Place {} attr_name 'attr_value'".format(testId)
-        self.assertFalse(HBNBCommand().onecmd(testCmd))
-        test_dict = storage.all()["Place.{}".format(testId)].__dict__
+        testCmd = 'update_instance Place {} attr_name "attr_value"'.format(
+            testId)
+        self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
+        test_dict = storage.get_all_objects()[
+            "Place.{}".format(testId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create Amenity")
+            CustomCommandInterpreter().onecmd("create_instance Amenity")
             testId = output.getvalue().strip()
-        testCmd = "update Amenity {} attr_name 'attr_value'".format(testId)
-        self.assertFalse(HBNBCommand().onecmd(testCmd))
-        test_dict = storage.all()["Amenity.{}".format(testId)].__dict__
+        testCmd = 'update_instance Amenity {} attr_name "attr_value"'.format(
+            testId)
+        self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
+        test_dict = storage.get_all_objects()[
+            "Amenity.{}".format(testId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create Review")
+            CustomCommandInterpreter().onecmd("create_instance Review")
             testId = output.getvalue().strip()
-        testCmd = "update Review {} attr_name 'attr_value'".format(testId)
-        self.assertFalse(HBNBCommand().onecmd(testCmd))
-        test_dict = storage.all()["Review.{}".format(testId)].__dict__
+        testCmd = 'update_instance Review {} attr_name "attr_value"'.format(
+            testId)
+        self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
+        test_dict = storage.get_all_objects()[
+            "Review.{}".format(testId)].__dict__
         self.assertTrue("attr_value", test_dict["attr_name"])
 
     def test_update_valid_string_attr_dot_notation(self):
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create BaseModel")
+            CustomCommandInterpreter().onecmd("create_instance BaseModel")
             tId = output.getvalue().strip()
-        testCmd = "BaseModel.update({}, attr_name, 'attr_value')".format(tId)
-        self.assertFalse(HBNBCommand().onecmd(testCmd))
-        test_dict = storage.all()["BaseModel.{}".format(tId)].__dict__
+        testCmd = 'BaseModel.update_instance("{}", "attr_name", "attr_value")'
+        testCmd = testCmd.format(tId)
+        self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
+        test_dict = storage.get_all_objects()[
+            "BaseModel.{}".format(tId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create User")
+            CustomCommandInterpreter().onecmd("create_instance User")
             tId = output.getvalue().strip()
-        testCmd = "User.update({}, attr_name, 'attr_value')".format(tId)
-        self.assertFalse(HBNBCommand().onecmd(testCmd))
-        test_dict = storage.all()["User.{}".format(tId)].__dict__
+        testCmd = 'User.update_instance("{}", "attr_name", "attr_value")'
+        testCmd = testCmd.format(tId)
+        self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
+        test_dict = storage.get_all_objects()[
+            "User.{}".format(tId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create State")
+            CustomCommandInterpreter().onecmd("create_instance State")
             tId = output.getvalue().strip()
-        testCmd = "State.update({}, attr_name, 'attr_value')".format(tId)
-        self.assertFalse(HBNBCommand().onecmd(testCmd))
-        test_dict = storage.all()["State.{}".format(tId)].__dict__
+        testCmd = 'State.update_instance("{}", "attr_name", "attr_value")'
+        testCmd = testCmd.format(tId)
+        self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
+        test_dict = storage.get_all_objects()[
+            "State.{}".format(tId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create City")
+            CustomCommandInterpreter().onecmd("create_instance City")
             tId = output.getvalue().strip()
-        testCmd = "City.update({}, attr_name, 'attr_value')".format(tId)
-        self.assertFalse(HBNBCommand().onecmd(testCmd))
-        test_dict = storage.all()["City.{}".format(tId)].__dict__
+        testCmd = 'City.update_instance("{}", "attr_name", "attr_value")'
+        testCmd = testCmd.format(tId)
+        self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
+        test_dict = storage.get_all_objects()[
+            "City.{}".format(tId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create Place")
+            CustomCommandInterpreter().onecmd("create_instance Place")
             tId = output.getvalue().strip()
-        testCmd = "Place.update({}, attr_name, 'attr_value')".format(tId)
-        self.assertFalse(HBNBCommand().onecmd(testCmd))
-        test_dict = storage.all()["Place.{}".format(tId)].__dict__
+        testCmd = 'Place.update_instance("{}", "attr_name", "attr_value")'
+        testCmd = testCmd.format(tId)
+        self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
+        test_dict = storage.get_all_objects()[
+            "Place.{}".format(tId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create Amenity")
+            CustomCommandInterpreter().onecmd("create_instance Amenity")
             tId = output.getvalue().strip()
-        testCmd = "Amenity.update({}, attr_name, 'attr_value')".format(tId)
-        self.assertFalse(HBNBCommand().onecmd(testCmd))
-        test_dict = storage.all()["Amenity.{}".format(tId)].__dict__
+        testCmd = 'Amenity.update_instance("{}", "attr_name", "attr_value")'
+        testCmd = testCmd.format(tId)
+        self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
+        test_dict = storage.get_all_objects()[
+            "Amenity.{}".format(tId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create Review")
+            CustomCommandInterpreter().onecmd("create_instance Review")
             tId = output.getvalue().strip()
-        testCmd = "Review.update({}, attr_name, 'attr_value')".format(tId)
-        self.assertFalse(HBNBCommand().onecmd(testCmd))
-        test_dict = storage.all()["Review.{}".format(tId)].__dict__
+        testCmd = 'Review.update_instance("{}", "attr_name", "attr_value")'
+        testCmd = testCmd.format(tId)
+        self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
+        test_dict = storage.get_all_objects()[
+            "Review.{}".format(tId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
     def test_update_valid_int_attr_space_notation(self):
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create Place")
+            CustomCommandInterpreter().onecmd("create_instance Place")
             testId = output.getvalue().strip()
-        testCmd = "update Place {} max_guest 98".format(testId)
-        self.assertFalse(HBNBCommand().onecmd(testCmd))
-        test_dict = storage.all()["Place.{}".format(testId)].__dict__
+        testCmd = "update_instance Place {} max_guest 98".format(testId)
+        self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
+        test_dict = storage.get_all_objects()[
+            "Place.{}".format(testId)].__dict__
         self.assertEqual(98, test_dict["max_guest"])
 
     def test_update_valid_int_attr_dot_notation(self):
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create Place")
+            CustomCommandInterpreter().onecmd("create_instance Place")
             tId = output.getvalue().strip()
-        testCmd = "Place.update({}, max_guest, 98)".format(tId)
-        self.assertFalse(HBNBCommand().onecmd(testCmd))
-        test_dict = storage.all()["Place.{}".format(tId)].__dict__
+        testCmd = 'Place.update_instance("{}", "max_guest", 98)'.format(tId)
+        self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
+        test_dict = storage.get_all_objects()[
+            "Place.{}".format(tId)].__dict__
         self.assertEqual(98, test_dict["max_guest"])
 
     def test_update_valid_float_attr_space_notation(self):
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create Place")
+            CustomCommandInterpreter().onecmd("create_instance Place")
             testId = output.getvalue().strip()
-        testCmd = "update Place {} latitude 7.2".format(testId)
-        self.assertFalse(HBNBCommand().onecmd(testCmd))
-        test_dict = storage.all()["Place.{}".format(testId)].__dict__
+        testCmd = "update_instance Place {} latitude 7.2".format(testId)
+        self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
+        test_dict = storage.get_all_objects()[
+            "Place.{}".format(testId)].__dict__
         self.assertEqual(7.2, test_dict["latitude"])
 
     def test_update_valid_float_attr_dot_notation(self):
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create Place")
+            CustomCommandInterpreter().onecmd("create_instance Place")
             tId = output.getvalue().strip()
-        testCmd = "Place.update({}, latitude, 7.2)".format(tId)
-        self.assertFalse(HBNBCommand().onecmd(testCmd))
-        test_dict = storage.all()["Place.{}".format(tId)].__dict__
+        testCmd = 'Place.update_instance("{}", "latitude", 7.2)'.format(tId)
+        self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
+        test_dict = storage.get_all_objects()[
+            "Place.{}".format(tId)].__dict__
         self.assertEqual(7.2, test_dict["latitude"])
 
-    def test_update_valid_dictionary_space_notation(self):
+    def test_update_valid_dictionary_command_notation(self):
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create BaseModel")
+            CustomCommandInterpreter().onecmd("create_instance BaseModel")
             testId = output.getvalue().strip()
-        testCmd = "update BaseModel {} ".format(testId)
-        testCmd += "{'attr_name': 'attr_value'}"
-        HBNBCommand().onecmd(testCmd)
-        test_dict = storage.all()["BaseModel.{}".format(testId)].__dict__
+        testCmd = 'BaseModel.update_instance("{}", '.format(testId)
+        testCmd += "{'attr_name': 'attr_value'})"
+        CustomCommandInterpreter().onecmd(testCmd)
+        test_dict = storage.get_all_objects()[
+            "BaseModel.{}".format(testId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create User")
+            CustomCommandInterpreter().onecmd("create_instance User")
             testId = output.getvalue().strip()
-        testCmd = "update User {} ".format(testId)
-        testCmd += "{'attr_name': 'attr_value'}"
-        HBNBCommand().onecmd(testCmd)
-        test_dict = storage.all()["User.{}".format(testId)].__dict__
+        testCmd = 'User.update_instance("{}", '.format(testId)
+        testCmd += "{'attr_name': 'attr_value'})"
+        CustomCommandInterpreter().onecmd(testCmd)
+        test_dict = storage.get_all_objects()[
+            "User.{}".format(testId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create State")
+            CustomCommandInterpreter().onecmd("create_instance State")
             testId = output.getvalue().strip()
-        testCmd = "update State {} ".format(testId)
-        testCmd += "{'attr_name': 'attr_value'}"
-        HBNBCommand().onecmd(testCmd)
-        test_dict = storage.all()["State.{}".format(testId)].__dict__
+        testCmd = 'State.update_instance("{}", '.format(testId)
+        testCmd += "{'attr_name': 'attr_value'})"
+        CustomCommandInterpreter().onecmd(testCmd)
+        test_dict = storage.get_all_objects()[
+            "State.{}".format(testId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create City")
+            CustomCommandInterpreter().onecmd("create_instance City")
             testId = output.getvalue().strip()
-        testCmd = "update City {} ".format(testId)
-        testCmd += "{'attr_name': 'attr_value'}"
-        HBNBCommand().onecmd(testCmd)
-        test_dict = storage.all()["City.{}".format(testId)].__dict__
+        testCmd = 'City.update_instance("{}", '.format(testId)
+        testCmd += "{'attr_name': 'attr_value'})"
+        CustomCommandInterpreter().onecmd(testCmd)
+        test_dict = storage.get_all_objects()[
+            "City.{}".format(testId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create Place")
+            CustomCommandInterpreter().onecmd("create_instance Place")
             testId = output.getvalue().strip()
-        testCmd = "update Place {} ".format(testId)
-        testCmd += "{'attr_name': 'attr_value'}"
-        HBNBCommand().onecmd(testCmd)
-        test_dict = storage.all()["Place.{}".format(testId)].__dict__
+        testCmd = 'Place.update_instance("{}", '.format(testId)
+        testCmd += "{'attr_name': 'attr_value'})"
+        CustomCommandInterpreter().onecmd(testCmd)
+        test_dict = storage.get_all_objects()[
+            "Place.{}".format(testId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create Amenity")
+            CustomCommandInterpreter().onecmd("create_instance Amenity")
             testId = output.getvalue().strip()
-        testCmd = "update Amenity {} ".format(testId)
-        testCmd += "{'attr_name': 'attr_value'}"
-        HBNBCommand().onecmd(testCmd)
-        test_dict = storage.all()["Amenity.{}".format(testId)].__dict__
+        testCmd = 'Amenity.update_instance("{}", '.format(testId)
+        testCmd += "{'attr_name': 'attr_value'})"
+        CustomCommandInterpreter().onecmd(testCmd)
+        test_dict = storage.get_all_objects()[
+            "Amenity.{}".format(testId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create Review")
+            CustomCommandInterpreter().onecmd("create_instance Review")
             testId = output.getvalue().strip()
-        testCmd = "update Review {} ".format(testId)
-        testCmd += "{'attr_name': 'attr_value'}"
-        HBNBCommand().onecmd(testCmd)
-        test_dict = storage.all()["Review.{}".format(testId)].__dict__
+        testCmd = 'Review.update_instance("{}", '.format(testId)
+        testCmd += "{'attr_name': 'attr_value'})"
+        CustomCommandInterpreter().onecmd(testCmd)
+        test_dict = storage.get_all_objects()[
+            "Review.{}".format(testId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
     def test_update_valid_dictionary_dot_notation(self):
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create BaseModel")
+            CustomCommandInterpreter().onecmd("create_instance BaseModel")
             testId = output.getvalue().strip()
-        testCmd = "BaseModel.update({}".format(testId)
+        testCmd = 'BaseModel.update("{}", '.format(testId)
         testCmd += "{'attr_name': 'attr_value'})"
-        HBNBCommand().onecmd(testCmd)
-        test_dict = storage.all()["BaseModel.{}".format(testId)].__dict__
+        CustomCommandInterpreter().onecmd(testCmd)
+        test_dict = storage.get_all_objects()[
+            "BaseModel.{}".format(testId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create User")
+            CustomCommandInterpreter().onecmd("create_instance User")
             testId = output.getvalue().strip()
-        testCmd = "User.update({}, ".format(testId)
+        testCmd = 'User.update("{}", '.format(testId)
         testCmd += "{'attr_name': 'attr_value'})"
-        HBNBCommand().onecmd(testCmd)
-        test_dict = storage.all()["User.{}".format(testId)].__dict__
+        CustomCommandInterpreter().onecmd(testCmd)
+        test_dict = storage.get_all_objects()[
+            "User.{}".format(testId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create State")
+            CustomCommandInterpreter().onecmd("create_instance State")
             testId = output.getvalue().strip()
-        testCmd = "State.update({}, ".format(testId)
+        testCmd = 'State.update("{}", '.format(testId)
         testCmd += "{'attr_name': 'attr_value'})"
-        HBNBCommand().onecmd(testCmd)
-        test_dict = storage.all()["State.{}".format(testId)].__dict__
+        CustomCommandInterpreter().onecmd(testCmd)
+        test_dict = storage.get_all_objects()[
+            "State.{}".format(testId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create City")
+            CustomCommandInterpreter().onecmd("create_instance City")
             testId = output.getvalue().strip()
-        testCmd = "City.update({}, ".format(testId)
+        testCmd = 'City.update("{}", '.format(testId)
         testCmd += "{'attr_name': 'attr_value'})"
-        HBNBCommand().onecmd(testCmd)
-        test_dict = storage.all()["City.{}".format(testId)].__dict__
+        CustomCommandInterpreter().onecmd(testCmd)
+        test_dict = storage.get_all_objects()[
+            "City.{}".format(testId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create Place")
+            CustomCommandInterpreter().onecmd("create_instance Place")
             testId = output.getvalue().strip()
-        testCmd = "Place.update({}, ".format(testId)
+        testCmd = 'Place.update("{}", '.format(testId)
         testCmd += "{'attr_name': 'attr_value'})"
-        HBNBCommand().onecmd(testCmd)
-        test_dict = storage.all()["Place.{}".format(testId)].__dict__
+        CustomCommandInterpreter().onecmd(testCmd)
+        test_dict = storage.get_all_objects()[
+            "Place.{}".format(testId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create Amenity")
+            CustomCommandInterpreter().onecmd("create_instance Amenity")
             testId = output.getvalue().strip()
-        testCmd = "Amenity.update({}, ".format(testId)
+        testCmd = 'Amenity.update("{}", '.format(testId)
         testCmd += "{'attr_name': 'attr_value'})"
-        HBNBCommand().onecmd(testCmd)
-        test_dict = storage.all()["Amenity.{}".format(testId)].__dict__
+        CustomCommandInterpreter().onecmd(testCmd)
+        test_dict = storage.get_all_objects()[
+            "Amenity.{}".format(testId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create Review")
+            CustomCommandInterpreter().onecmd("create_instance Review")
             testId = output.getvalue().strip()
-        testCmd = "Review.update({}, ".format(testId)
+        testCmd = 'Review.update("{}", '.format(testId)
         testCmd += "{'attr_name': 'attr_value'})"
-        HBNBCommand().onecmd(testCmd)
-        test_dict = storage.all()["Review.{}".format(testId)].__dict__
+        CustomCommandInterpreter().onecmd(testCmd)
+        test_dict = storage.get_all_objects()[
+            "Review.{}".format(testId)].__dict__
         self.assertEqual("attr_value", test_dict["attr_name"])
 
-    def test_update_valid_dictionary_with_int_space_notation(self):
+    def test_update_valid_dictionary_with_int_command_notation(self):
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create Place")
+            CustomCommandInterpreter().onecmd("create_instance Place")
             testId = output.getvalue().strip()
-        testCmd = "update Place {} ".format(testId)
+        testCmd = 'Place.update_instance("{}", '.format(testId)
         testCmd += "{'max_guest': 98})"
-        HBNBCommand().onecmd(testCmd)
-        test_dict = storage.all()["Place.{}".format(testId)].__dict__
+        CustomCommandInterpreter().onecmd(testCmd)
+        test_dict = storage.get_all_objects()[
+            "Place.{}".format(testId)].__dict__
         self.assertEqual(98, test_dict["max_guest"])
 
     def test_update_valid_dictionary_with_int_dot_notation(self):
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create Place")
+            CustomCommandInterpreter().onecmd("create_instance Place")
             testId = output.getvalue().strip()
-        testCmd = "Place.update({}, ".format(testId)
+        testCmd = 'Place.update("{}", '.format(testId)
         testCmd += "{'max_guest': 98})"
-        HBNBCommand().onecmd(testCmd)
-        test_dict = storage.all()["Place.{}".format(testId)].__dict__
+        CustomCommandInterpreter().onecmd(testCmd)
+        test_dict = storage.get_all_objects()[
+            "Place.{}".format(testId)].__dict__
         self.assertEqual(98, test_dict["max_guest"])
 
-    def test_update_valid_dictionary_with_float_space_notation(self):
+    def test_update_valid_dictionary_with_float_command_notation(self):
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create Place")
+            CustomCommandInterpreter().onecmd("create_instance Place")
             testId = output.getvalue().strip()
-        testCmd = "update Place {} ".format(testId)
+        testCmd = 'Place.update_instance("{}", '.format(testId)
         testCmd += "{'latitude': 9.8})"
-        HBNBCommand().onecmd(testCmd)
-        test_dict = storage.all()["Place.{}".format(testId)].__dict__
+        CustomCommandInterpreter().onecmd(testCmd)
+        test_dict = storage.get_all_objects()[
+            "Place.{}".format(testId)].__dict__
         self.assertEqual(9.8, test_dict["latitude"])
 
     def test_update_valid_dictionary_with_float_dot_notation(self):
         with patch("sys.stdout", new=StringIO()) as output:
-            HBNBCommand().onecmd("create Place")
+            CustomCommandInterpreter().onecmd("create_instance Place")
             testId = output.getvalue().strip()
-        testCmd = "Place.update({}, ".format(testId)
+        testCmd = 'Place.update("{}", '.format(testId)
         testCmd += "{'latitude': 9.8})"
-        HBNBCommand().onecmd(testCmd)
-        test_dict = storage.all()["Place.{}".format(testId)].__dict__
+        CustomCommandInterpreter().onecmd(testCmd)
+        test_dict = storage.get_all_objects()[
+            "Place.{}".format(testId)].__dict__
         self.assertEqual(9.8, test_dict["latitude"])
 
+    def test_update_relation(self):
+        with patch("sys.stdout", new=StringIO()) as output:
+            CustomCommandInterpreter().onecmd("create_instance Place")
+            testId = output.getvalue().strip()
+        for testCmd in ('update_instance Place {} reviews "x"'.format(testId),
+                        'Place.update("{}", '.format(testId) +
+                        "{'name': 'Loft', 'city': 'x'})"):
+            with patch("sys.stdout", new=StringIO()) as output:
+                self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
+                self.assertIn("is a relation **", output.getvalue())
+        test_dict = storage.get_all_objects()[
+            "Place.{}".format(testId)].__dict__
+        self.assertNotIn("reviews", test_dict)
+        self.assertNotIn("name", test_dict)
+
+    def test_update_refused_by_save(self):
+        with patch("sys.stdout", new=StringIO()) as output:
+            CustomCommandInterpreter().onecmd("create_instance Place")
+            testId = output.getvalue().strip()
+        error = ValueError("'x' is already used")
+        for testCmd in ("create_instance Place",
+                        'update_instance Place {} name "x"'.format(testId),
+                        'Place.update("{}", '.format(testId) +
+                        "{'name': 'x'})"):
+            with patch("sys.stdout", new=StringIO()) as output, \
+                    patch.object(storage, "save_data", side_effect=error):
+                self.assertFalse(CustomCommandInterpreter().onecmd(testCmd))
+                self.assertEqual("** 'x' is already used **",
+                                 output.getvalue().strip())
+
 
-class TestHBNBCommand_count(unittest.TestCase):
-    """Unittests for testing count method of HBNB comand interpreter."""
+class TestCustomCommandInterpreter_count(unittest.TestCase):
+    """Unittests for testing count method of custom command interpreter."""
 
     @classmethod
     def setUp(self):
         try:
-            os.rename("file.json", "tmp")
+            os.rename("custom_file.json", "tmp")
         except IOError:
             pass
-        FileStorage._FileStorage__objects = {}
+        CustomFileStorage._CustomFileStorage__objects = {}
 
     @classmethod
     def tearDown(self):
         try:
-            os.remove("file.json")
+            os.remove("custom_file.json")
         except IOError:
             pass
         try:
-            os.rename("tmp", "file.json")
+            os.rename("tmp", "custom_file.json")
         except IOError:
             pass
 
     def test_count_invalid_class(self):
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("MyModel.count()"))
-            self.assertEqual("0", output.getvalue().strip())
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "MyModel.count_instances()"))
+            self.assertEqual("** class doesn't exist **",
+                             output.getvalue().strip())
 
     def test_count_object(self):
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create BaseModel"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance BaseModel"))
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("BaseModel.count()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "BaseModel.count_instances()"))
             self.assertEqual("1", output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create User"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance User"))
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("User.count()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "User.count_instances()"))
             self.assertEqual("1", output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create State"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance State"))
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("State.count()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "State.count_instances()"))
             self.assertEqual("1", output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create Place"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Place"))
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("Place.count()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "Place.count_instances()"))
             self.assertEqual("1", output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create City"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance City"))
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("City.count()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "City.count_instances()"))
             self.assertEqual("1", output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create Amenity"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Amenity"))
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("Amenity.count()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "Amenity.count_instances()"))
             self.assertEqual("1", output.getvalue().strip())
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("create Review"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "create_instance Review"))
         with patch("sys.stdout", new=StringIO()) as output:
-            self.assertFalse(HBNBCommand().onecmd("Review.count()"))
+            self.assertFalse(CustomCommandInterpreter().onecmd(
+                "Review.count_instances()"))
             self.assertEqual("1", output.getvalue().strip())
 
 
+class TestCustomCommandInterpreter_class_index(unittest.TestCase):
+    """Unittests for testing count and list through the class index."""
+
+    def setUp(self):
+        for name in ("custom_file.json", "custom_file.json.journal"):
+            try:
+                os.rename(name, name + ".tmp")
+            except IOError:
+                pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.places = [Place(), Place()]
+        User()
+
+    def tearDown(self):
+        for name in ("custom_file.json", "custom_file.json.journal"):
+            try:
+                os.remove(name)
+            except IOError:
+                pass
+            try:
+                os.rename(name + ".tmp", name)
+            except IOError:
+                pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+
+    def run_command(self, line):
+        with patch("sys.stdout", new=StringIO()) as output:
+            self.assertFalse(CustomCommandInterpreter().onecmd(line))
+        return output.getvalue().strip()
+
+    def test_count(self):
+        self.assertEqual("2", self.run_command("count_instances Place"))
+        self.assertEqual("0", self.run_command("count_instances City"))
+        self.assertEqual("** class doesn't exist **",
+                         self.run_command("count_instances MyModel"))
+
+    def test_list_class(self):
+        output = self.run_command("list_all_instances Place")
+        for pl in self.places:
+            self.assertIn(pl.id, output)
+        self.assertNotIn("[User]", output)
+
+    def test_list_all(self):
+        self.assertIn("[User]", self.run_command("list_all_instances"))
+
+class TestCustomCommandInterpreter_geo(unittest.TestCase):
+    """Unittests for testing the geo commands of the command interpreter."""
+
+    def setUp(self):
+        for name in ("custom_file.json", "custom_file.json.journal"):
+            try:
+                os.rename(name, name + ".tmp")
+            except IOError:
+                pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.paris = Place()
+        self.paris.latitude = 48.8566
+        self.paris.longitude = 2.3522
+        self.lyon = Place()
+        self.lyon.latitude = 45.764
+        self.lyon.longitude = 4.8357
+
+    def tearDown(self):
+        for name in ("custom_file.json", "custom_file.json.journal"):
+            try:
+                os.remove(name)
+            except IOError:
+                pass
+            try:
+                os.rename(name + ".tmp", name)
+            except IOError:
+                pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+
+    def run_command(self, line):
+        with patch("sys.stdout", new=StringIO()) as output:
+            self.assertFalse(CustomCommandInterpreter().onecmd(line))
+        return output.getvalue().strip()
+
+    def test_near(self):
+        output = self.run_command("near_instances Place 48.85 2.35 10")
+        self.assertIn(self.paris.id, output)
+        self.assertNotIn(self.lyon.id, output)
+
+    def test_nearest(self):
+        output = self.run_command("nearest_instances Place 45.7 4.8 1")
+        self.assertIn(self.lyon.id, output)
+        self.assertNotIn(self.paris.id, output)
+
+    def test_box(self):
+        output = self.run_command("box_instances Place 45 4 46 5")
+        self.assertIn(self.lyon.id, output)
+        self.assertNotIn(self.paris.id, output)
+
+    def test_errors(self):
+        self.assertEqual("** class doesn't exist **",
+                         self.run_command("near_instances MyModel 1 2 3"))
+        self.assertEqual("** radius missing **",
+                         self.run_command("near_instances Place 1 2"))
+        self.assertEqual("** coordinates must be numbers **",
+                         self.run_command("near_instances Place a 2 3"))
+
+
+class TestCustomCommandInterpreter_search(unittest.TestCase):
+    """Unittests for testing the search command of the command interpreter."""
+
+    def setUp(self):
+        for name in ("custom_file.json", "custom_file.json.journal"):
+            try:
+                os.rename(name, name + ".tmp")
+            except IOError:
+                pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.good = Review()
+        self.good.text = "Good loft, good host"
+        self.cold = Review()
+        self.cold.text = "The loft was cold"
+
+    def tearDown(self):
+        for name in ("custom_file.json", "custom_file.json.journal"):
+            try:
+                os.remove(name)
+            except IOError:
+                pass
+            try:
+                os.rename(name + ".tmp", name)
+            except IOError:
+                pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+
+    def run_command(self, line):
+        with patch("sys.stdout", new=StringIO()) as output:
+            self.assertFalse(CustomCommandInterpreter().onecmd(line))
+        return output.getvalue().strip()
+
+    def test_search(self):
+        output = self.run_command("search_instances Review good")
+        self.assertIn(self.good.id, output)
+        self.assertNotIn(self.cold.id, output)
+        output = self.run_command("search_instances Review good loft")
+        self.assertLess(output.index(self.good.id), output.index(self.cold.id))
+
+    def test_errors(self):
+        self.assertEqual("** class name missing **",
+                         self.run_command("search_instances"))
+        self.assertEqual("** class doesn't exist **",
+                         self.run_command("search_instances MyModel good"))
+        self.assertEqual("** words missing **",
+                         self.run_command("search_instances Review"))
+
+
+class TestCustomCommandInterpreter_cascade(unittest.TestCase):
+    """Unittests for testing the cascading destroy of the interpreter."""
+
+    def setUp(self):
+        for name in ("custom_file.json", "custom_file.json.journal"):
+            try:
+                os.rename(name, name + ".tmp")
+            except IOError:
+                pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.user = User()
+        self.state = State()
+        self.city = City()
+        self.city.state_id = self.state.id
+        self.place = Place()
+        self.place.city_id = self.city.id
+        self.place.user_id = self.user.id
+        self.review = Review()
+        self.review.place_id = self.place.id
+        storage.save_data()
+
+    def tearDown(self):
+        for name in ("custom_file.json", "custom_file.json.journal"):
+            try:
+                os.remove(name)
+            except IOError:
+                pass
+            try:
+                os.rename(name + ".tmp", name)
+            except IOError:
+                pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+
+    def run_command(self, line):
+        with patch("sys.stdout", new=StringIO()) as output:
+            self.assertFalse(CustomCommandInterpreter().onecmd(line))
+        return output.getvalue().strip()
+
+    def test_cascade(self):
+        self.assertEqual("", self.run_command(
+            "destroy_instance State " + self.state.id))
+        objs = storage.get_all_objects()
+        for obj in (self.state, self.city, self.place, self.review):
+            self.assertNotIn("{}.{}".format(type(obj).__name__, obj.id), objs)
+        self.assertIn("User." + self.user.id, objs)
+        with open("custom_file.json") as file:
+            self.assertNotIn(self.review.id, file.read())
+
+    def test_restrict(self):
+        self.assertEqual("** User {} still has places **".format(
+            self.user.id), self.run_command(
+                "destroy_instance User " + self.user.id))
+        self.assertIn("User." + self.user.id, storage.get_all_objects())
+        self.assertIn("Place." + self.place.id, storage.get_all_objects())
+
+    def test_errors(self):
+        self.assertEqual("** class doesn't exist **",
+                         self.run_command("destroy_instance MyModel 1"))
+        self.assertEqual("** instance id missing **",
+                         self.run_command("destroy_instance Place"))
+        self.assertEqual("** no instance found **",
+                         self.run_command("destroy_instance Place 1"))
+
+
+class TestCustomCommandInterpreter_script(unittest.TestCase):
+    """Unittests for testing piped scripts of the interpreter."""
+
+    def setUp(self):
+        for name in ("custom_file.json", "custom_file.json.journal"):
+            try:
+                os.rename(name, name + ".tmp")
+            except IOError:
+                pass
+
+    def tearDown(self):
+        for name in ("custom_file.json", "custom_file.json.journal"):
+            try:
+                os.remove(name)
+            except IOError:
+                pass
+            try:
+                os.rename(name + ".tmp", name)
+            except IOError:
+                pass
+
+    def run_script(self, *args):
+        return subprocess.run(
+            [sys.executable, "console.py"] + list(args),
+            input="create_instance Place\ncreate_instance State\n",
+            stdout=subprocess.PIPE, universal_newlines=True,
+            timeout=60).stdout
+
+    def test_saved(self):
+        for args in ((), ("--batch",)):
+            output = self.run_script(*args)
+            ids = re.findall(r"[0-9a-f-]{36}", output)
+            self.assertEqual(2, len(ids))
+            with open("custom_file.json") as file:
+                content = file.read()
+            self.assertIn("Place." + ids[0], content)
+            self.assertIn("State." + ids[1], content)
+
+
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -0,0 +1,114 @@
+#!/usr/bin/python3
+"""Defines unittests for models/engine/binary_serializer.py.
+
+Unittest classes:
+    TestCustomBinarySerializer
+"""
+import io
+import marshal
+import unittest
+from datetime import datetime
+from models.engine.binary_serializer import CustomBinarySerializer
+
+
+class TestCustomBinarySerializer(unittest.TestCase):
+    """Unittests for testing the CustomBinarySerializer format."""
+
+    def setUp(self):
+        self.serializer = CustomBinarySerializer(
+            {"BaseModel": {"id": str, "created_at": str},
+             "Place": {"name": str, "amenity_ids": list}})
+        self.records = {
+            "Place.1": {"__class__": "Place", "id": "1", "created_at": "t",
+                        "name": "Loft", "amenity_ids": ["a"]},
+            "Place.2": {"__class__": "Place", "id": "2", "extra": 3},
+            "Other.3": {"__class__": "Other", "id": "3"}}
+
+    def dump(self):
+        return self.serializer.dump([self.serializer.encode(key, record)
+                                     for key, record in self.records.items()])
+
+    def test_round_trip(self):
+        pairs = list(self.serializer.read(io.BytesIO(self.dump())))
+        self.assertEqual(list(self.records.items()), pairs)
+
+    def test_round_trip_small_chunks(self):
+        pairs = list(self.serializer.read(io.BytesIO(self.dump()), 7))
+        self.assertEqual(list(self.records.items()), pairs)
+
+    def test_read_fragments(self):
+        fragments = {}
+        list(self.serializer.read(io.BytesIO(self.dump()), 7,
+                                  fragments=fragments))
+        self.assertEqual({key: self.serializer.encode(key, record)
+                          for key, record in self.records.items()},
+                         fragments)
+
+    def test_scan(self):
+        self.records["Place.1"]["__version__"] = 4
+        data = self.dump()
+        members = self.serializer.scan(io.BytesIO(data))
+        self.assertEqual([("Place.1", 4), ("Place.2", 0), ("Other.3", 0)],
+                         [(key, version) for key, version, _ in members])
+        del self.records["Place.1"]["__version__"]
+        self.assertEqual(list(self.records.values()),
+                         [self.serializer.decode(fragment)
+                          for _, _, fragment in members])
+
+    def test_dates_as_numbers(self):
+        serializer = CustomBinarySerializer(
+            {"BaseModel": {"id": str, "created_at": datetime},
+             "Place": {"name": str}})
+        record = {"__class__": "Place", "id": "1", "name": "Loft",
+                  "created_at": "2024-01-01T10:00:00.000001"}
+        fragment = serializer.encode("Place.1", record)
+        self.assertNotIn(b"2024", fragment)
+        self.assertEqual(dict(record, created_at=datetime(
+            2024, 1, 1, 10, 0, 0, 1)), serializer.decode(fragment))
+        self.assertEqual(fragment, serializer.encode(
+            "Place.1", serializer.decode(fragment)))
+        record["created_at"] = "yesterday"
+        self.assertEqual(record, serializer.decode(
+            serializer.encode("Place.1", record)))
+
+    def test_read_previous_format(self):
+        fields = {"Place": ("id", "created_at", "name", "amenity_ids")}
+        frames = []
+        for key, record in self.records.items():
+            names = fields.get(record["__class__"], ())
+            data = marshal.dumps((key, record["__class__"], tuple(
+                record.get(name, ...) for name in names),
+                {name: value for name, value in record.items()
+                 if name not in names and name != "__class__"} or None))
+            frames.append(len(data).to_bytes(4, "little") + data)
+        data = b"CFSB2" + bytes((marshal.version,)) + b"\n" + b"".join(frames)
+        fragments = {}
+        pairs = list(self.serializer.read(io.BytesIO(data),
+                                          fragments=fragments))
+        self.assertEqual(list(self.records.items()), pairs)
+        self.assertEqual({}, fragments)
+        self.assertIsNone(self.serializer.scan(io.BytesIO(data)))
+
+    def test_bad_magic(self):
+        with self.assertRaises(ValueError):
+            list(self.serializer.read(io.BytesIO(b"{}")))
+
+    def test_older_marshal_version(self):
+        data = bytearray(self.dump())
+        data[5] = 4
+        pairs = list(self.serializer.read(io.BytesIO(bytes(data))))
+        self.assertEqual(list(self.records.items()), pairs)
+
+    def test_newer_marshal_version(self):
+        data = bytearray(self.dump())
+        data[5] = marshal.version + 1
+        with self.assertRaises(ValueError):
+            list(self.serializer.read(io.BytesIO(bytes(data))))
+
+    def test_truncated(self):
+        with self.assertRaises(ValueError):
+            list(self.serializer.read(io.BytesIO(self.dump()[:-1])))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+"""Defines unittests for models/engine/bitmap_index.py.
+
+Unittest classes:
+    TestCustomBitmapIndex
+"""
+import unittest
+from models.engine.bitmap_index import CustomBitmapIndex
+
+
+class TestCustomBitmapIndex(unittest.TestCase):
+    """Unittests for testing the CustomBitmapIndex index."""
+
+    def setUp(self):
+        self.index = CustomBitmapIndex()
+        self.index.update([("P.a", ["wifi", "pool"]),
+                           ("P.b", ["wifi", "smoking"]),
+                           ("P.c", ["pool"]),
+                           ("P.d", []), ("P.e", "wifi")])
+
+    def keys(self, **rules):
+        return self.index.keys(self.index.match(**rules))
+
+    def test_len(self):
+        self.assertEqual(4, len(self.index))
+
+    def test_dense_slots(self):
+        self.assertEqual({0, 1, 2}, {self.index.slot(member) for member in
+                                     ("wifi", "pool", "smoking")})
+        self.assertEqual(3, self.index.slot("gym"))
+
+    def test_all_of(self):
+        self.assertEqual(["P.a", "P.b"], self.keys(all_of=["wifi"]))
+        self.assertEqual(["P.a"], self.keys(all_of=["wifi", "pool"]))
+        self.assertEqual([], self.keys(all_of=["wifi", "gym"]))
+
+    def test_any_of(self):
+        self.assertEqual(["P.a", "P.b", "P.c"],
+                         self.keys(any_of=["pool", "smoking"]))
+
+    def test_none_of(self):
+        self.assertEqual(["P.a", "P.c", "P.d"],
+                         self.keys(none_of=["smoking"]))
+        self.assertEqual(["P.a"], self.keys(all_of=["wifi"],
+                                            none_of=["smoking"]))
+
+    def test_lookup(self):
+        self.assertEqual(["P.a"], self.index.lookup(["pool", "wifi"]))
+        self.assertEqual(["P.d"], self.index.lookup([]))
+
+    def test_add_replaces_members(self):
+        self.index.add("P.c", ["wifi"])
+        self.assertEqual(["P.a", "P.b", "P.c"], self.keys(all_of=["wifi"]))
+        self.assertEqual(["P.a"], self.keys(all_of=["pool"]))
+
+    def test_discard_reuses_position(self):
+        self.index.discard("P.a")
+        self.index.discard("P.z")
+        self.assertEqual(["P.b"], self.keys(all_of=["wifi"]))
+        self.index.add("P.f", ["gym"])
+        self.assertEqual(["P.f", "P.b", "P.c", "P.d"], self.keys())
+
+
+if __name__ == "__main__":
+    unittest.main()
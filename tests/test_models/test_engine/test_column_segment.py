@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+"""Defines unittests for models/engine/column_segment.py.
+
+Unittest classes:
+    TestCustomColumnSegment
+"""
+import os
+import tempfile
+import unittest
+from array import array
+from models.engine.column_segment import CustomColumnSegment
+
+
+class TestCustomColumnSegment(unittest.TestCase):
+    """Unittests for testing the CustomColumnSegment format."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "column.seg")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_int_column_is_narrowed(self):
+        CustomColumnSegment.write(self.path, "int", array("q", [3, -7, 100]))
+        with CustomColumnSegment(self.path) as segment:
+            self.assertEqual("int", segment.kind)
+            self.assertEqual(3, len(segment))
+            codes = segment.codes()
+            self.assertEqual("b", codes.format)
+            self.assertEqual([3, -7, 100], codes.tolist())
+            self.assertIsNone(segment.present())
+            codes.release()
+
+    def test_wide_int_column(self):
+        CustomColumnSegment.write(self.path, "int", [2 ** 40, 0])
+        with CustomColumnSegment(self.path) as segment:
+            self.assertEqual([2 ** 40, 0], list(segment))
+
+    def test_float_column_with_missing_values(self):
+        CustomColumnSegment.write(self.path, "float", [1.5, 0.0, -2.25],
+                                  bytearray([1, 0, 1]))
+        with CustomColumnSegment(self.path) as segment:
+            self.assertEqual([1.5, None, -2.25], list(segment))
+
+    def test_str_column(self):
+        CustomColumnSegment.write(self.path, "str", [0, 1, 0, 2],
+                                  None, ["c1", "c2", "Zürich"])
+        with CustomColumnSegment(self.path) as segment:
+            self.assertEqual("B", segment.codes().format)
+            self.assertEqual(["c1", "c2", "Zürich"], segment.dictionary())
+            self.assertEqual(["c1", "c2", "c1", "Zürich"], list(segment))
+
+    def test_empty_column(self):
+        CustomColumnSegment.write(self.path, "str", [], None, [])
+        with CustomColumnSegment(self.path) as segment:
+            self.assertEqual([], list(segment))
+
+    def test_sections_are_aligned(self):
+        CustomColumnSegment.write(self.path, "float", [1.0, 2.0],
+                                  bytearray([1, 0]))
+        with open(self.path, "rb") as file:
+            data = file.read()
+        self.assertEqual(0, data.index(array("d", [1.0, 2.0]).tobytes()) %
+                         CustomColumnSegment.alignment)
+
+    def test_not_a_segment(self):
+        with open(self.path, "wb") as file:
+            file.write(b"{}")
+        with self.assertRaises(ValueError):
+            CustomColumnSegment(self.path)
+        open(self.path, "wb").close()
+        with self.assertRaises(ValueError):
+            CustomColumnSegment(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
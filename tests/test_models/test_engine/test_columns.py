@@ -0,0 +1,96 @@
+#!/usr/bin/python3
+"""Defines unittests for models/engine/columns.py.
+
+Unittest classes:
+    TestCustomColumns
+"""
+import unittest
+from types import SimpleNamespace
+from models.engine import columns as columns_module
+from models.engine.columns import CustomColumns
+
+
+class TestCustomColumns(unittest.TestCase):
+    """Unittests for testing the CustomColumns columnar copy."""
+
+    attributes = {"city_id": str, "max_guest": int, "price_by_night": int,
+                  "latitude": float, "amenity_ids": list}
+
+    def setUp(self):
+        self.columns = CustomColumns(self.attributes)
+        rows = [("c1", 2, 100), ("c2", 4, 150), ("c1", 2, 50),
+                ("c2", 2, "free"), ("c3", 4, 300)]
+        self.columns.update(
+            ("P.{}".format(i), SimpleNamespace(city_id=city_id,
+                                               max_guest=guests,
+                                               price_by_night=price,
+                                               latitude=1.5))
+            for i, (city_id, guests, price) in enumerate(rows))
+
+    def test_columns(self):
+        self.assertEqual(5, len(self.columns))
+        self.assertEqual("q", self.columns.column("max_guest").typecode)
+        self.assertEqual([0, 1, 0, 1, 2],
+                         list(self.columns.column("city_id")))
+        self.assertEqual(["c1", "c2", "c3"],
+                         self.columns.dictionary("city_id"))
+        self.assertEqual([100, 150, 50, None, 300],
+                         self.columns.values("price_by_night"))
+        with self.assertRaises(KeyError):
+            self.columns.column("amenity_ids")
+
+    def test_aggregate(self):
+        self.assertEqual(600, self.columns.aggregate("price_by_night"))
+        self.assertEqual(150, self.columns.aggregate("price_by_night",
+                                                     "mean"))
+        self.assertEqual(50, self.columns.aggregate("price_by_night", "min"))
+        self.assertEqual(4, self.columns.aggregate("price_by_night",
+                                                   "count"))
+        self.assertEqual(7.5, self.columns.aggregate("latitude"))
+
+    def test_group_by(self):
+        self.assertEqual({"c1": 75, "c2": 150, "c3": 300},
+                         self.columns.group_by("city_id", "price_by_night",
+                                               "mean"))
+        self.assertEqual({2: 3, 4: 2}, self.columns.group_by("max_guest"))
+        self.assertEqual({2: 100, 4: 300},
+                         self.columns.group_by("max_guest", "price_by_night",
+                                               "max"))
+        with self.assertRaises(ValueError):
+            self.columns.group_by("max_guest", "price_by_night", "median")
+
+    def test_add_and_discard(self):
+        self.columns.add("P.0", SimpleNamespace(city_id="c3", max_guest=6,
+                                                price_by_night=10))
+        self.columns.discard("P.1")
+        self.columns.discard("P.9")
+        self.assertEqual(["P.0", "P.4", "P.2", "P.3"], self.columns.keys())
+        self.assertEqual({"c1": 1, "c2": 1, "c3": 2},
+                         self.columns.group_by("city_id"))
+        self.assertEqual([10, 300, 50, None],
+                         self.columns.values("price_by_night"))
+        self.assertEqual([None, 1.5, 1.5, 1.5],
+                         self.columns.values("latitude"))
+
+    def test_empty(self):
+        columns = CustomColumns(self.attributes)
+        self.assertEqual({}, columns.group_by("city_id"))
+        self.assertIsNone(columns.aggregate("price_by_night", "mean"))
+        self.assertEqual(0, columns.aggregate("price_by_night", "count"))
+
+    @unittest.skipIf(columns_module.numpy is None, "NumPy is not installed")
+    def test_numpy(self):
+        array = self.columns.to_numpy("price_by_night")
+        self.assertEqual([100, 150, 50, 0, 300], array.tolist())
+        self.assertEqual({"c1": 75, "c2": 150, "c3": 300},
+                         self.columns.group_by("city_id", "price_by_night",
+                                               "mean"))
+        self.assertEqual({2: 50, 4: 150},
+                         self.columns.group_by("max_guest", "price_by_night",
+                                               "min"))
+        self.columns.discard("P.0")
+        self.assertEqual(4, len(self.columns))
+
+
+if __name__ == "__main__":
+    unittest.main()
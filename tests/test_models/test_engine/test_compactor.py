@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+"""Defines unittests for models/engine/compactor.py.
+
+Unittest classes:
+    TestCustomCompactor
+"""
+import threading
+import unittest
+from unittest.mock import patch
+from models.engine.compactor import CustomCompactor
+
+
+class FakeStorage:
+    """Storage stub counting checkpoints."""
+
+    def __init__(self, journal_size):
+        self.journal_size = journal_size
+        self.checkpointed = threading.Event()
+
+    def get_journal_metrics(self):
+        return {"journal_size": self.journal_size}
+
+    def checkpoint(self):
+        self.journal_size = 0
+        self.checkpointed.set()
+
+
+class FailingStorage(FakeStorage):
+    """Storage stub whose first checkpoint fails."""
+
+    def __init__(self, journal_size):
+        super().__init__(journal_size)
+        self.failures = 1
+
+    def checkpoint(self):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("disk full")
+        super().checkpoint()
+
+
+class TestCustomCompactor(unittest.TestCase):
+    """Unittests for testing the CustomCompactor scheduler."""
+
+    def test_checkpoint_when_journal_is_large(self):
+        storage = FakeStorage(100)
+        compactor = CustomCompactor(storage, 0.02, 50)
+        self.assertTrue(storage.checkpointed.wait(2))
+        compactor.stop()
+
+    def test_failed_checkpoint_is_retried(self):
+        storage = FailingStorage(100)
+        with patch("traceback.print_exc") as report:
+            compactor = CustomCompactor(storage, 0.02, 50)
+            self.assertTrue(storage.checkpointed.wait(2))
+            compactor.stop()
+        self.assertEqual(1, report.call_count)
+
+    def test_no_checkpoint_when_journal_is_small(self):
+        storage = FakeStorage(10)
+        compactor = CustomCompactor(storage, 0.02, 50)
+        self.assertFalse(storage.checkpointed.wait(0.1))
+        compactor.stop()
+
+    def test_no_checkpoint_when_journal_is_empty(self):
+        storage = FakeStorage(0)
+        compactor = CustomCompactor(storage, 0.02, 0)
+        self.assertFalse(storage.checkpointed.wait(0.1))
+        compactor.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
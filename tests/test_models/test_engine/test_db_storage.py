@@ -0,0 +1,274 @@
+#!/usr/bin/python3
+"""Defines unittests for models/engine/db_storage.py.
+
+Unittest classes:
+    TestDBStorage_instantiation
+    TestDBStorage_methods
+"""
+import os
+import sqlite3
+import unittest
+from models.engine.db_storage import CustomDBStorage
+from models.engine.lazy_objects import CustomLazyObjects
+from models.city import City
+from models.place import Place
+from models.review import Review
+from models.user import User
+
+
+class TestDBStorage_instantiation(unittest.TestCase):
+    """Unittests for testing instantiation of the CustomDBStorage class."""
+
+    def test_DBStorage_instantiation_no_args(self):
+        self.assertEqual(type(CustomDBStorage()), CustomDBStorage)
+
+    def test_DBStorage_instantiation_with_arg(self):
+        with self.assertRaises(TypeError):
+            CustomDBStorage(None)
+
+    def test_DBStorage_db_path_is_private_str(self):
+        self.assertEqual(str, type(CustomDBStorage._CustomDBStorage__db_path))
+
+
+class TestDBStorage_methods(unittest.TestCase):
+    """Unittests for testing methods of the CustomDBStorage class."""
+
+    def setUp(self):
+        for name in ("custom_file.db", "custom_file.db-wal",
+                     "custom_file.db-shm"):
+            try:
+                os.rename(name, name + ".tmp")
+            except IOError:
+                pass
+        CustomDBStorage._CustomDBStorage__objects = {}
+        self.storage = CustomDBStorage()
+
+    def tearDown(self):
+        self.storage.close()
+        for name in ("custom_file.db", "custom_file.db-wal",
+                     "custom_file.db-shm"):
+            try:
+                os.remove(name)
+            except IOError:
+                pass
+            try:
+                os.rename(name + ".tmp", name)
+            except IOError:
+                pass
+        CustomDBStorage._CustomDBStorage__objects = {}
+
+    def test_new(self):
+        pl = Place()
+        self.storage.add_new_object(pl)
+        self.assertIn("Place." + pl.id, self.storage.get_all_objects())
+
+    def test_save_writes_rows(self):
+        pl = Place()
+        pl.name = "Loft"
+        pl.amenity_ids = ["wifi"]
+        self.storage.add_new_object(pl)
+        self.storage.save_data()
+        conn = sqlite3.connect("custom_file.db")
+        row = conn.execute('SELECT name, amenity_ids, number_rooms '
+                           'FROM "Place" WHERE id = ?', (pl.id,)).fetchone()
+        conn.close()
+        self.assertEqual(("Loft", '["wifi"]', 0), row)
+
+    def test_wal_mode(self):
+        self.storage.save_data()
+        conn = sqlite3.connect("custom_file.db")
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.close()
+        self.assertEqual("wal", mode)
+
+    def test_reload_builds_on_access(self):
+        pl = Place()
+        us = User()
+        self.storage.add_new_object(pl)
+        self.storage.add_new_object(us)
+        self.storage.save_data()
+        self.storage.reload_data()
+        objs = self.storage.get_all_objects()
+        self.assertIsInstance(objs, CustomLazyObjects)
+        self.assertIsNotNone(objs.get_record("User." + us.id))
+        self.assertEqual(pl.id, objs["Place." + pl.id].id)
+        self.assertIsNotNone(objs.get_record("User." + us.id))
+
+    def test_save_only_changed_rows(self):
+        pl = Place()
+        self.storage.add_new_object(pl)
+        self.storage.save_data()
+        self.storage.reload_data()
+        pl = self.storage.get_all_objects()["Place." + pl.id]
+        pl.name = "Loft"
+        self.storage.mark_dirty(pl)
+        self.storage.save_data()
+        self.storage.reload_data()
+        self.assertEqual(
+            "Loft", self.storage.get_all_objects()["Place." + pl.id].name)
+
+    def test_delete(self):
+        pl = Place()
+        self.storage.add_new_object(pl)
+        self.storage.save_data()
+        self.storage.delete_object(pl)
+        self.storage.save_data()
+        self.storage.reload_data()
+        self.assertNotIn("Place." + pl.id, self.storage.get_all_objects())
+
+    def user_with_email(self, email):
+        us = User()
+        us.__dict__["email"] = email
+        self.storage.add_new_object(us)
+        return us
+
+    def test_unique_index(self):
+        self.user_with_email("a@b.c")
+        self.storage.save_data()
+        conn = sqlite3.connect("custom_file.db")
+        try:
+            with self.assertRaises(sqlite3.IntegrityError):
+                conn.execute('INSERT INTO "User" (id, email, data) '
+                             'VALUES (?, ?, ?)', ("x", "a@b.c", "{}"))
+            conn.execute('INSERT INTO "User" (id, email, data) '
+                         'VALUES (?, ?, ?)', ("y", "", "{}"))
+        finally:
+            conn.close()
+
+    def test_mark_dirty_refuses_used_value(self):
+        self.user_with_email("a@b.c")
+        self.storage.save_data()
+        us = self.user_with_email("d@e.f")
+        us.__dict__["email"] = "a@b.c"
+        with self.assertRaises(ValueError):
+            self.storage.mark_dirty(us)
+        us.__dict__["email"] = ""
+        self.storage.mark_dirty(us)
+
+    def test_bulk_add_refuses_used_value(self):
+        self.user_with_email("a@b.c")
+        self.storage.save_data()
+        us = User()
+        us.__dict__["email"] = "a@b.c"
+        with self.assertRaises(ValueError):
+            self.storage.bulk_add([us])
+        us.__dict__["email"] = "d@e.f"
+        other = User()
+        other.__dict__["email"] = "d@e.f"
+        with self.assertRaises(ValueError):
+            self.storage.bulk_add([us, other])
+        self.assertNotIn("User." + us.id, self.storage.get_all_objects())
+
+    def test_values_move_between_objects(self):
+        first = self.user_with_email("a@b.c")
+        second = self.user_with_email("d@e.f")
+        self.storage.save_data()
+        for obj, email in ((first, "g@h.i"), (second, "a@b.c"),
+                           (first, "d@e.f")):
+            obj.__dict__["email"] = email
+            self.storage.mark_dirty(obj)
+        self.storage.save_data()
+        self.storage.reload_data()
+        objs = self.storage.get_all_objects()
+        self.assertEqual("d@e.f", objs["User." + first.id].email)
+        self.assertEqual("a@b.c", objs["User." + second.id].email)
+
+    def test_objects_by_class(self):
+        pl = Place()
+        us = User()
+        for obj in (pl, us):
+            self.storage.add_new_object(obj)
+        self.storage.save_data()
+        self.storage.reload_data()
+        self.assertEqual(1, self.storage.count_objects("Place"))
+        self.assertEqual([pl.id], [obj.id for obj in
+                                   self.storage.get_objects_by_class("Place")])
+
+
+    def test_objects_by_attribute(self):
+        ct1 = City()
+        ct2 = City()
+        for obj in (ct1, ct2):
+            obj.state_id = "s1"
+            self.storage.add_new_object(obj)
+        self.storage.save_data()
+        self.storage.reload_data()
+        ct = self.storage.get_all_objects()["City." + ct2.id]
+        ct.state_id = "s2"
+        self.storage.mark_dirty(ct)
+        found = self.storage.get_objects_by_attribute("City", "state_id", "s2")
+        self.assertEqual([ct2.id], [obj.id for obj in found])
+        found = self.storage.get_objects_by_attribute("City", "state_id", "s1")
+        self.assertEqual([ct1.id], [obj.id for obj in found])
+
+    def test_query(self):
+        ct1 = City()
+        ct2 = City()
+        for obj in (ct1, ct2):
+            obj.state_id = "s1"
+            self.storage.add_new_object(obj)
+        self.storage.save_data()
+        ct2.state_id = "s2"
+        self.storage.mark_dirty(ct2)
+        query = self.storage.query(City).where(state_id__in=["s2", "s3"])
+        self.assertEqual(("index", "state_id", "in"), query.explain())
+        self.assertEqual([ct2.id], [obj.id for obj in query])
+
+    def test_query_range(self):
+        places = []
+        for price in (50, 100, 150):
+            pl = Place()
+            pl.price_by_night = price
+            self.storage.add_new_object(pl)
+            places.append(pl)
+        self.storage.save_data()
+        places[2].price_by_night = 10
+        self.storage.mark_dirty(places[2])
+        query = self.storage.query(Place).where(price_by_night__lt=120)
+        self.assertEqual(("index", "price_by_night", "lt"), query.explain())
+        self.assertEqual(sorted(pl.id for pl in places),
+                         sorted(obj.id for obj in query))
+
+    def test_search_objects(self):
+        rv1 = Review()
+        rv1.text = "Lovely loft, lovely host"
+        rv2 = Review()
+        rv2.text = "The loft was cold"
+        for obj in (rv1, rv2):
+            self.storage.add_new_object(obj)
+        self.storage.save_data()
+        self.assertEqual([rv1.id, rv2.id],
+                         [obj.id for obj in
+                          self.storage.search_objects("Review", "lovely loft")])
+    def test_batch(self):
+        pl = Place()
+        self.storage.add_new_object(pl)
+        self.storage.save_data()
+        with self.assertRaises(RuntimeError):
+            with self.storage.batch():
+                self.storage.will_change(pl)
+                pl.name = "Loft"
+                self.storage.mark_dirty(pl)
+                self.storage.save_data()
+                self.storage.delete_object(pl)
+                raise RuntimeError
+        self.assertIs(pl, self.storage.get_all_objects()["Place." + pl.id])
+        self.assertFalse(hasattr(pl, "name") and pl.name == "Loft")
+        with self.storage.batch():
+            pl.name = "Barn"
+            self.storage.mark_dirty(pl)
+            self.storage.save_data()
+            self.assertEqual("", self.__name_in_db(pl))
+        self.assertEqual("Barn", self.__name_in_db(pl))
+
+    def __name_in_db(self, pl):
+        """Returns the name column of the row of pl"""
+        conn = sqlite3.connect("custom_file.db")
+        row = conn.execute('SELECT name FROM "Place" WHERE id = ?',
+                           (pl.id,)).fetchone()
+        conn.close()
+        return row[0]
+
+
+if __name__ == "__main__":
+    unittest.main()
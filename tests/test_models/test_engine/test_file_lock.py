@@ -0,0 +1,68 @@
+#!/usr/bin/python3
+"""Defines unittests for models/engine/file_lock.py.
+
+Unittest classes:
+    TestCustomFileLock
+"""
+import os
+import threading
+import unittest
+from models.engine.file_lock import CustomFileLock
+
+
+class TestCustomFileLock(unittest.TestCase):
+    """Unittests for testing the CustomFileLock lock."""
+
+    def setUp(self):
+        self.path = "test_file.lock"
+        self.lock = CustomFileLock(self.path)
+
+    def tearDown(self):
+        try:
+            os.remove(self.path)
+        except IOError:
+            pass
+
+    def test_generation(self):
+        with self.lock:
+            self.assertEqual(0, self.lock.generation())
+            self.assertEqual(1, self.lock.advance())
+        other = CustomFileLock(self.path)
+        with other:
+            self.assertEqual(1, other.generation())
+            self.assertEqual(2, other.advance())
+
+    def test_reentrant(self):
+        with self.lock:
+            with self.lock:
+                self.lock.advance()
+            self.assertEqual(1, self.lock.generation())
+
+    def test_threads_wait(self):
+        events = []
+
+        def take():
+            with self.lock:
+                events.append("other")
+
+        with self.lock:
+            thread = threading.Thread(target=take)
+            thread.start()
+            thread.join(0.2)
+            events.append("first")
+        thread.join()
+        self.assertEqual(["first", "other"], events)
+
+    def test_shared(self):
+        self.lock.acquire(shared=True)
+        other = CustomFileLock(self.path)
+        thread = threading.Thread(target=lambda: (
+            other.acquire(shared=True), other.release()))
+        thread.start()
+        thread.join(5)
+        self.lock.release()
+        self.assertFalse(thread.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()
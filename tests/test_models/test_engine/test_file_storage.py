@@ -4,14 +4,39 @@
 Unittest classes:
     TestFileStorage_instantiation
     TestFileStorage_methods
+    TestFileStorage_journal
+    TestFileStorage_dirty_tracking
+    TestFileStorage_lazy
+    TestFileStorage_shards
+    TestFileStorage_commit
+    TestFileStorage_checkpoint
+    TestFileStorage_binary
+    TestFileStorage_class_index
+    TestFileStorage_attribute_index
+    TestFileStorage_text_index
+    TestFileStorage_destroy
+    TestFileStorage_columns
+    TestFileStorage_bulk
+    TestFileStorage_batch
+    TestFileStorage_processes
 """
 import os
 import json
+import marshal
+import shutil
+import subprocess
+import sys
 import models
 import unittest
+import uuid
 from datetime import datetime
+from time import sleep
+from unittest.mock import patch
 from models.base_model import BaseModel
-from models.engine.file_storage import FileStorage
+from models.engine.file_storage import CustomFileStorage
+from models.engine.json_serializer import CustomJSONSerializer
+from models.engine.lazy_objects import CustomLazyObjects
+from models.engine.text_index import CustomTextIndex
 from models.user import User
 from models.state import State
 from models.place import Place
@@ -20,54 +45,54 @@ from models.amenity import Amenity
 from models.review import Review
 
 
-class TestFileStorage_instantiation(unittest.TestCase):
-    """Unittests for testing instantiation of the FileStorage class."""
+class TestCustomFileStorage_instantiation(unittest.TestCase):
+    """Unittests for testing instantiation of the CustomFileStorage class."""
 
-    def test_FileStorage_instantiation_no_args(self):
-        self.assertEqual(type(FileStorage()), FileStorage)
+    def test_CustomFileStorage_instantiation_no_args(self):
+        self.assertEqual(type(CustomFileStorage()), CustomFileStorage)
 
-    def test_FileStorage_instantiation_with_arg(self):
+    def test_CustomFileStorage_instantiation_with_arg(self):
         with self.assertRaises(TypeError):
-            FileStorage(None)
+            CustomFileStorage(None)
 
-    def test_FileStorage_file_path_is_private_str(self):
-        self.assertEqual(str, type(FileStorage._FileStorage__file_path))
+    def test_CustomFileStorage_file_path_is_private_str(self):
+        self.assertEqual(str, type(CustomFileStorage._CustomFileStorage__file_path))
 
-    def testFileStorage_objects_is_private_dict(self):
-        self.assertEqual(dict, type(FileStorage._FileStorage__objects))
+    def testCustomFileStorage_objects_is_private_dict(self):
+        self.assertEqual(dict, type(CustomFileStorage._CustomFileStorage__objects))
 
     def test_storage_initializes(self):
-        self.assertEqual(type(models.storage), FileStorage)
+        self.assertEqual(type(models.storage), CustomFileStorage)
 
 
-class TestFileStorage_methods(unittest.TestCase):
-    """Unittests for testing methods of the FileStorage class."""
+class TestCustomFileStorage_methods(unittest.TestCase):
+    """Unittests for testing methods of the CustomFileStorage class."""
 
     @classmethod
     def setUp(self):
         try:
-            os.rename("file.json", "tmp")
+            os.rename("custom_file.json", "tmp")
         except IOError:
             pass
 
     @classmethod
     def tearDown(self):
         try:
-            os.remove("file.json")
+            os.remove("custom_file.json")
         except IOError:
             pass
         try:
-            os.rename("tmp", "file.json")
+            os.rename("tmp", "custom_file.json")
         except IOError:
             pass
-        FileStorage._FileStorage__objects = {}
+        CustomFileStorage._CustomFileStorage__objects = {}
 
     def test_all(self):
-        self.assertEqual(dict, type(models.storage.all()))
+        self.assertEqual(dict, type(models.storage.get_all_objects()))
 
     def test_all_with_arg(self):
         with self.assertRaises(TypeError):
-            models.storage.all(None)
+            models.storage.get_all_objects(None)
 
     def test_new(self):
         bm = BaseModel()
@@ -77,35 +102,35 @@ class TestFileStorage_methods(unittest.TestCase):
         cy = City()
         am = Amenity()
         rv = Review()
-        models.storage.new(bm)
-        models.storage.new(us)
-        models.storage.new(st)
-        models.storage.new(pl)
-        models.storage.new(cy)
-        models.storage.new(am)
-        models.storage.new(rv)
-        self.assertIn("BaseModel." + bm.id, models.storage.all().keys())
-        self.assertIn(bm, models.storage.all().values())
-        self.assertIn("User." + us.id, models.storage.all().keys())
-        self.assertIn(us, models.storage.all().values())
-        self.assertIn("State." + st.id, models.storage.all().keys())
-        self.assertIn(st, models.storage.all().values())
-        self.assertIn("Place." + pl.id, models.storage.all().keys())
-        self.assertIn(pl, models.storage.all().values())
-        self.assertIn("City." + cy.id, models.storage.all().keys())
-        self.assertIn(cy, models.storage.all().values())
-        self.assertIn("Amenity." + am.id, models.storage.all().keys())
-        self.assertIn(am, models.storage.all().values())
-        self.assertIn("Review." + rv.id, models.storage.all().keys())
-        self.assertIn(rv, models.storage.all().values())
+        models.storage.add_new_object(bm)
+        models.storage.add_new_object(us)
+        models.storage.add_new_object(st)
+        models.storage.add_new_object(pl)
+        models.storage.add_new_object(cy)
+        models.storage.add_new_object(am)
+        models.storage.add_new_object(rv)
+        self.assertIn("BaseModel." + bm.id, models.storage.get_all_objects().keys())
+        self.assertIn(bm, models.storage.get_all_objects().values())
+        self.assertIn("User." + us.id, models.storage.get_all_objects().keys())
+        self.assertIn(us, models.storage.get_all_objects().values())
+        self.assertIn("State." + st.id, models.storage.get_all_objects().keys())
+        self.assertIn(st, models.storage.get_all_objects().values())
+        self.assertIn("Place." + pl.id, models.storage.get_all_objects().keys())
+        self.assertIn(pl, models.storage.get_all_objects().values())
+        self.assertIn("City." + cy.id, models.storage.get_all_objects().keys())
+        self.assertIn(cy, models.storage.get_all_objects().values())
+        self.assertIn("Amenity." + am.id, models.storage.get_all_objects().keys())
+        self.assertIn(am, models.storage.get_all_objects().values())
+        self.assertIn("Review." + rv.id, models.storage.get_all_objects().keys())
+        self.assertIn(rv, models.storage.get_all_objects().values())
 
     def test_new_with_args(self):
         with self.assertRaises(TypeError):
-            models.storage.new(BaseModel(), 1)
+            models.storage.add_new_object(BaseModel(), 1)
 
     def test_new_with_None(self):
         with self.assertRaises(AttributeError):
-            models.storage.new(None)
+            models.storage.add_new_object(None)
 
     def test_save(self):
         bm = BaseModel()
@@ -115,16 +140,16 @@ class TestFileStorage_methods(unittest.TestCase):
         cy = City()
         am = Amenity()
         rv = Review()
-        models.storage.new(bm)
-        models.storage.new(us)
-        models.storage.new(st)
-        models.storage.new(pl)
-        models.storage.new(cy)
-        models.storage.new(am)
-        models.storage.new(rv)
-        models.storage.save()
+        models.storage.add_new_object(bm)
+        models.storage.add_new_object(us)
+        models.storage.add_new_object(st)
+        models.storage.add_new_object(pl)
+        models.storage.add_new_object(cy)
+        models.storage.add_new_object(am)
+        models.storage.add_new_object(rv)
+        models.storage.save_data()
         save_text = ""
-        with open("file.json", "r") as f:
+        with open("custom_file.json", "r") as f:
             save_text = f.read()
             self.assertIn("BaseModel." + bm.id, save_text)
             self.assertIn("User." + us.id, save_text)
@@ -136,7 +161,7 @@ class TestFileStorage_methods(unittest.TestCase):
 
     def test_save_with_arg(self):
         with self.assertRaises(TypeError):
-            models.storage.save(None)
+            models.storage.save_data(None)
 
     def test_reload(self):
         bm = BaseModel()
@@ -146,16 +171,16 @@ class TestFileStorage_methods(unittest.TestCase):
         cy = City()
         am = Amenity()
         rv = Review()
-        models.storage.new(bm)
-        models.storage.new(us)
-        models.storage.new(st)
-        models.storage.new(pl)
-        models.storage.new(cy)
-        models.storage.new(am)
-        models.storage.new(rv)
-        models.storage.save()
-        models.storage.reload()
-        objs = FileStorage._FileStorage__objects
+        models.storage.add_new_object(bm)
+        models.storage.add_new_object(us)
+        models.storage.add_new_object(st)
+        models.storage.add_new_object(pl)
+        models.storage.add_new_object(cy)
+        models.storage.add_new_object(am)
+        models.storage.add_new_object(rv)
+        models.storage.save_data()
+        models.storage.reload_data()
+        objs = CustomFileStorage._CustomFileStorage__objects
         self.assertIn("BaseModel." + bm.id, objs)
         self.assertIn("User." + us.id, objs)
         self.assertIn("State." + st.id, objs)
@@ -166,9 +191,1445 @@ class TestFileStorage_methods(unittest.TestCase):
 
     def test_reload_with_arg(self):
         with self.assertRaises(TypeError):
-            models.storage.reload(None)
+            models.storage.reload_data(None)
+
+
+class TestFileStorage_journal(unittest.TestCase):
+    """Unittests for testing the journaled mode of CustomFileStorage."""
+
+    def setUp(self):
+        for name in ("custom_file.json", "custom_file.json.journal"):
+            try:
+                os.rename(name, name + ".tmp")
+            except IOError:
+                pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage = CustomFileStorage(journaled=True)
+
+    def tearDown(self):
+        for name in ("custom_file.json", "custom_file.json.journal"):
+            try:
+                os.remove(name)
+            except IOError:
+                pass
+            try:
+                os.rename(name + ".tmp", name)
+            except IOError:
+                pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+
+    def test_journaled_with_positional_arg(self):
+        with self.assertRaises(TypeError):
+            CustomFileStorage(True)
+
+    def test_save_appends_only_changed_objects(self):
+        us = User()
+        pl = Place()
+        self.storage.save_data()
+        pl.name = "Loft"
+        self.storage.mark_dirty(pl)
+        self.storage.save_data()
+        with open("custom_file.json.journal", "r") as f:
+            lines = f.readlines()
+        self.assertEqual(3, len(lines))
+        self.assertIn("Place." + pl.id, lines[-1])
+        self.assertNotIn("User." + us.id, lines[-1])
+        self.assertFalse(os.path.isfile("custom_file.json"))
+
+    def test_reload_replays_journal(self):
+        us = User()
+        pl = Place()
+        self.storage.save_data()
+        self.storage.delete_object(us)
+        self.storage.save_data()
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage.reload_data()
+        objs = self.storage.get_all_objects()
+        self.assertIn("Place." + pl.id, objs)
+        self.assertNotIn("User." + us.id, objs)
+
+    def test_reload_ignores_torn_last_record(self):
+        pl = Place()
+        self.storage.save_data()
+        with open("custom_file.json.journal", "a") as f:
+            f.write('{"op": "put", "key": "Pl')
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage.reload_data()
+        self.assertIn("Place." + pl.id, self.storage.get_all_objects())
+
+    def test_full_save_folds_journal(self):
+        pl = Place()
+        self.storage.save_data()
+        CustomFileStorage().save_data()
+        self.assertFalse(os.path.isfile("custom_file.json.journal"))
+        with open("custom_file.json", "r") as f:
+            self.assertIn("Place." + pl.id, f.read())
+
+
+class TestFileStorage_dirty_tracking(unittest.TestCase):
+    """Unittests for testing dirty tracking and the fragment cache."""
+
+    def setUp(self):
+        try:
+            os.rename("custom_file.json", "tmp")
+        except IOError:
+            pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage = CustomFileStorage()
+
+    def tearDown(self):
+        try:
+            os.remove("custom_file.json")
+        except IOError:
+            pass
+        try:
+            os.rename("tmp", "custom_file.json")
+        except IOError:
+            pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+
+    def test_setattr_marks_dirty(self):
+        pl = Place()
+        self.storage.save_data()
+        pl.name = "Loft"
+        self.assertIn("Place." + pl.id,
+                      CustomFileStorage._CustomFileStorage__dirty)
+
+    def test_save_uses_cached_fragments(self):
+        pl = Place()
+        us = User()
+        self.storage.save_data()
+        fragments = CustomFileStorage._CustomFileStorage__fragments
+        fragments["User." + us.id] = \
+            json.dumps("User." + us.id).encode() + b': "cached"'
+        pl.name = "Loft"
+        self.storage.save_data()
+        with open("custom_file.json", "r") as f:
+            data = json.load(f)
+        self.assertEqual("cached", data["User." + us.id])
+        self.assertEqual("Loft", data["Place." + pl.id]["name"])
+
+    def test_reload_fills_fragments(self):
+        pl = Place()
+        User()
+        self.storage.save_data()
+        with open("custom_file.json", "rb") as f:
+            saved = f.read()
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage.reload_data()
+        key = "Place." + pl.id
+        self.storage.get_all_objects()[key].name = "Loft"
+        with patch.object(CustomJSONSerializer, "encode",
+                          wraps=CustomJSONSerializer().encode) as encode:
+            self.storage.save_data()
+        self.assertEqual([key], [call.args[0] for call in
+                                 encode.call_args_list])
+        with open("custom_file.json", "rb") as f:
+            self.assertEqual(len(saved.splitlines()),
+                             len(f.read().splitlines()))
+
+    def test_save_drops_deleted_fragments(self):
+        pl = Place()
+        self.storage.save_data()
+        self.storage.delete_object(pl)
+        self.storage.save_data()
+        with open("custom_file.json", "r") as f:
+            self.assertEqual({}, json.load(f))
+
+
+class TestFileStorage_lazy(unittest.TestCase):
+    """Unittests for testing the lazy mode of CustomFileStorage."""
+
+    def setUp(self):
+        try:
+            os.rename("custom_file.json", "tmp")
+        except IOError:
+            pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage = CustomFileStorage(lazy=True)
+        self.pl = Place()
+        self.us = User()
+        self.storage.save_data()
+        self.storage.reload_data()
+
+    def tearDown(self):
+        try:
+            os.remove("custom_file.json")
+        except IOError:
+            pass
+        try:
+            os.rename("tmp", "custom_file.json")
+        except IOError:
+            pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+
+    def test_reload_keeps_encoded_records(self):
+        objs = self.storage.get_all_objects()
+        self.assertIsInstance(objs, CustomLazyObjects)
+        key = "Place." + self.pl.id
+        self.assertIs(bytes, type(dict.__getitem__(objs, key)))
+        self.assertEqual(self.pl.id, objs.get_record(key)["id"])
+        self.assertNotIn("__version__", objs.get_record(key))
+
+    def test_binary_reload_keeps_encoded_records(self):
+        storage = CustomFileStorage(lazy=True, file_format="binary")
+        try:
+            storage.convert("binary")
+            storage.reload_data()
+            objs = storage.get_all_objects()
+            key = "User." + self.us.id
+            self.assertIs(bytes, type(dict.__getitem__(objs, key)))
+            self.assertIs(User, type(objs[key]))
+            self.assertEqual(self.us.created_at, objs[key].created_at)
+        finally:
+            storage.convert("json")
+            os.remove("custom_file.bin") if os.path.isfile(
+                "custom_file.bin") else None
+
+    def test_access_builds_instance(self):
+        pl = self.storage.get_all_objects()["Place." + self.pl.id]
+        self.assertIs(Place, type(pl))
+        self.assertEqual(self.pl.id, pl.id)
+
+    def test_save_without_building(self):
+        objs = self.storage.get_all_objects()
+        objs["Place." + self.pl.id].name = "Loft"
+        self.storage.save_data()
+        self.assertIsNotNone(objs.get_record("User." + self.us.id))
+        with open("custom_file.json", "r") as f:
+            data = json.load(f)
+        self.assertIn("User." + self.us.id, data)
+        self.assertEqual("Loft", data["Place." + self.pl.id]["name"])
+
+
+class TestFileStorage_shards(unittest.TestCase):
+    """Unittests for testing the sharded mode of CustomFileStorage."""
+
+    def setUp(self):
+        for name in ("custom_file.json", "custom_file.shards"):
+            try:
+                os.rename(name, name + ".tmp")
+            except IOError:
+                pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage = CustomFileStorage(shards=2)
+
+    def tearDown(self):
+        try:
+            os.remove("custom_file.json")
+        except IOError:
+            pass
+        shutil.rmtree("custom_file.shards", ignore_errors=True)
+        for name in ("custom_file.json", "custom_file.shards"):
+            try:
+                os.rename(name + ".tmp", name)
+            except IOError:
+                pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+
+    def shard_files(self):
+        return sorted(os.listdir("custom_file.shards"))
+
+    def test_one_file_per_class_partition(self):
+        pl = Place()
+        us = User()
+        self.storage.save_data()
+        names = self.shard_files()
+        self.assertEqual(2, len(names))
+        self.assertTrue(names[0].startswith("Place."))
+        self.assertTrue(names[1].startswith("User."))
+        self.assertFalse(os.path.isfile("custom_file.json"))
+
+    def test_save_rewrites_only_changed_shards(self):
+        pl = Place()
+        us = User()
+        self.storage.save_data()
+        user_file = os.path.join("custom_file.shards", self.shard_files()[1])
+        mtime = os.stat(user_file).st_mtime_ns
+        os.utime(user_file, ns=(mtime - 10 ** 9, mtime - 10 ** 9))
+        pl.name = "Loft"
+        self.storage.save_data()
+        self.assertEqual(mtime - 10 ** 9, os.stat(user_file).st_mtime_ns)
+
+    def test_reload_reads_all_shards(self):
+        pls = [Place() for i in range(10)]
+        us = User()
+        self.storage.save_data()
+        self.storage.delete_object(pls[0])
+        self.storage.save_data()
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage.reload_data()
+        objs = self.storage.get_all_objects()
+        self.assertEqual(10, len(objs))
+        self.assertNotIn("Place." + pls[0].id, objs)
+        self.assertIn("User." + us.id, objs)
+
+    def test_single_file_converted_to_shards(self):
+        pl = Place()
+        CustomFileStorage().save_data()
+        self.storage.reload_data()
+        self.storage.save_data()
+        self.assertFalse(os.path.isfile("custom_file.json"))
+        self.storage.reload_data()
+        self.assertIn("Place." + pl.id, self.storage.get_all_objects())
+
+    def test_full_save_removes_shards(self):
+        pl = Place()
+        self.storage.save_data()
+        CustomFileStorage().save_data()
+        self.assertFalse(os.path.isdir("custom_file.shards"))
+
+
+class TestFileStorage_commit(unittest.TestCase):
+    """Unittests for testing atomic saves and commit windows."""
+
+    def setUp(self):
+        try:
+            os.rename("custom_file.json", "tmp")
+        except IOError:
+            pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+
+    def tearDown(self):
+        try:
+            os.remove("custom_file.json")
+        except IOError:
+            pass
+        try:
+            os.rename("tmp", "custom_file.json")
+        except IOError:
+            pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+
+    def test_save_leaves_no_temporary_file(self):
+        pl = Place()
+        CustomFileStorage().save_data()
+        self.assertEqual([], [name for name in os.listdir(".")
+                              if name.startswith("custom_file.json.")])
+
+    def test_failed_save_keeps_previous_file(self):
+        storage = CustomFileStorage()
+        pl = Place()
+        storage.save_data()
+        us = User()
+        with patch("os.replace", side_effect=OSError):
+            with self.assertRaises(OSError):
+                storage.save_data()
+        with open("custom_file.json", "r") as f:
+            data = json.load(f)
+        self.assertIn("Place." + pl.id, data)
+        self.assertNotIn("User." + us.id, data)
+        for name in os.listdir("."):
+            if name.startswith("custom_file.json."):
+                os.remove(name)
+
+    def test_write_behind_defers_save(self):
+        storage = CustomFileStorage(flush_interval=10000)
+        pl = Place()
+        storage.save_data()
+        self.assertFalse(os.path.isfile("custom_file.json"))
+        storage.flush()
+        storage.close()
+        with open("custom_file.json", "r") as f:
+            self.assertIn("Place." + pl.id, f.read())
+
+    def test_write_behind_threshold(self):
+        storage = CustomFileStorage(flush_threshold=2)
+        pl = Place()
+        storage.save_data()
+        us = User()
+        storage.save_data()
+        sleep(0.3)
+        storage.close()
+        with open("custom_file.json", "r") as f:
+            self.assertIn("User." + us.id, f.read())
+
+    def test_commit_window_groups_saves(self):
+        storage = CustomFileStorage(commit_window=50)
+        pl = Place()
+        storage.save_data()
+        us = User()
+        storage.save_data()
+        self.assertFalse(os.path.isfile("custom_file.json"))
+        sleep(0.3)
+        with open("custom_file.json", "r") as f:
+            data = json.load(f)
+        self.assertIn("Place." + pl.id, data)
+        self.assertIn("User." + us.id, data)
+
+    def test_failed_write_behind_stays_pending(self):
+        storage = CustomFileStorage(flush_threshold=1)
+        with patch("os.replace", side_effect=OSError), \
+                patch("traceback.print_exc") as report:
+            pl = Place()
+            storage.save_data()
+            sleep(0.3)
+        self.assertEqual(1, report.call_count)
+        self.assertFalse(os.path.isfile("custom_file.json"))
+        us = User()
+        storage.save_data()
+        sleep(0.3)
+        with open("custom_file.json", "r") as f:
+            data = json.load(f)
+        self.assertIn("Place." + pl.id, data)
+        self.assertIn("User." + us.id, data)
+        storage.close()
+        for name in os.listdir("."):
+            if name.startswith("custom_file.json."):
+                os.remove(name)
+
+    def test_failed_commit_window_stays_pending(self):
+        storage = CustomFileStorage(commit_window=20)
+        with patch("os.replace", side_effect=OSError), \
+                patch("traceback.print_exc") as report:
+            pl = Place()
+            storage.save_data()
+            sleep(0.3)
+        self.assertEqual(1, report.call_count)
+        storage.flush()
+        with open("custom_file.json", "r") as f:
+            self.assertIn("Place." + pl.id, f.read())
+        for name in os.listdir("."):
+            if name.startswith("custom_file.json."):
+                os.remove(name)
+
+
+class TestFileStorage_checkpoint(unittest.TestCase):
+    """Unittests for testing journal checkpoints of CustomFileStorage."""
+
+    names = ("custom_file.json", "custom_file.json.journal",
+             "custom_file.json.journal.1")
+
+    def setUp(self):
+        for name in self.names:
+            try:
+                os.rename(name, name + ".tmp")
+            except IOError:
+                pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage = CustomFileStorage(journaled=True)
+
+    def tearDown(self):
+        for name in self.names:
+            try:
+                os.remove(name)
+            except IOError:
+                pass
+            try:
+                os.rename(name + ".tmp", name)
+            except IOError:
+                pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+
+    def test_checkpoint_folds_journal(self):
+        pl = Place()
+        us = User()
+        self.storage.save_data()
+        self.storage.delete_object(us)
+        self.storage.save_data()
+        self.storage.checkpoint()
+        self.assertEqual(0, self.storage.get_journal_metrics()["journal_size"])
+        with open("custom_file.json", "r") as f:
+            data = json.load(f)
+        self.assertIn("Place." + pl.id, data)
+        self.assertNotIn("User." + us.id, data)
+
+    def test_checkpoint_includes_unsaved_changes(self):
+        pl = Place()
+        self.storage.checkpoint()
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage.reload_data()
+        self.assertIn("Place." + pl.id, self.storage.get_all_objects())
+
+    def test_reload_replays_rotated_journal(self):
+        pl = Place()
+        self.storage.save_data()
+        os.rename("custom_file.json.journal", "custom_file.json.journal.1")
+        us = User()
+        self.storage.save_data()
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage.reload_data()
+        objs = self.storage.get_all_objects()
+        self.assertIn("Place." + pl.id, objs)
+        self.assertIn("User." + us.id, objs)
+
+    def test_reload_cuts_torn_record(self):
+        pl = Place()
+        self.storage.save_data()
+        size = os.path.getsize("custom_file.json.journal")
+        with open("custom_file.json.journal", "a") as f:
+            f.write('{"op": "put", "key": "Pl')
+        self.storage.reload_data()
+        self.assertEqual(size, os.path.getsize("custom_file.json.journal"))
+
+    def test_metrics(self):
+        pl = Place()
+        self.storage.save_data()
+        metrics = self.storage.get_journal_metrics()
+        self.assertLess(0, metrics["journal_size"])
+        self.assertEqual(1, metrics["journal_records"])
+        self.storage.reload_data()
+        metrics = self.storage.get_journal_metrics()
+        self.assertEqual(1, metrics["journal_records"])
+        self.assertLessEqual(0, metrics["replay_time"])
+        self.storage.checkpoint()
+        metrics = self.storage.get_journal_metrics()
+        self.assertEqual(0, metrics["journal_records"])
+        self.assertEqual(datetime, type(metrics["last_checkpoint"]))
+
+    def test_background_checkpoint(self):
+        storage = CustomFileStorage(journaled=True, checkpoint_interval=20)
+        pl = Place()
+        storage.save_data()
+        sleep(0.3)
+        storage.close()
+        self.assertFalse(os.path.isfile("custom_file.json.journal"))
+        with open("custom_file.json", "r") as f:
+            self.assertIn("Place." + pl.id, f.read())
+
+
+
+class TestFileStorage_binary(unittest.TestCase):
+    """Unittests for testing the binary format of CustomFileStorage."""
+
+    names = ("custom_file.json", "custom_file.bin", "custom_file.json.journal")
+
+    def setUp(self):
+        for name in self.names:
+            try:
+                os.rename(name, name + ".tmp")
+            except IOError:
+                pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage = CustomFileStorage(file_format="binary")
+
+    def tearDown(self):
+        for name in self.names:
+            try:
+                os.remove(name)
+            except IOError:
+                pass
+            try:
+                os.rename(name + ".tmp", name)
+            except IOError:
+                pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+
+    def test_save_writes_binary_file(self):
+        Place()
+        self.storage.save_data()
+        self.assertTrue(os.path.isfile("custom_file.bin"))
+        self.assertFalse(os.path.isfile("custom_file.json"))
+
+    def test_reload_binary_file(self):
+        pl = Place()
+        pl.name = "Loft"
+        pl.amenity_ids = ["a", "b"]
+        pl.extra = 1.5
+        self.storage.save_data()
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage.reload_data()
+        obj = self.storage.get_all_objects()["Place." + pl.id]
+        self.assertEqual(pl.to_dict(), obj.to_dict())
+
+    def test_convert_to_json(self):
+        pl = Place()
+        self.storage.save_data()
+        self.storage.convert("json")
+        self.assertFalse(os.path.isfile("custom_file.bin"))
+        with open("custom_file.json", "r") as f:
+            self.assertIn("Place." + pl.id, json.load(f))
+
+    def test_convert_from_json(self):
+        pl = Place()
+        storage = CustomFileStorage()
+        storage.save_data()
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage.reload_data()
+        self.storage.convert("binary")
+        self.assertFalse(os.path.isfile("custom_file.json"))
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage.reload_data()
+        self.assertIn("Place." + pl.id, self.storage.get_all_objects())
+
+    def test_reload_dates_without_parsing(self):
+        pl = Place()
+        self.storage.save_data()
+        CustomFileStorage._CustomFileStorage__objects = {}
+        with patch("models.base_model.datetime") as mock_datetime:
+            self.storage.reload_data()
+            obj = self.storage.get_all_objects()["Place." + pl.id]
+        mock_datetime.strptime.assert_not_called()
+        self.assertEqual(pl.created_at, obj.created_at)
+        self.assertEqual(pl.updated_at, obj.updated_at)
+
+    def test_convert_unbuilt_to_json(self):
+        pl = Place()
+        self.storage.save_data()
+        storage = CustomFileStorage(lazy=True, file_format="binary")
+        storage.reload_data()
+        storage.convert("json")
+        with open("custom_file.json", "r") as f:
+            record = json.load(f)["Place." + pl.id]
+        self.assertEqual(pl.created_at.isoformat(), record["created_at"])
+
+    def test_convert_journaled(self):
+        storage = CustomFileStorage(journaled=True)
+        pl = Place()
+        storage.save_data()
+        storage.convert("binary")
+        self.assertEqual(0, storage.get_journal_metrics()["journal_size"])
+        self.assertTrue(os.path.isfile("custom_file.bin"))
+        CustomFileStorage._CustomFileStorage__objects = {}
+        storage.reload_data()
+        self.assertIn("Place." + pl.id, storage.get_all_objects())
+
+class TestFileStorage_class_index(unittest.TestCase):
+    """Unittests for testing the per-class index of CustomFileStorage."""
+
+    def setUp(self):
+        try:
+            os.rename("custom_file.json", "tmp")
+        except IOError:
+            pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage = CustomFileStorage()
+
+    def tearDown(self):
+        try:
+            os.remove("custom_file.json")
+        except IOError:
+            pass
+        try:
+            os.rename("tmp", "custom_file.json")
+        except IOError:
+            pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+
+    def test_count_objects(self):
+        Place()
+        Place()
+        User()
+        self.assertEqual(2, self.storage.count_objects("Place"))
+        self.assertEqual(1, self.storage.count_objects("User"))
+        self.assertEqual(0, self.storage.count_objects("Review"))
+
+    def test_objects_by_class(self):
+        pl1 = Place()
+        User()
+        pl2 = Place()
+        self.assertEqual([pl1, pl2],
+                         list(self.storage.get_objects_by_class("Place")))
+
+    def test_delete_updates_index(self):
+        pl = Place()
+        self.storage.delete_object(pl)
+        self.assertEqual(0, self.storage.count_objects("Place"))
+        self.assertEqual([], list(self.storage.get_objects_by_class("Place")))
+
+    def test_reload_rebuilds_index(self):
+        pl = Place()
+        self.storage.save_data()
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.assertEqual(0, self.storage.count_objects("Place"))
+        self.storage.reload_data()
+        self.assertEqual(1, self.storage.count_objects("Place"))
+        self.assertEqual([pl.id], [obj.id for obj in
+                                   self.storage.get_objects_by_class("Place")])
+
+class TestFileStorage_attribute_index(unittest.TestCase):
+    """Unittests for testing the attribute indexes of CustomFileStorage."""
+
+    def setUp(self):
+        try:
+            os.rename("custom_file.json", "tmp")
+        except IOError:
+            pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage = CustomFileStorage()
+
+    def tearDown(self):
+        try:
+            os.remove("custom_file.json")
+        except IOError:
+            pass
+        try:
+            os.rename("tmp", "custom_file.json")
+        except IOError:
+            pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+
+    def find(self, class_name, name, value):
+        return [obj.id for obj in
+                self.storage.get_objects_by_attribute(class_name, name, value)]
+
+    def test_lookup_follows_setattr(self):
+        ct = City()
+        ct.state_id = "s1"
+        self.assertEqual([ct.id], self.find("City", "state_id", "s1"))
+        ct.state_id = "s2"
+        self.assertEqual([], self.find("City", "state_id", "s1"))
+        self.assertEqual([ct.id], self.find("City", "state_id", "s2"))
+
+    def test_lookup_after_delete(self):
+        rv = Review()
+        rv.place_id = "p1"
+        self.storage.delete_object(rv)
+        self.assertEqual([], self.find("Review", "place_id", "p1"))
+
+    def test_lookup_without_index(self):
+        st = State()
+        st.name = "Texas"
+        self.assertEqual([st.id], self.find("State", "name", "Texas"))
+
+    def test_reload_rebuilds_indexes(self):
+        pl = Place()
+        pl.city_id = "c1"
+        self.storage.save_data()
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage.reload_data()
+        self.assertEqual([pl.id], self.find("Place", "city_id", "c1"))
+
+    def test_lazy_reload_rebuilds_indexes(self):
+        pl = Place()
+        pl.user_id = "u1"
+        self.storage.save_data()
+        CustomFileStorage._CustomFileStorage__objects = {}
+        storage = CustomFileStorage(lazy=True)
+        storage.reload_data()
+        found = storage.get_objects_by_attribute("Place", "user_id", "u1")
+        self.assertEqual([pl.id], [obj.id for obj in found])
+
+    def test_reload_defers_indexes(self):
+        pl = Place()
+        pl.city_id = "c1"
+        self.storage.save_data()
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage.reload_data()
+        self.storage.count_objects("Place")
+        indexes = CustomFileStorage._CustomFileStorage__attribute_indexes
+        self.assertEqual({}, indexes)
+        self.assertEqual([pl.id], self.find("Place", "city_id", "c1"))
+        self.assertEqual(["Place"], list(indexes))
+
+    def test_changes_before_first_use(self):
+        pl = Place()
+        pl.city_id = "c1"
+        self.storage.save_data()
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage.reload_data()
+        key = "Place." + pl.id
+        self.storage.get_all_objects()[key].city_id = "c2"
+        self.assertEqual([], self.find("Place", "city_id", "c1"))
+        self.assertEqual([pl.id], self.find("Place", "city_id", "c2"))
+
+    def test_unique_checked_before_first_use(self):
+        us1 = User()
+        us1.email = "a@b.c"
+        us2 = User()
+        self.storage.save_data()
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage.reload_data()
+        objects = self.storage.get_all_objects()
+        with self.assertRaises(ValueError):
+            objects["User." + us2.id].email = "a@b.c"
+        self.assertEqual([us1.id], self.find("User", "email", "a@b.c"))
+
+    def test_unique_email(self):
+        us1 = User()
+        us2 = User()
+        us1.email = "a@b.c"
+        with self.assertRaises(ValueError):
+            us2.email = "a@b.c"
+        self.assertEqual("", us2.email)
+        self.assertEqual([us1.id], self.find("User", "email", "a@b.c"))
+        us1.email = "d@e.f"
+        us2.email = "a@b.c"
+        self.assertEqual([us2.id], self.find("User", "email", "a@b.c"))
+
+    def test_geo_searches(self):
+        places = []
+        for lat, lon in ((40.7128, -74.0060), (40.7178, -74.0431),
+                         (42.3601, -71.0589)):
+            pl = Place()
+            pl.latitude = lat
+            pl.longitude = lon
+            places.append(pl)
+        near = self.storage.get_objects_near("Place", 40.7128, -74.0060, 5)
+        self.assertEqual(places[:2], list(near))
+        box = self.storage.get_objects_in_box("Place", 42, -72, 43, -71)
+        self.assertEqual([places[2]], list(box))
+        places[2].latitude = 40.72
+        places[2].longitude = -74.01
+        nearest = self.storage.get_nearest_objects("Place", 40.7128,
+                                                   -74.0060, 2)
+        self.assertEqual([places[0], places[2]], list(nearest))
+
+    def test_geo_search_without_index(self):
+        st = State()
+        st.latitude = 30.2672
+        st.longitude = -97.7431
+        near = self.storage.get_objects_near("State", 30.27, -97.74, 5)
+        self.assertEqual([st], list(near))
+
+    def test_members(self):
+        pl1 = Place()
+        pl1.amenity_ids = ["wifi", "pool"]
+        pl2 = Place()
+        pl2.amenity_ids = ["wifi", "smoking"]
+        Place()
+        found = self.storage.get_objects_by_members(
+            "Place", "amenity_ids", all_of=["wifi"], none_of=["smoking"])
+        self.assertEqual([pl1], list(found))
+        found = self.storage.get_objects_by_members(
+            "Place", "amenity_ids", any_of=["pool", "smoking"])
+        self.assertEqual({pl1, pl2}, set(found))
+        query = self.storage.query(Place).where(amenity_ids__contains="pool")
+        self.assertEqual(("index", "amenity_ids", "contains"),
+                         query.explain())
+        self.assertEqual([pl1], list(query))
+
+    def test_members_follow_update(self):
+        pl = Place()
+        pl.amenity_ids = ["wifi"]
+        pl.amenity_ids.append("pool")
+        self.storage.mark_dirty(pl)
+        found = self.storage.get_objects_by_members("Place", "amenity_ids",
+                                                    all_of=["pool"])
+        self.assertEqual([pl], list(found))
+        pl.amenity_ids = ["gym"]
+        found = self.storage.get_objects_by_members("Place", "amenity_ids",
+                                                    any_of=["wifi", "pool"])
+        self.assertEqual([], list(found))
+
+    def test_members_without_index(self):
+        us = User()
+        us.tags = ["admin", "beta"]
+        found = self.storage.get_objects_by_members("User", "tags",
+                                                    all_of=["beta"])
+        self.assertEqual([us], list(found))
+
+
+class TestFileStorage_text_index(unittest.TestCase):
+    """Unittests for testing the full-text search of CustomFileStorage."""
+
+    names = ("custom_file.json", "custom_file.json.journal",
+             "custom_file.text_index")
+
+    def setUp(self):
+        for name in self.names:
+            try:
+                os.rename(name, name + ".tmp")
+            except IOError:
+                pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage = CustomFileStorage()
+
+    def tearDown(self):
+        for name in self.names:
+            try:
+                os.remove(name)
+            except IOError:
+                pass
+            try:
+                os.rename(name + ".tmp", name)
+            except IOError:
+                pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+
+    def test_search_objects(self):
+        rv1 = Review()
+        rv1.text = "Lovely loft, lovely host"
+        rv2 = Review()
+        rv2.text = "The loft was cold"
+        Review().text = "Great breakfast"
+        self.assertEqual([rv1, rv2],
+                         list(self.storage.search_objects("Review", "LOVELY loft")))
+        self.assertEqual([rv1], list(self.storage.search_objects(
+            "Review", "loft", limit=1)))
+        rv1.text = "Noisy street"
+        self.assertEqual([rv2], list(self.storage.search_objects("Review",
+                                                                 "loft")))
+        self.storage.delete_object(rv2)
+        self.assertEqual([], list(self.storage.search_objects("Review",
+                                                              "loft")))
+
+    def test_search_objects_without_index(self):
+        Amenity().name = "wifi"
+        self.assertEqual([], list(self.storage.search_objects("Amenity",
+                                                              "wifi")))
+
+    def test_saved_index_is_reused(self):
+        pl = Place()
+        pl.description = "Cabin by the lake"
+        self.storage.save_data()
+        list(self.storage.search_objects("Place", "lake"))
+        self.storage.close()
+        self.assertTrue(os.path.isfile("custom_file.text_index"))
+        CustomFileStorage._CustomFileStorage__objects = {}
+        with patch.object(CustomTextIndex, "tokenize",
+                          return_value=["lake"]) as tokenize:
+            self.storage.reload_data()
+            found = list(self.storage.search_objects("Place", "lake"))
+        self.assertEqual(1, tokenize.call_count)
+        self.assertEqual(["Place." + pl.id],
+                         ["Place." + obj.id for obj in found])
+
+    def test_changes_before_first_use(self):
+        pl1 = Place()
+        pl1.description = "Cabin by the lake"
+        pl2 = Place()
+        pl2.description = "Lake view"
+        self.storage.save_data()
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage.reload_data()
+        objects = self.storage.get_all_objects()
+        objects["Place." + pl1.id].description = "Flat in town"
+        self.storage.delete_object(objects["Place." + pl2.id])
+        self.assertEqual([], list(self.storage.search_objects("Place",
+                                                              "lake")))
+        self.assertEqual(1, len(list(self.storage.search_objects("Place",
+                                                                 "town"))))
+
+    def test_other_marshal_version_is_rebuilt(self):
+        pl = Place()
+        pl.description = "Cabin by the lake"
+        self.storage.checkpoint()
+        with open("custom_file.text_index", "r+b") as f:
+            f.seek(4)
+            f.write(bytes((marshal.version + 1,)))
+        CustomFileStorage._CustomFileStorage__objects = {}
+        with patch.object(CustomTextIndex, "load") as load:
+            self.storage.reload_data()
+            found = list(self.storage.search_objects("Place", "lake"))
+        self.assertEqual(0, load.call_count)
+        self.assertEqual(["Place." + pl.id],
+                         ["Place." + obj.id for obj in found])
+
+    def test_stale_index_is_rebuilt(self):
+        pl = Place()
+        pl.description = "Cabin by the lake"
+        self.storage.save_data()
+        with open("custom_file.json", "r") as f:
+            data = json.load(f)
+        data["Place." + pl.id]["description"] = "Flat in town"
+        with open("custom_file.json", "w") as f:
+            json.dump(data, f)
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage.reload_data()
+        self.assertEqual([], list(self.storage.search_objects("Place",
+                                                              "lake")))
+        self.assertEqual(1, len(list(self.storage.search_objects("Place",
+                                                                 "town"))))
+
+    def test_journal_changes_update_saved_index(self):
+        storage = CustomFileStorage(journaled=True)
+        rv1 = Review()
+        rv1.text = "Quiet garden"
+        rv2 = Review()
+        rv2.text = "Quiet street"
+        storage.checkpoint()
+        rv1.text = "Busy road"
+        storage.delete_object(rv2)
+        rv3 = Review()
+        rv3.text = "Quiet pool"
+        storage.save_data()
+        CustomFileStorage._CustomFileStorage__objects = {}
+        storage.reload_data()
+        self.assertEqual(["Review." + rv3.id],
+                         ["Review." + obj.id for obj in
+                          storage.search_objects("Review", "quiet")])
+
+    def test_empty_index_is_not_saved(self):
+        Place()
+        self.storage.save_data()
+        self.storage.close()
+        self.assertFalse(os.path.isfile("custom_file.text_index"))
+
+    def test_index_is_saved_on_close(self):
+        rv = Review()
+        rv.text = "Quiet garden"
+        list(self.storage.search_objects("Review", "quiet"))
+        self.storage.save_data()
+        self.assertFalse(os.path.isfile("custom_file.text_index"))
+        self.storage.close()
+        with open("custom_file.text_index", "rb") as f:
+            saved = f.read()
+        self.storage.close()
+        with open("custom_file.text_index", "rb") as f:
+            self.assertEqual(saved, f.read())
+        rv.text = "Busy road"
+        self.storage.save_data()
+        self.storage.close()
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage.reload_data()
+        self.assertEqual([], list(self.storage.search_objects("Review",
+                                                              "quiet")))
+
+    def test_unsaved_changes_are_not_saved(self):
+        storage = CustomFileStorage(commit_window=60000)
+        rv = Review()
+        rv.text = "Quiet garden"
+        list(storage.search_objects("Review", "quiet"))
+        storage.flush()
+        rv.text = "Busy road"
+        storage.save_data()
+        with patch.object(storage, "flush"):
+            storage.close()
+        self.assertFalse(os.path.isfile("custom_file.text_index"))
+
+
+class TestFileStorage_destroy(unittest.TestCase):
+    """Unittests for testing the cascading destroy of CustomFileStorage."""
+
+    def setUp(self):
+        for name in ("custom_file.json", "custom_file.json.journal"):
+            try:
+                os.rename(name, name + ".tmp")
+            except IOError:
+                pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage = CustomFileStorage()
+        self.state = State()
+        self.user = User()
+        self.cities = []
+        self.places = []
+        self.reviews = []
+        for i in range(3):
+            ct = City()
+            ct.state_id = self.state.id
+            self.cities.append(ct)
+            pl = Place()
+            pl.city_id = ct.id
+            self.places.append(pl)
+            rv = Review()
+            rv.place_id = pl.id
+            rv.user_id = self.user.id
+            self.reviews.append(rv)
+        self.storage.save_data()
+
+    def tearDown(self):
+        for name in ("custom_file.json", "custom_file.json.journal"):
+            try:
+                os.remove(name)
+            except IOError:
+                pass
+            try:
+                os.rename(name + ".tmp", name)
+            except IOError:
+                pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+
+    def test_cascade(self):
+        other = City()
+        with patch.object(CustomFileStorage, "save_data") as save_data:
+            doomed = self.storage.destroy_object(self.state)
+        self.assertEqual(1, save_data.call_count)
+        self.assertEqual(10, len(doomed))
+        self.assertEqual(["City." + other.id, "User." + self.user.id],
+                         sorted(self.storage.get_all_objects()))
+
+    def test_cascade_is_saved(self):
+        self.storage.destroy_object(self.cities[0])
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage.reload_data()
+        objs = self.storage.get_all_objects()
+        self.assertNotIn("Review." + self.reviews[0].id, objs)
+        self.assertIn("Review." + self.reviews[1].id, objs)
+        self.assertEqual(2, self.storage.count_objects("Place"))
+
+    def test_restrict(self):
+        self.places[1].user_id = self.user.id
+        count = len(self.storage.get_all_objects())
+        with self.assertRaises(ValueError):
+            self.storage.destroy_object(self.user)
+        self.assertEqual(count, len(self.storage.get_all_objects()))
+        self.storage.destroy_object(self.places[1])
+        self.assertEqual([self.user], self.storage.destroy_object(
+            self.user)[:1])
+        self.assertEqual(0, self.storage.count_objects("Review"))
+
+    def test_unlisted_relations_are_kept(self):
+        self.places[0].user_id = self.user.id
+        self.storage.destroy_object(self.places[0])
+        self.assertIn("User." + self.user.id,
+                      self.storage.get_all_objects())
+
+
+class TestFileStorage_columns(unittest.TestCase):
+    """Unittests for testing the columnar copy of CustomFileStorage."""
+
+    def setUp(self):
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage = CustomFileStorage()
+        self.places = []
+        for i in range(4):
+            pl = Place()
+            pl.city_id = "c{}".format(i % 2)
+            pl.price_by_night = (i + 1) * 100
+            self.places.append(pl)
+
+    def tearDown(self):
+        CustomFileStorage._CustomFileStorage__objects = {}
+
+    def test_get_columns(self):
+        columns = self.storage.get_columns("Place")
+        self.assertEqual(4, len(columns))
+        self.assertEqual({"c0": 200, "c1": 300}, columns.group_by(
+            "city_id", "price_by_night", "mean"))
+        self.assertEqual(0, len(self.storage.get_columns("Review")))
+
+    def test_columns_are_refreshed(self):
+        columns = self.storage.get_columns("Place")
+        self.places[0].price_by_night = 500
+        self.storage.delete_object(self.places[1])
+        pl = Place()
+        pl.city_id = "c2"
+        self.assertIs(columns, self.storage.get_columns("Place"))
+        self.assertEqual({"c0": 800, "c1": 400, "c2": 0}, columns.group_by(
+            "city_id", "price_by_night", "sum"))
+
+    def test_columns_follow_reload(self):
+        columns = self.storage.get_columns("Place")
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.assertIsNot(columns, self.storage.get_columns("Place"))
+        self.assertEqual(0, len(self.storage.get_columns("Place")))
+
+    def test_export_columns(self):
+        self.places[3].price_by_night = "free"
+        try:
+            directory = self.storage.export_columns("Place")
+            self.assertEqual(os.path.join("custom_file.columns", "Place"),
+                             directory)
+            self.assertTrue(os.path.isfile(os.path.join(directory,
+                                                        "city_id.seg")))
+            self.assertFalse(os.path.isfile(os.path.join(directory,
+                                                         "amenity_ids.seg")))
+            with self.storage.open_column("Place", "price_by_night") as prices:
+                self.assertEqual([100, 200, 300, None], list(prices))
+            with self.storage.open_column("Place", "city_id") as cities:
+                self.assertEqual(["c0", "c1", "c0", "c1"], list(cities))
+            with self.storage.open_column("Place", "_keys") as keys:
+                self.assertEqual(["Place." + pl.id for pl in self.places],
+                                 list(keys))
+        finally:
+            shutil.rmtree("custom_file.columns", ignore_errors=True)
+
+
+class TestFileStorage_bulk(unittest.TestCase):
+    """Unittests for testing the bulk inserts of CustomFileStorage."""
+
+    def setUp(self):
+        for name in ("custom_file.json", "custom_file.json.journal"):
+            try:
+                os.rename(name, name + ".tmp")
+            except IOError:
+                pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage = CustomFileStorage()
+
+    def tearDown(self):
+        for name in ("custom_file.json", "custom_file.json.journal"):
+            try:
+                os.remove(name)
+            except IOError:
+                pass
+            try:
+                os.rename(name + ".tmp", name)
+            except IOError:
+                pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+
+    def test_bulk_create(self):
+        rows = [{"place_id": "p{}".format(i % 3), "text": "Nice stay"}
+                for i in range(30)]
+        with patch.object(CustomFileStorage, "save_data") as save_data:
+            reviews = self.storage.bulk_create(Review, rows)
+        self.assertEqual(1, save_data.call_count)
+        self.assertEqual(30, len(reviews))
+        self.assertEqual(30, len({rv.id for rv in reviews}))
+        self.assertEqual(4, uuid.UUID(reviews[0].id).version)
+        self.assertEqual(30, self.storage.count_objects("Review"))
+        found = self.storage.get_objects_by_attribute("Review", "place_id",
+                                                      "p1")
+        self.assertEqual(10, len(list(found)))
+        self.assertEqual(30, len(list(self.storage.search_objects("Review",
+                                                                  "nice"))))
+
+    def test_bulk_create_is_saved(self):
+        places = Place.bulk_create([{"name": "Loft", "price_by_night": "80"},
+                                    {"latitude": 1}])
+        self.assertEqual(80, places[0].price_by_night)
+        self.assertEqual(1.0, places[1].latitude)
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage.reload_data()
+        objs = self.storage.get_all_objects()
+        self.assertEqual("Loft", objs["Place." + places[0].id].name)
+        self.assertEqual(2, self.storage.count_objects("Place"))
+
+    def test_bulk_create_refuses_bad_rows(self):
+        with self.assertRaises(ValueError):
+            self.storage.bulk_create("Place", [{"name": "Loft"},
+                                               {"no_such_name": 1}])
+        with self.assertRaises(ValueError):
+            self.storage.bulk_create(Place, [{"max_guest": "many"}])
+        self.assertEqual(0, self.storage.count_objects("Place"))
+
+    def test_bulk_add_checks_unique_indexes(self):
+        User().email = "a@b.c"
+        with self.assertRaises(ValueError):
+            self.storage.bulk_create(User, [{"email": "a@b.c"}])
+        with self.assertRaises(ValueError):
+            self.storage.bulk_create(User, [{"email": "d@e.f"},
+                                            {"email": "d@e.f"}])
+        self.assertEqual(1, self.storage.count_objects("User"))
+        self.storage.bulk_create(User, [{"email": ""}, {"email": ""}])
+        self.assertEqual(3, self.storage.count_objects("User"))
+
+    def test_bulk_add_refuses_bad_objects(self):
+        pl = Place()
+        pl.max_guest = "many"
+        with self.assertRaises(ValueError):
+            self.storage.bulk_add([pl])
+        with self.assertRaises(ValueError):
+            self.storage.bulk_add([object()])
+
+
+class TestFileStorage_batch(unittest.TestCase):
+    """Unittests for testing the batches of CustomFileStorage."""
+
+    def setUp(self):
+        for name in ("custom_file.json", "custom_file.json.journal"):
+            try:
+                os.rename(name, name + ".tmp")
+            except IOError:
+                pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage = CustomFileStorage()
+        self.user = User()
+        self.user.email = "a@b.c"
+        self.place = Place()
+        self.place.user_id = self.user.id
+        self.place.amenity_ids = ["wifi"]
+        self.review = Review()
+        self.review.place_id = self.place.id
+        self.storage.save_data()
+
+    def tearDown(self):
+        for name in ("custom_file.json", "custom_file.json.journal"):
+            try:
+                os.remove(name)
+            except IOError:
+                pass
+            try:
+                os.rename(name + ".tmp", name)
+            except IOError:
+                pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+
+    def test_batch_writes_once(self):
+        with patch.object(CustomFileStorage,
+                          "_CustomFileStorage__commit") as commit:
+            with self.storage.batch():
+                self.place.name = "Loft"
+                self.place.save()
+                rv = Review()
+                rv.place_id = self.place.id
+                rv.save()
+                with self.storage.batch():
+                    self.storage.destroy_object(rv)
+                self.assertEqual(0, commit.call_count)
+        self.assertEqual(1, commit.call_count)
+
+    def test_batch_is_saved(self):
+        with self.storage.batch():
+            self.place.name = "Loft"
+            self.place.save()
+            with open("custom_file.json") as file:
+                self.assertNotIn("Loft", file.read())
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage.reload_data()
+        self.assertEqual("Loft", self.storage.get_all_objects()[
+            "Place." + self.place.id].name)
+
+    def test_rollback(self):
+        with open("custom_file.json") as file:
+            saved = file.read()
+        with self.assertRaises(RuntimeError):
+            with self.storage.batch():
+                self.place.name = "Loft"
+                self.place.amenity_ids.append("pool")
+                self.place.amenity_ids = self.place.amenity_ids
+                us = User()
+                us.email = "d@e.f"
+                self.storage.destroy_object(self.place)
+                raise RuntimeError
+        with open("custom_file.json") as file:
+            self.assertEqual(saved, file.read())
+        objs = self.storage.get_all_objects()
+        self.assertIs(self.place, objs["Place." + self.place.id])
+        self.assertIs(self.review, objs["Review." + self.review.id])
+        self.assertNotIn("User." + us.id, objs)
+        self.assertFalse(hasattr(self.place, "name") and
+                         self.place.name == "Loft")
+        self.assertEqual(["wifi"], self.place.amenity_ids)
+        self.assertEqual([self.place.id], [obj.id for obj in
+                                           self.storage.get_objects_by_members(
+                                               "Place", "amenity_ids",
+                                               all_of=["wifi"])])
+        self.assertEqual([], list(self.storage.get_objects_by_members(
+            "Place", "amenity_ids", all_of=["pool"])))
+        self.assertEqual([self.review], list(self.place.reviews))
+
+    def test_rollback_restores_unique_values(self):
+        with self.assertRaises(RuntimeError):
+            with self.storage.batch():
+                self.user.email = "d@e.f"
+                us = User()
+                us.email = "a@b.c"
+                raise RuntimeError
+        with self.assertRaises(ValueError):
+            User().email = "a@b.c"
+        User().email = "d@e.f"
+
+    def test_nested_rollback(self):
+        with self.storage.batch():
+            self.place.name = "Loft"
+            try:
+                with self.storage.batch():
+                    self.place.name = "Barn"
+                    self.place.number_rooms = 3
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            self.assertEqual("Loft", self.place.name)
+            self.assertEqual(0, self.place.number_rooms)
+            self.place.save()
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage.reload_data()
+        self.assertEqual("Loft", self.storage.get_all_objects()[
+            "Place." + self.place.id].name)
+
+
+class TestFileStorage_processes(unittest.TestCase):
+    """Unittests for testing CustomFileStorage shared by processes."""
+
+    def setUp(self):
+        for name in ("custom_file.json", "custom_file.json.journal"):
+            try:
+                os.rename(name, name + ".tmp")
+            except IOError:
+                pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage = CustomFileStorage()
+        self.place = Place()
+        self.user = User()
+        self.storage.save_data()
+
+    def tearDown(self):
+        for name in ("custom_file.json", "custom_file.json.journal"):
+            try:
+                os.remove(name)
+            except IOError:
+                pass
+            try:
+                os.rename(name + ".tmp", name)
+            except IOError:
+                pass
+        CustomFileStorage._CustomFileStorage__objects = {}
+
+    def other_process(self, code, journaled=False):
+        """Runs code in another process, storage holding the saved objects"""
+        env = dict(os.environ, CUSTOM_STORAGE_JOURNALED="1" if journaled
+                   else "0")
+        subprocess.run([sys.executable, "-c",
+                        "from models import storage\n"
+                        "storage.reload_data()\n"
+                        "objs = storage.get_all_objects()\n" + code],
+                       env=env, check=True)
+
+    def test_versions_are_saved(self):
+        self.place.name = "Loft"
+        self.storage.save_data()
+        with open("custom_file.json") as file:
+            records = json.load(file)
+        self.assertEqual(2, records["Place." + self.place.id]["__version__"])
+        self.assertEqual(1, records["User." + self.user.id]["__version__"])
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage.reload_data()
+        self.assertNotIn("__version__", self.storage.get_all_objects()[
+            "Place." + self.place.id].__dict__)
+
+    def test_merge(self):
+        self.other_process(
+            "objs['User.{}'].first_name = 'Betty'\n"
+            "storage.delete_object(objs['Place.{}'])\n"
+            "storage.save_data()\n".format(self.user.id, self.place.id))
+        rv = Review()
+        rv.user_id = self.user.id
+        self.storage.save_data()
+        self.assertEqual("Betty", self.user.first_name)
+        self.assertNotIn("Place." + self.place.id,
+                         self.storage.get_all_objects())
+        self.assertEqual([rv], list(self.user.reviews))
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage.reload_data()
+        objs = self.storage.get_all_objects()
+        self.assertEqual("Betty", objs["User." + self.user.id].first_name)
+        self.assertIn("Review." + rv.id, objs)
+        self.assertNotIn("Place." + self.place.id, objs)
+
+    def test_conflict(self):
+        self.other_process(
+            "objs['Place.{}'].name = 'Barn'\n"
+            "storage.save_data()\n".format(self.place.id))
+        self.place.name = "Loft"
+        with self.assertRaises(ValueError):
+            self.storage.save_data()
+        with open("custom_file.json") as file:
+            self.assertNotIn("Loft", file.read())
+        self.storage.save_data()
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage.reload_data()
+        self.assertEqual("Loft", self.storage.get_all_objects()[
+            "Place." + self.place.id].name)
+
+    def test_conflict_stays_pending(self):
+        storage = CustomFileStorage(flush_interval=10000)
+        self.other_process(
+            "objs['Place.{}'].name = 'Barn'\n"
+            "storage.save_data()\n".format(self.place.id))
+        self.place.name = "Loft"
+        storage.save_data()
+        with self.assertRaises(ValueError):
+            storage.flush()
+        storage.close()
+        CustomFileStorage._CustomFileStorage__objects = {}
+        storage.reload_data()
+        self.assertEqual("Loft", storage.get_all_objects()[
+            "Place." + self.place.id].name)
+
+    def test_journaled_merge(self):
+        storage = CustomFileStorage(journaled=True)
+        self.other_process(
+            "objs['User.{}'].first_name = 'Betty'\n"
+            "storage.save_data()\n".format(self.user.id), journaled=True)
+        self.place.name = "Loft"
+        storage.save_data()
+        self.assertEqual("Betty", self.user.first_name)
+        CustomFileStorage._CustomFileStorage__objects = {}
+        storage.reload_data()
+        objs = storage.get_all_objects()
+        self.assertEqual("Betty", objs["User." + self.user.id].first_name)
+        self.assertEqual("Loft", objs["Place." + self.place.id].name)
+
+    def test_uncontended_save_reads_nothing(self):
+        self.place.name = "Loft"
+        with patch.object(CustomFileStorage,
+                          "_CustomFileStorage__read_stored") as read:
+            self.storage.save_data()
+        self.assertEqual(0, read.call_count)
 
 
 if __name__ == "__main__":
     unittest.main()
-
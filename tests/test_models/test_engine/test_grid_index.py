@@ -0,0 +1,79 @@
+#!/usr/bin/python3
+"""Defines unittests for models/engine/grid_index.py.
+
+Unittest classes:
+    TestCustomGridIndex
+"""
+import random
+import unittest
+from models.engine.grid_index import CustomGridIndex
+
+
+class TestCustomGridIndex(unittest.TestCase):
+    """Unittests for testing the CustomGridIndex index."""
+
+    def setUp(self):
+        self.index = CustomGridIndex()
+        self.points = {"P.nyc": (40.7128, -74.0060),
+                       "P.jc": (40.7178, -74.0431),
+                       "P.bos": (42.3601, -71.0589),
+                       "P.fiji": (-17.7134, 178.0650),
+                       "P.samoa": (-13.7590, -172.1046)}
+        self.index.update(self.points.items())
+        self.index.add("P.none", (None, None))
+
+    def test_distance(self):
+        self.assertAlmostEqual(306, CustomGridIndex.distance(
+            *self.points["P.nyc"], *self.points["P.bos"]), delta=2)
+
+    def test_within_radius(self):
+        self.assertEqual(["P.nyc", "P.jc"],
+                         self.index.within_radius(40.7127, -74.0059, 5))
+        self.assertEqual([], self.index.within_radius(0, 0, 100))
+
+    def test_within_radius_across_antimeridian(self):
+        self.assertEqual(["P.fiji", "P.samoa"],
+                         self.index.within_radius(-17, 179.9, 1000))
+
+    def test_within_box(self):
+        self.assertEqual(["P.jc", "P.nyc"], sorted(
+            self.index.within_box(40, -75, 41, -73)))
+        self.assertEqual(["P.fiji", "P.samoa"], sorted(
+            self.index.within_box(-20, 170, -10, -170)))
+
+    def test_nearest(self):
+        self.assertEqual(["P.nyc", "P.jc", "P.bos"],
+                         self.index.nearest(40.7128, -74.0060, 3))
+        self.assertEqual(["P.fiji", "P.samoa"],
+                         self.index.nearest(-14, 180, 2))
+        self.assertEqual(5, len(self.index.nearest(0, 0, 10)))
+
+    def test_nearest_matches_distances(self):
+        random.seed(0)
+        index = CustomGridIndex(cell_size=1)
+        points = {"P.{}".format(i): (random.uniform(-90, 90),
+                                     random.uniform(-180, 180))
+                  for i in range(300)}
+        index.update(points.items())
+        for _ in range(20):
+            lat, lon = random.uniform(-90, 90), random.uniform(-180, 180)
+            expected = sorted(points, key=lambda key: CustomGridIndex.
+                              distance(lat, lon, *points[key]))[:5]
+            self.assertEqual(expected, index.nearest(lat, lon, 5))
+
+    def test_move_and_discard(self):
+        self.index.add("P.jc", (0.0, 0.0))
+        self.index.discard("P.bos")
+        self.assertEqual(["P.nyc"],
+                         self.index.within_radius(40.7128, -74.0060, 500))
+        self.assertEqual(4, len(self.index))
+
+    def test_accepts(self):
+        self.assertTrue(self.index.accepts((1, 2.5)))
+        self.assertFalse(self.index.accepts((91, 0)))
+        self.assertFalse(self.index.accepts(("1", "2")))
+        self.assertFalse(self.index.accepts([1, 2]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+#!/usr/bin/python3
+"""Defines unittests for models/engine/hash_index.py.
+
+Unittest classes:
+    TestCustomHashIndex
+"""
+import unittest
+from models.engine.hash_index import CustomHashIndex
+
+
+class TestCustomHashIndex(unittest.TestCase):
+    """Unittests for testing the CustomHashIndex index."""
+
+    def test_lookup(self):
+        index = CustomHashIndex()
+        index.add("City.1", "s1")
+        index.add("City.2", "s2")
+        index.add("City.3", "s1")
+        self.assertEqual(["City.1", "City.3"], index.lookup("s1"))
+        self.assertEqual([], index.lookup("s3"))
+        self.assertEqual(3, len(index))
+
+    def test_add_replaces_value(self):
+        index = CustomHashIndex()
+        index.add("City.1", "s1")
+        index.add("City.1", "s2")
+        self.assertEqual([], index.lookup("s1"))
+        self.assertEqual(["City.1"], index.lookup("s2"))
+
+    def test_discard(self):
+        index = CustomHashIndex()
+        index.add("City.1", "s1")
+        index.discard("City.1")
+        index.discard("City.2")
+        self.assertEqual([], index.lookup("s1"))
+        self.assertEqual(0, len(index))
+
+    def test_unhashable_values(self):
+        index = CustomHashIndex()
+        index.add("Place.1", ["a"])
+        self.assertEqual([], index.lookup(["a"]))
+        self.assertEqual(0, len(index))
+
+    def test_unique_check(self):
+        index = CustomHashIndex(unique=True)
+        index.add("User.1", "a@b.c")
+        index.check("User.1", "a@b.c")
+        with self.assertRaises(ValueError):
+            index.check("User.2", "a@b.c")
+
+    def test_unique_ignores_empty_values(self):
+        index = CustomHashIndex(unique=True)
+        index.add("User.1", "")
+        index.check("User.2", "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+#!/usr/bin/python3
+"""Defines unittests for models/engine/json_serializer.py.
+
+Unittest classes:
+    TestCustomJSONSerializer
+"""
+import io
+import json
+import unittest
+from models.engine.json_serializer import CustomJSONSerializer
+
+
+class TestCustomJSONSerializer(unittest.TestCase):
+    """Unittests for testing the CustomJSONSerializer format."""
+
+    def setUp(self):
+        self.serializer = CustomJSONSerializer()
+        self.records = {"User.1": {"__class__": "User", "id": "1"},
+                        "Place.2": {"__class__": "Place", "id": "2",
+                                    "name": "Loft é"}}
+
+    def dump(self):
+        return self.serializer.dump([self.serializer.encode(key, record)
+                                     for key, record in self.records.items()])
+
+    def test_dump_is_json(self):
+        self.assertEqual(self.records, json.loads(self.dump()))
+
+    def test_read(self):
+        pairs = list(self.serializer.read(io.BytesIO(self.dump())))
+        self.assertEqual(list(self.records.items()), pairs)
+
+    def test_read_empty(self):
+        self.assertEqual([], list(self.serializer.read(io.BytesIO(b"{}"))))
+
+    def test_read_dumped_empty(self):
+        data = self.serializer.dump([])
+        self.assertEqual({}, json.loads(data))
+        self.assertEqual([], self.serializer.scan(io.BytesIO(data)))
+
+    def test_read_fragments(self):
+        fragments = {}
+        pairs = list(self.serializer.read(io.BytesIO(self.dump()),
+                                          fragments=fragments))
+        self.assertEqual(list(self.records.items()), pairs)
+        self.assertEqual({key: self.serializer.encode(key, record)
+                          for key, record in self.records.items()},
+                         fragments)
+
+    def test_scan(self):
+        self.records["User.1"]["__version__"] = 12
+        self.records["Place.2"]["meta"] = {"__version__": 1}
+        members = self.serializer.scan(io.BytesIO(self.dump()))
+        self.assertEqual([("User.1", 12), ("Place.2", 0)],
+                         [(key, version) for key, version, _ in members])
+        del self.records["User.1"]["__version__"]
+        self.assertEqual(list(self.records.values()),
+                         [self.serializer.decode(fragment)
+                          for _, _, fragment in members])
+
+    def test_read_other_layouts(self):
+        for text in (json.dumps(self.records), json.dumps(self.records,
+                                                          indent=0)):
+            fragments = {}
+            data = io.BytesIO(text.encode("utf-8"))
+            pairs = list(self.serializer.read(data, fragments=fragments))
+            self.assertEqual(list(self.records.items()), pairs)
+            self.assertEqual({}, fragments)
+            self.assertIsNone(self.serializer.scan(io.BytesIO(
+                text.encode("utf-8"))))
+
+
+if __name__ == "__main__":
+    unittest.main()
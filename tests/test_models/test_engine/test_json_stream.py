@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+"""Defines unittests for models/engine/json_stream.py.
+
+Unittest classes:
+    TestCustomJSONObjectReader
+"""
+import io
+import json
+import unittest
+from models.engine.json_stream import CustomJSONObjectReader
+
+
+class TestCustomJSONObjectReader(unittest.TestCase):
+    """Unittests for testing the CustomJSONObjectReader class."""
+
+    def read(self, text, chunk_size=4):
+        return list(CustomJSONObjectReader(io.StringIO(text), chunk_size))
+
+    def test_empty_object(self):
+        self.assertEqual([], self.read(" { } "))
+
+    def test_members_in_order(self):
+        data = {"Place.1": {"name": "Loft", "amenity_ids": ["a", "b"]},
+                "User.2": {"email": "a@b.c"},
+                "n": 12345,
+                "s": "x, y: }"}
+        self.assertEqual(list(data.items()), self.read(json.dumps(data)))
+
+    def test_values_larger_than_chunks(self):
+        data = {"Review.{}".format(i): {"text": "word " * 100}
+                for i in range(20)}
+        self.assertEqual(list(data.items()),
+                         self.read(json.dumps(data, indent=2), 7))
+
+    def test_number_cut_by_chunk_boundary(self):
+        self.assertEqual([("a", 1234567)], self.read('{"a": 1234567}', 8))
+
+    def test_truncated_document(self):
+        with self.assertRaises(ValueError):
+            self.read('{"a": {"b": 1}, "c": {"d"')
+
+    def test_not_an_object(self):
+        with self.assertRaises(ValueError):
+            self.read('["a", "b"]')
+
+    def test_missing_delimiter(self):
+        with self.assertRaises(ValueError):
+            self.read('{"a": 1 "b": 2}')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+"""Defines unittests for models/engine/lazy_objects.py.
+
+Unittest classes:
+    TestCustomLazyObjects
+"""
+import unittest
+from models.engine.lazy_objects import CustomLazyObjects
+
+
+class TestCustomLazyObjects(unittest.TestCase):
+    """Unittests for testing the CustomLazyObjects dictionary."""
+
+    def setUp(self):
+        self.built = []
+
+        def loader(key, record):
+            self.built.append(key)
+            return ("built", record["n"])
+
+        self.objs = CustomLazyObjects({"A.1": {"n": 1}, "A.2": {"n": 2}},
+                                      loader)
+
+    def test_is_dict(self):
+        self.assertIsInstance(self.objs, dict)
+
+    def test_membership_and_len_build_nothing(self):
+        self.assertIn("A.1", self.objs)
+        self.assertEqual(2, len(self.objs))
+        self.assertEqual(["A.1", "A.2"], list(self.objs))
+        self.assertEqual([], self.built)
+
+    def test_getitem_builds_once(self):
+        self.assertEqual(("built", 1), self.objs["A.1"])
+        self.assertEqual(("built", 1), self.objs["A.1"])
+        self.assertEqual(["A.1"], self.built)
+
+    def test_get_missing_key(self):
+        self.assertIsNone(self.objs.get("A.3"))
+        with self.assertRaises(KeyError):
+            self.objs["A.3"]
+
+    def test_values_builds_all(self):
+        self.assertEqual([("built", 1), ("built", 2)], self.objs.values())
+        self.assertEqual(["A.1", "A.2"], self.built)
+
+    def test_encoded_records(self):
+        objs = CustomLazyObjects({"A.1": b"1"}, lambda key, record:
+                                 ("built", record["n"]),
+                                 lambda data: {"n": int(data)})
+        self.assertEqual({"n": 1}, objs.get_record("A.1"))
+        self.assertEqual(("built", 1), objs["A.1"])
+        self.assertIsNone(objs.get_record("A.1"))
+
+    def test_pop_returns_instance(self):
+        self.assertEqual(("built", 2), self.objs.pop("A.2"))
+        self.assertNotIn("A.2", self.objs)
+        self.assertIsNone(self.objs.pop("A.2", None))
+
+    def test_get_record(self):
+        self.assertEqual({"n": 1}, self.objs.get_record("A.1"))
+        self.objs["A.1"]
+        self.assertIsNone(self.objs.get_record("A.1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+#!/usr/bin/python3
+"""Defines unittests for models/engine/query.py.
+
+Unittest classes:
+    TestCustomQuery
+"""
+import types
+import unittest
+from unittest.mock import patch
+from models.engine.file_storage import CustomFileStorage
+from models.engine.query import CustomQuery
+from models.city import City
+from models.place import Place
+from models.review import Review
+from models.state import State
+from models.user import User
+
+
+class TestCustomQuery(unittest.TestCase):
+    """Unittests for testing CustomQuery filtering and planning."""
+
+    def setUp(self):
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage = CustomFileStorage()
+        self.places = []
+        for i in range(6):
+            pl = Place()
+            pl.city_id = "c{}".format(i % 2)
+            pl.price_by_night = i * 50
+            self.places.append(pl)
+
+    def tearDown(self):
+        CustomFileStorage._CustomFileStorage__objects = {}
+
+    def ids(self, query):
+        return sorted(obj.id for obj in query)
+
+    def test_query_returns_generator(self):
+        query = self.storage.query(Place)
+        self.assertIsInstance(query, CustomQuery)
+        self.assertIsInstance(iter(query), types.GeneratorType)
+
+    def test_no_condition(self):
+        self.assertEqual(6, self.storage.query(Place).count())
+        self.assertEqual(0, self.storage.query("Review").count())
+
+    def test_equality_uses_index(self):
+        query = self.storage.query(Place).where(city_id="c1")
+        self.assertEqual(("index", "city_id", "eq"), query.explain())
+        self.assertEqual(self.ids(self.places[1::2]), self.ids(query))
+
+    def test_in_uses_index(self):
+        query = self.storage.query(Place).where(city_id__in=["c0", "c9"])
+        self.assertEqual(("index", "city_id", "in"), query.explain())
+        self.assertEqual(self.ids(self.places[0::2]), self.ids(query))
+
+    def test_range_uses_index(self):
+        query = self.storage.query(Place).where(price_by_night__lt=120)
+        self.assertEqual(("index", "price_by_night", "lt"), query.explain())
+        self.assertEqual(self.ids(self.places[:3]), self.ids(query))
+
+    def test_range_without_index(self):
+        self.places[0].name = "b"
+        self.places[1].name = "a"
+        query = self.storage.query(Place).where(name__gt="a")
+        self.assertEqual(("scan", None, None), query.explain())
+        self.assertEqual([self.places[0].id], self.ids(query))
+
+    def test_range_on_value_not_indexed(self):
+        self.places[0].price_by_night = "free"
+        query = self.storage.query(Place).where(price_by_night="free")
+        self.assertEqual(("scan", None, None), query.explain())
+        self.assertEqual([self.places[0].id], self.ids(query))
+
+    def test_order_by_uses_index(self):
+        query = self.storage.query(Place).order_by(
+            "price_by_night", reverse=True).limit(2)
+        self.assertEqual(("index", "price_by_night", "order"),
+                         query.explain())
+        self.assertEqual([self.places[5], self.places[4]], list(query))
+
+    def test_order_by_after_filter(self):
+        query = self.storage.query(Place).where(city_id="c1").order_by(
+            "price_by_night").limit(2)
+        self.assertEqual(("index", "city_id", "eq"), query.explain())
+        self.assertEqual([self.places[1], self.places[3]], list(query))
+
+    def test_order_by_without_index(self):
+        for i, pl in enumerate(self.places):
+            pl.name = "n{}".format(5 - i)
+        query = self.storage.query(Place).order_by("name")
+        self.assertEqual(self.places[::-1], list(query))
+
+    def test_conjunction(self):
+        query = self.storage.query(Place).where(city_id="c0").where(
+            price_by_night__ge=100, price_by_night__le=200)
+        self.assertEqual(self.ids(self.places[2:5:2]), self.ids(query))
+
+    def test_where_keeps_original(self):
+        query = self.storage.query(Place)
+        query.where(city_id="c0")
+        self.assertEqual(6, query.count())
+
+    def test_missing_and_mismatched_attributes(self):
+        self.places[0].price_by_night = "free"
+        query = self.storage.query(Place).where(price_by_night__lt=120,
+                                                no_such_name__gt=0)
+        self.assertEqual(0, query.count())
+
+    def test_smallest_index_is_chosen(self):
+        st = State()
+        for i in range(3):
+            ct = City()
+            ct.state_id = st.id
+            ct.name = "Austin" if i else "Dallas"
+        query = self.storage.query(City).where(name="Dallas",
+                                               state_id=st.id)
+        self.assertEqual(("index", "state_id", "eq"), query.explain())
+        self.assertEqual("Dallas", query.first().name)
+
+    def test_sees_changes(self):
+        query = self.storage.query(Place).where(city_id="c5")
+        self.assertIsNone(query.first())
+        self.places[0].city_id = "c5"
+        self.assertEqual(self.places[0], query.first())
+
+    def test_include_prefetches_relations(self):
+        us = User()
+        reviews = []
+        for pl in self.places:
+            pl.user_id = us.id
+            rv = Review()
+            rv.place_id = pl.id
+            rv.user_id = us.id
+            reviews.append(rv)
+        query = self.storage.query(Place).where(city_id="c0")
+        places = list(query.include("reviews.user", "user").limit(2))
+        self.assertEqual(self.places[0:3:2], places)
+        with patch.object(CustomFileStorage, "find_keys") as find_keys, \
+                patch.object(CustomFileStorage,
+                             "get_objects_by_attribute") as by_attribute:
+            self.assertEqual([reviews[0]], list(places[0].reviews))
+            self.assertEqual(1, len(places[1].reviews))
+            self.assertIs(us, places[1].user)
+            self.assertIs(us, reviews[2].user)
+            self.assertEqual(0, find_keys.call_count +
+                             by_attribute.call_count)
+
+    def test_include_follows_changes(self):
+        places = list(self.storage.query(Place).include("reviews"))
+        self.assertEqual(0, len(places[0].reviews))
+        rv = Review()
+        rv.place_id = places[0].id
+        self.assertEqual([rv], list(places[0].reviews))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+#!/usr/bin/python3
+"""Defines unittests for models/engine/related_cache.py.
+
+Unittest classes:
+    TestCustomRelatedCache
+"""
+import unittest
+from models.engine.file_storage import CustomFileStorage
+from models.engine.related_cache import CustomRelatedCache
+from models.engine.relation import CustomRelation
+from models.city import City
+from models.place import Place
+from models.state import State
+
+
+class TestCustomRelatedCache(unittest.TestCase):
+    """Unittests for testing the CustomRelatedCache cache."""
+
+    def setUp(self):
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage = CustomFileStorage()
+        self.cache = CustomRelatedCache()
+        self.states = [State(), State()]
+        self.cities = []
+        for i in range(4):
+            ct = City()
+            ct.state_id = self.states[i % 2].id
+            self.cities.append(ct)
+        self.place = Place()
+        self.place.city_id = self.cities[0].id
+
+    def tearDown(self):
+        CustomFileStorage._CustomFileStorage__objects = {}
+
+    def test_get_default(self):
+        self.assertIsNone(self.cache.get(self.states[0], "cities"))
+        self.assertEqual(0, self.cache.get(self.states[0], "cities", 0))
+
+    def test_prefetch(self):
+        self.cache.prefetch(self.storage, self.states, ["cities"])
+        cities = self.cache.get(self.states[1], "cities")
+        self.assertIsInstance(cities, CustomRelation)
+        self.assertEqual(self.cities[1::2], list(cities))
+        self.assertEqual(2, len(self.cache))
+
+    def test_prefetch_path(self):
+        self.cache.prefetch(self.storage, self.states, ["cities.places"])
+        places = self.cache.get(self.cities[0], "places")
+        self.assertEqual([self.place], list(places))
+        self.assertEqual([], list(self.cache.get(self.cities[3], "places")))
+
+    def test_prefetch_one(self):
+        self.cache.prefetch(self.storage, [self.place], ["city.state"])
+        self.assertIs(self.cities[0], self.cache.get(self.place, "city"))
+        self.assertIs(self.states[0], self.cache.get(self.cities[0],
+                                                     "state"))
+
+    def test_invalidate(self):
+        self.cache.prefetch(self.storage, self.states, ["cities"])
+        self.cache.invalidate()
+        self.assertIsNone(self.cache.get(self.states[0], "cities"))
+        self.assertEqual(0, len(self.cache))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+#!/usr/bin/python3
+"""Defines unittests for models/engine/relation.py.
+
+Unittest classes:
+    TestCustomRelation
+"""
+import unittest
+from unittest.mock import patch
+from models.engine.file_storage import CustomFileStorage
+from models.engine.relation import CustomRelation
+from models.city import City
+from models.place import Place
+from models.review import Review
+from models.state import State
+from models.user import User
+
+
+class TestCustomRelation(unittest.TestCase):
+    """Unittests for testing the relations between stored objects."""
+
+    def setUp(self):
+        CustomFileStorage._CustomFileStorage__objects = {}
+        self.storage = CustomFileStorage()
+        self.state = State()
+        self.city = City()
+        self.city.state_id = self.state.id
+        self.user = User()
+        self.places = []
+        for i in range(3):
+            pl = Place()
+            pl.city_id = self.city.id
+            pl.user_id = self.user.id if i else ""
+            self.places.append(pl)
+        self.review = Review()
+        self.review.place_id = self.places[0].id
+        self.review.user_id = self.user.id
+
+    def tearDown(self):
+        CustomFileStorage._CustomFileStorage__objects = {}
+
+    def test_many(self):
+        self.assertIsInstance(self.state.cities, CustomRelation)
+        self.assertEqual([self.city], list(self.state.cities))
+        self.assertEqual(self.places, list(self.city.places))
+        self.assertEqual([self.review], list(self.places[0].reviews))
+        self.assertEqual(self.places[1:], list(self.user.places))
+        self.assertEqual([self.review], list(self.user.reviews))
+
+    def test_one(self):
+        self.assertIs(self.state, self.city.state)
+        self.assertIs(self.city, self.places[0].city)
+        self.assertIsNone(self.places[0].user)
+        self.assertIs(self.user, self.places[1].user)
+        self.assertIs(self.places[0], self.review.place)
+        self.assertIs(self.user, self.review.user)
+
+    def test_len_and_contains(self):
+        self.assertEqual(3, len(self.city.places))
+        self.assertIn(self.places[2], self.city.places)
+        self.assertNotIn(self.places[0], self.user.places)
+        self.assertNotIn(self.city, self.city.places)
+        self.assertEqual(0, len(City().places))
+
+    def test_view_is_lazy(self):
+        with patch.object(self.storage, "find_keys") as find_keys:
+            self.storage.get_related(self.city, "places")
+            self.assertEqual(0, find_keys.call_count)
+
+    def test_view_follows_changes(self):
+        places = self.city.places
+        self.places[0].city_id = "elsewhere"
+        self.storage.delete_object(self.places[1])
+        pl = Place()
+        pl.city_id = self.city.id
+        self.assertEqual([self.places[2], pl], list(places))
+
+    def test_view_uses_index(self):
+        self.assertEqual(["Place." + pl.id for pl in self.places],
+                         self.city.places.keys())
+        query = self.city.places.query().where(user_id=self.user.id)
+        self.assertEqual(("index", "user_id", "eq"), query.explain())
+        self.assertEqual(self.places[1:], list(query))
+
+    def test_cascade(self):
+        doomed = CustomRelation.cascade(self.storage, self.state)
+        self.assertEqual([self.state, self.city] + self.places +
+                         [self.review], doomed)
+        self.assertEqual([self.review],
+                         CustomRelation.cascade(self.storage, self.review))
+
+    def test_cascade_restrict(self):
+        with self.assertRaises(ValueError):
+            CustomRelation.cascade(self.storage, self.user)
+        for pl in self.places:
+            pl.user_id = ""
+        self.assertEqual([self.user, self.review],
+                         CustomRelation.cascade(self.storage, self.user))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+#!/usr/bin/python3
+"""Defines unittests for models/engine/sorted_index.py.
+
+Unittest classes:
+    TestCustomSortedIndex
+"""
+import unittest
+from models.engine.sorted_index import CustomSortedIndex
+
+
+class TestCustomSortedIndex(unittest.TestCase):
+    """Unittests for testing the CustomSortedIndex index."""
+
+    def setUp(self):
+        self.index = CustomSortedIndex()
+        self.index.update([("P.a", 100), ("P.b", 50), ("P.c", 150),
+                           ("P.d", 100), ("P.e", "free"), ("P.f", None)])
+
+    def test_range(self):
+        self.assertEqual(["P.b", "P.a", "P.d"],
+                         list(self.index.range(high=100)))
+        self.assertEqual(["P.b"],
+                         list(self.index.range(high=100, include_high=False)))
+        self.assertEqual(["P.c"],
+                         list(self.index.range(low=100, include_low=False)))
+        self.assertEqual(["P.a", "P.d"], list(self.index.range(60, 120)))
+
+    def test_reverse_range(self):
+        self.assertEqual(["P.c", "P.d", "P.a", "P.b"],
+                         list(self.index.range(reverse=True)))
+
+    def test_lookup(self):
+        self.assertEqual(["P.a", "P.d"], self.index.lookup(100))
+        self.assertEqual([], self.index.lookup(75))
+
+    def test_first(self):
+        self.assertEqual(["P.b", "P.a"], self.index.first(2))
+        self.assertEqual(["P.c"], self.index.first(1, reverse=True))
+
+    def test_add_and_discard(self):
+        self.index.add("P.a", 10)
+        self.index.discard("P.c")
+        self.index.discard("P.z")
+        self.assertEqual(["P.a", "P.b", "P.d"], list(self.index.range()))
+        self.assertEqual(3, len(self.index))
+
+    def test_accepts(self):
+        self.assertTrue(self.index.accepts(1.5))
+        self.assertFalse(self.index.accepts("1"))
+        self.assertFalse(self.index.accepts(float("nan")))
+
+
+if __name__ == "__main__":
+    unittest.main()
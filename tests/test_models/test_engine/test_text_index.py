@@ -0,0 +1,63 @@
+#!/usr/bin/python3
+"""Defines unittests for models/engine/text_index.py.
+
+Unittest classes:
+    TestCustomTextIndex
+"""
+import unittest
+from models.engine.text_index import CustomTextIndex
+
+
+class TestCustomTextIndex(unittest.TestCase):
+    """Unittests for testing the CustomTextIndex index."""
+
+    def setUp(self):
+        self.index = CustomTextIndex()
+        self.index.update([("R.a", "Quiet loft near the river"),
+                           ("R.b", "Noisy street, but a great loft"),
+                           ("R.c", "River view, river breeze, river walks"),
+                           ("R.d", ""), ("R.e", None)])
+
+    def test_tokenize(self):
+        self.assertEqual(["great", "loft", "s", "view"],
+                         CustomTextIndex.tokenize("Great LOFT's view!"))
+
+    def test_len(self):
+        self.assertEqual(3, len(self.index))
+
+    def test_search_ranks_by_frequency(self):
+        self.assertEqual(["R.c", "R.a"], self.index.search("river"))
+
+    def test_search_any_word(self):
+        self.assertEqual({"R.a", "R.b", "R.c"},
+                         set(self.index.search("loft RIVER")))
+        self.assertEqual([], self.index.search("pool"))
+
+    def test_search_limit(self):
+        self.assertEqual(["R.c"], self.index.search("river", limit=1))
+
+    def test_rare_words_weigh_more(self):
+        scores = self.index.scores("noisy loft")
+        self.assertGreater(scores["R.b"], scores["R.a"])
+
+    def test_add_replaces_text(self):
+        self.index.add("R.a", "Sunny terrace")
+        self.assertEqual(["R.c"], self.index.search("river"))
+        self.assertEqual(["R.a"], self.index.search("terrace"))
+
+    def test_discard(self):
+        self.index.discard("R.c")
+        self.index.discard("R.z")
+        self.assertEqual(["R.a"], self.index.search("river"))
+        self.assertEqual(2, len(self.index))
+
+    def test_dump_and_load(self):
+        index = CustomTextIndex.load(self.index.dump())
+        self.assertEqual(self.index.scores("river loft"),
+                         index.scores("river loft"))
+        index.add("R.c", "Garden")
+        self.assertEqual(["R.a"], index.search("river"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+"""Defines unittests for models/engine/write_behind.py.
+
+Unittest classes:
+    TestCustomWriteBehind
+"""
+import threading
+import unittest
+from time import sleep
+from unittest.mock import patch
+from models.engine.write_behind import CustomWriteBehind
+
+
+class TestCustomWriteBehind(unittest.TestCase):
+    """Unittests for testing the CustomWriteBehind flusher."""
+
+    def setUp(self):
+        self.flushed = threading.Event()
+
+    def test_flush_on_interval(self):
+        flusher = CustomWriteBehind(self.flushed.set, 0.05, 0)
+        flusher.request(1)
+        self.assertTrue(self.flushed.wait(2))
+        flusher.stop()
+
+    def test_flush_on_threshold(self):
+        flusher = CustomWriteBehind(self.flushed.set, 0, 3)
+        flusher.request(2)
+        self.assertFalse(self.flushed.wait(0.1))
+        flusher.request(3)
+        self.assertTrue(self.flushed.wait(2))
+        flusher.stop()
+
+    def test_failed_flush_keeps_thread(self):
+        calls = []
+
+        def flush():
+            calls.append(1)
+            if len(calls) == 1:
+                raise OSError("disk full")
+            self.flushed.set()
+
+        flusher = CustomWriteBehind(flush, 0, 1)
+        with patch("traceback.print_exc") as report:
+            flusher.request(1)
+            sleep(0.1)
+            self.assertEqual(1, report.call_count)
+            flusher.request(1)
+            self.assertTrue(self.flushed.wait(2))
+        flusher.stop()
+
+    def test_no_flush_without_changes(self):
+        flusher = CustomWriteBehind(self.flushed.set, 0.02, 0)
+        self.assertFalse(self.flushed.wait(0.1))
+        flusher.stop()
+
+    def test_stop_without_flush(self):
+        flusher = CustomWriteBehind(self.flushed.set, 10, 0)
+        flusher.request(1)
+        flusher.stop()
+        self.assertFalse(self.flushed.is_set())
+
+
+if __name__ == "__main__":
+    unittest.main()